@@ -20,6 +20,10 @@ Run this script to start the FastAPI server:
     
 Or with custom settings:
     uv run python api/app.py --host 0.0.0.0 --port 8080 --reload
+
+To run async tasks in separate worker processes instead of the API process:
+    uv run python api/app.py --task-execution worker
+    uv run python -m api.worker   # One or more per host, sized to the available cores
 """
 
 import sys
@@ -165,9 +169,19 @@ if __name__ == "__main__":
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload")
+    parser.add_argument(
+        "--task-execution", choices=["inline", "worker"], default=None,
+        help="Run async tasks in the API process (inline) or in worker processes (python -m api.worker)"
+    )
     
     args = parser.parse_args()
     
+    if args.task_execution:
+        # Via environment so the setting also reaches reload subprocesses
+        import os
+        os.environ["PIXELLE_VIDEO_TASK_EXECUTION"] = args.task_execution
+        api_config.task_execution = args.task_execution
+    
     # Print startup banner
     print(f"""
 ╔══════════════════════════════════════════════════════════════╗
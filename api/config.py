@@ -14,6 +14,7 @@
 API Configuration
 """
 
+import os
 from typing import Optional
 from pydantic import BaseModel
 
@@ -31,9 +32,23 @@ class APIConfig(BaseModel):
     cors_origins: list[str] = ["*"]
     
     # Task settings
-    max_concurrent_tasks: int = 5
+    max_concurrent_tasks: int = 5      # Video generations run at once per process (async tasks and sync requests)
+    max_pending_tasks: int = 20        # Tasks allowed to wait for a slot; beyond that requests get HTTP 429
+    task_retry_after: int = 30         # Retry-After seconds sent with HTTP 429
     task_cleanup_interval: int = 3600  # Clean completed tasks every hour
     task_retention_time: int = 86400   # Keep task results for 24 hours
+    task_store: str = "sqlite"         # "sqlite" (durable, survives restarts) or "memory"
+    task_store_path: Optional[str] = None  # SQLite path (default: data/tasks/tasks.db)
+    task_cache_size: int = 200         # Max tasks kept in memory (active tasks are always kept)
+    task_recovery: str = "requeue"     # Tasks interrupted by a restart: "requeue" or "fail"
+    task_max_attempts: int = 2         # Interrupted tasks are failed after this many starts
+    
+    # Task execution: "inline" runs tasks in the API process; "worker" only enqueues them
+    # (requires the sqlite task store) and separate processes run them: python -m api.worker
+    task_execution: str = os.environ.get("PIXELLE_VIDEO_TASK_EXECUTION", "inline")
+    worker_concurrency: int = 1        # Tasks run at once by each worker process
+    worker_poll_interval: float = 1.0  # Seconds between queue polls (also used by API long-polls)
+    worker_lease_timeout: int = 120    # Running tasks without a worker heartbeat for this long are re-enqueued
     
     # File upload settings
     max_upload_size: int = 100 * 1024 * 1024  # 100MB
@@ -20,6 +20,7 @@ from loguru import logger
 from api.dependencies import PixelleVideoDep
 from api.schemas.frame import FrameRenderRequest, FrameRenderResponse, TemplateParamsResponse
 from pixelle_video.services.frame_html import HTMLFrameGenerator
+from pixelle_video.services.template_registry import template_registry
 from pixelle_video.utils.template_util import parse_template_size, resolve_template_path
 
 router = APIRouter(prefix="/frame", tags=["Frame Rendering"])
@@ -141,10 +142,10 @@ async def get_template_params(
         # Resolve template path
         template_path = resolve_template_path(template)
         
-        # Create generator and parse parameters
-        generator = HTMLFrameGenerator(template_path)
-        params = generator.parse_template_parameters()
-        media_width, media_height = generator.get_media_size()
+        # Parameters and media size come from the compiled template (parsed once)
+        template_obj = template_registry.get(template_path)
+        params = template_obj.get_parameters()
+        media_width, media_height = template_obj.get_media_size()
         
         return TemplateParamsResponse(
             template=template,
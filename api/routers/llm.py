@@ -58,3 +58,16 @@ async def llm_chat(
         logger.error(f"LLM chat error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.get("/cache/stats")
+async def llm_cache_stats(pixelle_video: PixelleVideoDep):
+    """
+    LLM response cache statistics
+    
+    Returns hit/miss counters, hit rate, entry count and disk usage of the
+    LLM response cache, or `enabled: false` when the cache is turned off.
+    """
+    stats = pixelle_video.llm.cache_stats()
+    if stats is None:
+        return {"enabled": False}
+    return {"enabled": True, **stats}
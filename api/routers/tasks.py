@@ -14,16 +14,25 @@
 Task management endpoints
 
 Endpoints for managing async tasks (checking status, canceling, etc.)
+
+Progress can be followed without tight polling, either by long-polling
+GET /tasks/{task_id}?wait_for_change=N or through the Server-Sent Events
+stream GET /tasks/{task_id}/events.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
 from api.tasks import task_manager, Task, TaskStatus
+from api.tasks.store import INCOMPLETE_STATUSES
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+# Seconds between keep-alive comments on idle event streams
+EVENT_STREAM_KEEPALIVE = 15
+
 
 @router.get("", response_model=List[Task])
 async def list_tasks(
@@ -50,18 +59,33 @@ async def list_tasks(
 
 
 @router.get("/{task_id}", response_model=Task)
-async def get_task(task_id: str):
+async def get_task(
+    task_id: str,
+    wait_for_change: Optional[float] = Query(
+        None, ge=0, le=60, description="Long-poll: wait up to N seconds for the task to change"
+    ),
+    since_version: Optional[int] = Query(
+        None, description="Task version already seen (long-poll returns as soon as the task is newer)"
+    )
+):
     """
     Get task details
     
     Retrieve detailed information about a specific task.
     
     - **task_id**: Task ID
+    - **wait_for_change**: Optional long-poll timeout in seconds; the response is
+      sent as soon as the task's status or progress changes (or it is already final)
+    - **since_version**: Optional `version` from a previous response, so no change is missed
     
-    Returns task details including status, progress, and result (if completed).
+    Returns task details including status, progress, queue position (if pending)
+    and result (if completed).
     """
     try:
-        task = task_manager.get_task(task_id)
+        if wait_for_change:
+            task = await task_manager.wait_for_change(task_id, wait_for_change, since_version)
+        else:
+            task = task_manager.get_task_status(task_id)
         
         if not task:
             raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
@@ -75,6 +99,53 @@ async def get_task(task_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{task_id}/events")
+async def stream_task_events(
+    task_id: str,
+    request: Request,
+    last_event_id: Optional[str] = Header(None)
+):
+    """
+    Stream task updates (Server-Sent Events)
+    
+    Sends the full task as a `task` event on every status or progress change
+    (event id = task version), and closes the stream after the final state.
+    Reconnecting clients resume via the standard Last-Event-ID header.
+    
+    - **task_id**: Task ID
+    """
+    task = task_manager.get_task(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+    
+    since_version = int(last_event_id) if last_event_id and last_event_id.isdigit() else -1
+    
+    async def events():
+        version = since_version
+        while True:
+            task = await task_manager.wait_for_change(task_id, EVENT_STREAM_KEEPALIVE, version)
+            if task is None:
+                break
+            
+            if task.version > version:
+                version = task.version
+                yield f"id: {task.version}\nevent: task\ndata: {task.model_dump_json()}\n\n"
+            elif task.status in INCOMPLETE_STATUSES:
+                yield ": keep-alive\n\n"
+            
+            if task.status not in INCOMPLETE_STATUSES:
+                break
+            
+            if await request.is_disconnected():
+                break
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.delete("/{task_id}")
 async def cancel_task(task_id: str):
     """
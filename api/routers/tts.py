@@ -92,3 +92,16 @@ async def tts_synthesize(
         logger.error(f"TTS synthesis error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.get("/cache/stats")
+async def tts_cache_stats(pixelle_video: PixelleVideoDep):
+    """
+    TTS cache statistics
+    
+    Returns hit/miss counters, hit rate, entry count and disk usage of the
+    TTS audio cache, or `enabled: false` when the cache is turned off.
+    """
+    stats = pixelle_video.tts.cache_stats()
+    if stats is None:
+        return {"enabled": False}
+    return {"enabled": True, **stats}
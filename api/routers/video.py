@@ -17,21 +17,37 @@ Supports both synchronous and asynchronous video generation.
 """
 
 import os
+from typing import Union
+
 from fastapi import APIRouter, HTTPException, Request
 from loguru import logger
 
-from api.dependencies import PixelleVideoDep
+from api.dependencies import PixelleVideoDep, get_pixelle_video
 from api.schemas.video import (
     VideoGenerateRequest,
     VideoGenerateResponse,
     VideoGenerateAsyncResponse,
 )
-from api.tasks import task_manager, TaskType
+from api.tasks import task_manager, Task, TaskType, QueueFullError
 
 router = APIRouter(prefix="/video", tags=["Video Generation"])
 
 
-def path_to_url(request: Request, file_path: str) -> str:
+def check_admission():
+    """
+    Reject new video generations while the task queue is full
+    
+    Raises:
+        HTTPException: 429 with Retry-After header
+    """
+    try:
+        task_manager.check_admission()
+    except QueueFullError as e:
+        logger.warning(f"Rejected video generation: {e}")
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+
+def path_to_url(request: Union[Request, str], file_path: str) -> str:
     """
     Convert file path to accessible URL
     
@@ -39,7 +55,8 @@ def path_to_url(request: Request, file_path: str) -> str:
     to the output directory for URL construction.
     
     Args:
-        request: FastAPI Request object (provides base_url from actual request)
+        request: FastAPI Request object (provides base_url from actual request),
+                 or a base URL string (for background tasks re-run after a restart)
         file_path: Absolute or relative file path
     
     Returns:
@@ -81,7 +98,7 @@ def path_to_url(request: Request, file_path: str) -> str:
             file_path = file_path[7:]  # Remove "output/"
     
     # Build URL using request's base_url (automatically matches the request host)
-    base_url = str(request.base_url).rstrip('/')
+    base_url = str(request.base_url if isinstance(request, Request) else request).rstrip('/')
     return f"{base_url}/api/files/{file_path}"
 
 
@@ -98,12 +115,16 @@ async def generate_video_sync(
     Suitable for small videos (< 30 seconds).
     
     **Note**: May timeout for large videos. Use `/generate/async` instead.
+    Shares the concurrency limit with async tasks; returns 429 (with Retry-After)
+    when the queue is full.
     
     Request body includes all video generation parameters.
     See VideoGenerateRequest schema for details.
     
     Returns path to generated video, duration, and file size.
     """
+    check_admission()
+    
     try:
         logger.info(f"Sync video generation: {request_body.text[:50]}...")
         
@@ -111,11 +132,10 @@ async def generate_video_sync(
         if not request_body.frame_template:
             raise ValueError("frame_template is required to determine media size")
         
-        from pixelle_video.services.frame_html import HTMLFrameGenerator
+        from pixelle_video.services.template_registry import template_registry
         from pixelle_video.utils.template_util import resolve_template_path
         template_path = resolve_template_path(request_body.frame_template)
-        generator = HTMLFrameGenerator(template_path)
-        media_width, media_height = generator.get_media_size()
+        media_width, media_height = template_registry.get(template_path).get_media_size()
         logger.debug(f"Auto-determined media size from template: {media_width}x{media_height}")
         
         # Build video generation parameters
@@ -155,8 +175,9 @@ async def generate_video_sync(
         if request_body.template_params:
             video_params["template_params"] = request_body.template_params
         
-        # Call video generator service
-        result = await pixelle_video.generate_video(**video_params)
+        # Call video generator service (waits for a free slot)
+        async with task_manager.slot():
+            result = await pixelle_video.generate_video(**video_params)
         
         # Get file size
         file_size = os.path.getsize(result.video_path) if os.path.exists(result.video_path) else 0
@@ -175,6 +196,89 @@ async def generate_video_sync(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def run_video_generation_task(task: Task) -> dict:
+    """
+    Run an async video generation task from its persisted state
+    
+    Registered with the task manager, so tasks interrupted by a restart can be re-enqueued.
+    
+    Args:
+        task: Task with request_params (VideoGenerateRequest) and context (base_url)
+    
+    Returns:
+        Task result: video_url, duration, file_size
+    """
+    request_body = VideoGenerateRequest(**task.request_params)
+    base_url = (task.context or {}).get("base_url", "")
+    pixelle_video = await get_pixelle_video()
+    
+    # Auto-determine media_width and media_height from template meta tags (required)
+    if not request_body.frame_template:
+        raise ValueError("frame_template is required to determine media size")
+    
+    from pixelle_video.services.template_registry import template_registry
+    from pixelle_video.utils.template_util import resolve_template_path
+    template_path = resolve_template_path(request_body.frame_template)
+    media_width, media_height = template_registry.get(template_path).get_media_size()
+    logger.debug(f"Auto-determined media size from template: {media_width}x{media_height}")
+    
+    # Build video generation parameters
+    video_params = {
+        "text": request_body.text,
+        "mode": request_body.mode,
+        "title": request_body.title,
+        "n_scenes": request_body.n_scenes,
+        "min_narration_words": request_body.min_narration_words,
+        "max_narration_words": request_body.max_narration_words,
+        "min_image_prompt_words": request_body.min_image_prompt_words,
+        "max_image_prompt_words": request_body.max_image_prompt_words,
+        "media_width": media_width,
+        "media_height": media_height,
+        "media_workflow": request_body.media_workflow,
+        "video_fps": request_body.video_fps,
+        "frame_template": request_body.frame_template,
+        "prompt_prefix": request_body.prompt_prefix,
+        "bgm_path": request_body.bgm_path,
+        "bgm_volume": request_body.bgm_volume,
+        # Pipeline progress events feed the task (GET /api/tasks/{task_id}, .../events)
+        "progress_callback": task_manager.progress_callback(task.task_id),
+    }
+    
+    # Add TTS workflow if specified
+    if request_body.tts_workflow:
+        video_params["tts_workflow"] = request_body.tts_workflow
+    
+    # Add ref_audio if specified
+    if request_body.ref_audio:
+        video_params["ref_audio"] = request_body.ref_audio
+    
+    # Legacy voice_id support (deprecated)
+    if request_body.voice_id:
+        logger.warning("voice_id parameter is deprecated, please use tts_workflow instead")
+        video_params["voice_id"] = request_body.voice_id
+    
+    # Add custom template parameters if specified
+    if request_body.template_params:
+        video_params["template_params"] = request_body.template_params
+    
+    result = await pixelle_video.generate_video(**video_params)
+    
+    # Get file size
+    file_size = os.path.getsize(result.video_path) if os.path.exists(result.video_path) else 0
+    
+    # Convert path to URL
+    video_url = path_to_url(base_url, result.video_path)
+    
+    return {
+        "video_url": video_url,
+        "duration": result.duration,
+        "file_size": file_size
+    }
+
+
+task_manager.register_handler(TaskType.VIDEO_GENERATION, run_video_generation_task)
+
+
 @router.post("/generate/async", response_model=VideoGenerateAsyncResponse)
 async def generate_video_async(
     request_body: VideoGenerateRequest,
@@ -190,95 +294,31 @@ async def generate_video_async(
     **Workflow:**
     1. Submit video generation request
     2. Receive task_id in response
-    3. Poll `/api/tasks/{task_id}` to check status
+    3. Follow progress via `/api/tasks/{task_id}/events` (Server-Sent Events),
+       or long-poll `/api/tasks/{task_id}?wait_for_change=30`
+       (pending tasks report their `queue_position`)
     4. When status is "completed", retrieve video from result
     
     Request body includes all video generation parameters.
     See VideoGenerateRequest schema for details.
     
-    Returns task_id for tracking progress.
+    Returns task_id for tracking progress, or 429 (with Retry-After) when
+    the task queue is full.
     """
+    check_admission()
+    
     try:
         logger.info(f"Async video generation: {request_body.text[:50]}...")
         
-        # Create task
+        # Create task (persisted with what is needed to re-run it after a restart)
         task = task_manager.create_task(
             task_type=TaskType.VIDEO_GENERATION,
-            request_params=request_body.model_dump()
+            request_params=request_body.model_dump(),
+            context={"base_url": str(request.base_url)}
         )
         
-        # Define async execution function
-        async def execute_video_generation():
-            """Execute video generation in background"""
-            # Auto-determine media_width and media_height from template meta tags (required)
-            if not request_body.frame_template:
-                raise ValueError("frame_template is required to determine media size")
-            
-            from pixelle_video.services.frame_html import HTMLFrameGenerator
-            from pixelle_video.utils.template_util import resolve_template_path
-            template_path = resolve_template_path(request_body.frame_template)
-            generator = HTMLFrameGenerator(template_path)
-            media_width, media_height = generator.get_media_size()
-            logger.debug(f"Auto-determined media size from template: {media_width}x{media_height}")
-            
-            # Build video generation parameters
-            video_params = {
-                "text": request_body.text,
-                "mode": request_body.mode,
-                "title": request_body.title,
-                "n_scenes": request_body.n_scenes,
-                "min_narration_words": request_body.min_narration_words,
-                "max_narration_words": request_body.max_narration_words,
-                "min_image_prompt_words": request_body.min_image_prompt_words,
-                "max_image_prompt_words": request_body.max_image_prompt_words,
-                "media_width": media_width,
-                "media_height": media_height,
-                "media_workflow": request_body.media_workflow,
-                "video_fps": request_body.video_fps,
-                "frame_template": request_body.frame_template,
-                "prompt_prefix": request_body.prompt_prefix,
-                "bgm_path": request_body.bgm_path,
-                "bgm_volume": request_body.bgm_volume,
-                # Progress callback can be added here if needed
-                # "progress_callback": lambda event: task_manager.update_progress(...)
-            }
-            
-            # Add TTS workflow if specified
-            if request_body.tts_workflow:
-                video_params["tts_workflow"] = request_body.tts_workflow
-            
-            # Add ref_audio if specified
-            if request_body.ref_audio:
-                video_params["ref_audio"] = request_body.ref_audio
-            
-            # Legacy voice_id support (deprecated)
-            if request_body.voice_id:
-                logger.warning("voice_id parameter is deprecated, please use tts_workflow instead")
-                video_params["voice_id"] = request_body.voice_id
-            
-            # Add custom template parameters if specified
-            if request_body.template_params:
-                video_params["template_params"] = request_body.template_params
-            
-            result = await pixelle_video.generate_video(**video_params)
-            
-            # Get file size
-            file_size = os.path.getsize(result.video_path) if os.path.exists(result.video_path) else 0
-            
-            # Convert path to URL
-            video_url = path_to_url(request, result.video_path)
-            
-            return {
-                "video_url": video_url,
-                "duration": result.duration,
-                "file_size": file_size
-            }
-        
-        # Start execution
-        await task_manager.execute_task(
-            task_id=task.task_id,
-            coro_func=execute_video_generation
-        )
+        # Start execution (runs run_video_generation_task)
+        await task_manager.execute_task(task_id=task.task_id)
         
         return VideoGenerateAsyncResponse(
             task_id=task.task_id
@@ -15,7 +15,17 @@ Task management for async operations
 """
 
 from api.tasks.models import Task, TaskStatus, TaskType
-from api.tasks.manager import task_manager
+from api.tasks.store import TaskStore, SQLiteTaskStore, MemoryTaskStore
+from api.tasks.manager import task_manager, QueueFullError
 
-__all__ = ["Task", "TaskStatus", "TaskType", "task_manager"]
+__all__ = [
+    "Task",
+    "TaskStatus",
+    "TaskType",
+    "TaskStore",
+    "SQLiteTaskStore",
+    "MemoryTaskStore",
+    "task_manager",
+    "QueueFullError",
+]
 
@@ -13,43 +13,124 @@
 """
 Task Manager
 
-In-memory task management for video generation jobs.
+Task management for video generation jobs, backed by a durable task store.
 """
 
 import asyncio
+import time
 import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from typing import Awaitable, Callable, Dict, List, Optional
 from loguru import logger
 
+from pixelle_video.models.progress import ProgressEvent
+
 from api.tasks.models import Task, TaskStatus, TaskType, TaskProgress
+from api.tasks.store import INCOMPLETE_STATUSES, TaskStore, create_task_store
 from api.config import api_config
 
 
+# Handler that can (re-)run a task from its persisted state: async (task) -> result
+TaskHandler = Callable[[Task], Awaitable]
+
+
+class QueueFullError(Exception):
+    """Raised when the pending task queue is full (HTTP 429)"""
+    
+    def __init__(self, pending: int, retry_after: int):
+        super().__init__(f"Task queue is full ({pending} tasks waiting), retry in {retry_after}s")
+        self.pending = pending
+        self.retry_after = retry_after
+
+
 class TaskManager:
     """
     Task manager for handling async video generation tasks
     
     Features:
-    - In-memory storage (can be replaced with Redis later)
+    - Durable task store (SQLite by default, see api_config.task_store)
+    - Bounded in-memory hot cache in front of the store (active tasks always cached)
     - Task lifecycle management
-    - Progress tracking
+    - Admission control: at most api_config.max_concurrent_tasks run at once, at most
+      api_config.max_pending_tasks wait (FIFO, with queue position); beyond that
+      check_admission() raises QueueFullError
+    - Progress tracking (pipeline ProgressEvents via progress_callback)
+    - Change notification for long-polling and event streams (wait_for_change)
+    - Crash recovery: tasks left pending/running by a restart are re-enqueued
+      (if their type has a registered handler) or marked failed
+    - Worker mode (api_config.task_execution = "worker"): tasks are only enqueued
+      in the store and run by worker processes (api/worker.py)
     - Auto cleanup of old tasks
     """
     
-    def __init__(self):
-        self._tasks: Dict[str, Task] = {}
+    # Minimum seconds between persisted progress updates of one task
+    PROGRESS_SAVE_INTERVAL = 1.0
+    
+    def __init__(self, store: Optional[TaskStore] = None):
+        """
+        Initialize task manager
+        
+        Args:
+            store: Task store (default: created from api_config on start)
+        """
+        self._store = store
+        self._tasks: "OrderedDict[str, Task]" = OrderedDict()
         self._task_futures: Dict[str, asyncio.Task] = {}
+        self._handlers: Dict[TaskType, TaskHandler] = {}
+        self._progress_saved_at: Dict[str, float] = {}
+        self._change_events: Dict[str, asyncio.Event] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._waiting: "OrderedDict[str, None]" = OrderedDict()
         self._cleanup_task: Optional[asyncio.Task] = None
         self._running = False
     
+    @property
+    def remote_execution(self) -> bool:
+        """Whether tasks run in worker processes instead of this process"""
+        return api_config.task_execution == "worker"
+    
+    @property
+    def store(self) -> TaskStore:
+        """Task store (created from api_config on first use)"""
+        if self._store is None:
+            self._store = create_task_store(api_config.task_store, api_config.task_store_path)
+        return self._store
+    
+    @property
+    def handlers(self) -> Dict[TaskType, TaskHandler]:
+        """Registered task handlers by task type"""
+        return dict(self._handlers)
+    
+    def register_handler(self, task_type: TaskType, handler: TaskHandler):
+        """
+        Register the handler that runs tasks of a type from their persisted state
+        
+        Registered task types can be re-enqueued after a restart and can be
+        executed with execute_task(task_id) without passing a coroutine.
+        
+        Args:
+            task_type: Task type
+            handler: async (task) -> result
+        """
+        self._handlers[task_type] = handler
+    
     async def start(self):
-        """Start task manager and cleanup scheduler"""
+        """Start task manager, recover interrupted tasks and start cleanup scheduler"""
         if self._running:
             logger.warning("Task manager already running")
             return
         
+        if self.remote_execution and api_config.task_store != "sqlite":
+            raise ValueError("task_execution='worker' requires the sqlite task store")
+        
         self._running = True
+        if self.remote_execution:
+            # Pending tasks stay queued; workers hand back tasks of crashed workers (lease timeout)
+            logger.info("Task execution: worker processes (python -m api.worker)")
+        else:
+            await self._recover_tasks()
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
         logger.info("✅ Task manager started")
     
@@ -65,20 +146,229 @@ class TaskManager:
             except asyncio.CancelledError:
                 pass
         
-        # Cancel all running tasks
+        # Cancel all running tasks (their persisted state stays pending/running,
+        # so they are recovered on next start)
         for task_id, future in self._task_futures.items():
             if not future.done():
                 future.cancel()
                 logger.info(f"Cancelled task: {task_id}")
         
+        # Persist latest progress of interrupted tasks
+        for task in self._tasks.values():
+            if task.status in INCOMPLETE_STATUSES:
+                self._save(task)
+        
         self._tasks.clear()
         self._task_futures.clear()
+        self._progress_saved_at.clear()
+        if self._store is not None:
+            self._store.close()
+            self._store = None
         logger.info("✅ Task manager stopped")
     
+    # ==================== Cache & Store ====================
+    
+    def _save(self, task: Task):
+        """Persist a task, keep it in the hot cache and notify waiters"""
+        self._notify(task)
+        self._cache(task)
+        try:
+            self.store.save(task)
+        except Exception as e:
+            logger.error(f"Failed to persist task {task.task_id}: {e}")
+    
+    def _cache(self, task: Task):
+        """Put a task in the hot cache, evicting least recently used finished tasks"""
+        self._tasks[task.task_id] = task
+        self._tasks.move_to_end(task.task_id)
+        
+        excess = len(self._tasks) - api_config.task_cache_size
+        if excess <= 0:
+            return
+        for task_id in list(self._tasks):
+            if excess <= 0:
+                break
+            # Active tasks are mutated in place and must stay cached
+            if self._tasks[task_id].status not in INCOMPLETE_STATUSES:
+                del self._tasks[task_id]
+                excess -= 1
+    
+    # ==================== Admission Control ====================
+    
+    @asynccontextmanager
+    async def slot(self, key: Optional[str] = None):
+        """
+        Hold one of the max_concurrent_tasks execution slots of this process
+        
+        Callers wait in FIFO order; while waiting, key counts as pending
+        and has a queue position. A queue entry reserved beforehand (see
+        execute_task) is reused.
+        
+        Args:
+            key: Task ID (default: anonymous, e.g. a synchronous request)
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(1, api_config.max_concurrent_tasks))
+        
+        key = key or f"sync-{uuid.uuid4()}"
+        self._waiting.setdefault(key, None)
+        if self._slots.locked():
+            logger.info(f"⏳ {key} waiting for a free slot (position {len(self._waiting)})")
+        try:
+            async with self._slots:
+                self._leave_queue(key)
+                yield
+        finally:
+            self._leave_queue(key)
+    
+    def _leave_queue(self, key: str):
+        """Remove a waiter and notify the tasks behind it (their position changed)"""
+        if self._waiting.pop(key, False) is not False:
+            for task_id in self._waiting:
+                task = self._tasks.get(task_id)
+                if task is not None:
+                    self._notify(task)
+    
+    def _pending_count(self) -> int:
+        """Number of tasks (and synchronous requests) waiting to run"""
+        if not self.remote_execution:
+            return len(self._waiting)
+        try:
+            queued = self.store.count(TaskStatus.PENDING)
+        except Exception as e:
+            logger.error(f"Failed to count queued tasks: {e}")
+            queued = 0
+        # Plus synchronous requests waiting for a slot of this process
+        return queued + len(self._waiting)
+    
+    def check_admission(self):
+        """
+        Check that one more task can be queued
+        
+        Raises:
+            QueueFullError: If max_pending_tasks tasks are already waiting
+        """
+        pending = self._pending_count()
+        if pending >= api_config.max_pending_tasks:
+            raise QueueFullError(pending, api_config.task_retry_after)
+    
+    def _queue_position(self, task: Task, local_positions: Dict[str, int]) -> Optional[int]:
+        """1-based position of a pending task in the queue (None if not queued)"""
+        if task.status != TaskStatus.PENDING:
+            return None
+        if not self.remote_execution:
+            return local_positions.get(task.task_id)
+        try:
+            # Workers claim pending tasks oldest first
+            return self.store.count(TaskStatus.PENDING, created_before=task.created_at) + 1
+        except Exception as e:
+            logger.error(f"Failed to get queue position of task {task.task_id}: {e}")
+            return None
+    
+    def _with_queue_positions(self, tasks: List[Task]) -> List[Task]:
+        """Fill in queue_position of pending tasks"""
+        local_positions = {task_id: i + 1 for i, task_id in enumerate(self._waiting)}
+        for task in tasks:
+            task.queue_position = self._queue_position(task, local_positions)
+        return tasks
+    
+    # ==================== Change Notification ====================
+    
+    def _notify(self, task: Task):
+        """Bump the task version and wake up everyone waiting for a change"""
+        task.version += 1
+        event = self._change_events.pop(task.task_id, None)
+        if event is not None:
+            event.set()
+    
+    async def wait_for_change(
+        self,
+        task_id: str,
+        timeout: float,
+        since_version: Optional[int] = None
+    ) -> Optional[Task]:
+        """
+        Wait until a task changes (long-poll)
+        
+        Returns immediately if the task is already newer than since_version
+        or has reached a final state.
+        
+        Args:
+            task_id: Task ID
+            timeout: Maximum seconds to wait
+            since_version: Task version the caller has already seen
+                           (default: the current version, i.e. wait for the next change)
+            
+        Returns:
+            Task (changed or not, after timeout), None if unknown
+        """
+        task = self.get_task(task_id)
+        if task is None:
+            return None
+        if since_version is None:
+            since_version = task.version
+        
+        if task.version <= since_version and task.status in INCOMPLETE_STATUSES:
+            if self.remote_execution and task_id not in self._task_futures:
+                return await self._poll_for_change(task_id, timeout, since_version)
+            
+            event = self._change_events.get(task_id)
+            if event is None:
+                event = self._change_events[task_id] = asyncio.Event()
+            try:
+                await asyncio.wait_for(event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        
+        return self.get_task_status(task_id)
+    
+    async def _poll_for_change(self, task_id: str, timeout: float, since_version: int) -> Optional[Task]:
+        """wait_for_change for tasks updated by another process (polls the store)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            await asyncio.sleep(max(0.0, min(api_config.worker_poll_interval, deadline - time.monotonic())))
+            task = self.get_task(task_id)
+            if task is None or task.version > since_version or task.status not in INCOMPLETE_STATUSES:
+                break
+            if time.monotonic() >= deadline:
+                break
+        return self._with_queue_positions([task])[0] if task else None
+    
+    async def _recover_tasks(self):
+        """Re-enqueue or fail tasks left pending/running by a previous process"""
+        try:
+            interrupted = self.store.list_incomplete()
+        except Exception as e:
+            logger.error(f"Failed to load interrupted tasks: {e}")
+            return
+        
+        for task in interrupted:
+            handler = self._handlers.get(task.task_type)
+            
+            if api_config.task_recovery == "requeue" and handler and task.attempts < api_config.task_max_attempts:
+                task.status = TaskStatus.PENDING
+                task.started_at = None
+                task.progress = None
+                self._save(task)
+                await self.execute_task(task.task_id)
+                logger.info(f"♻️  Re-enqueued interrupted task {task.task_id} (attempt {task.attempts + 1})")
+            else:
+                task.status = TaskStatus.FAILED
+                task.error = "Task was interrupted by a server restart"
+                task.completed_at = datetime.now()
+                self._save(task)
+                logger.warning(f"Marked interrupted task {task.task_id} as failed")
+        
+        if interrupted:
+            logger.info(f"Recovered {len(interrupted)} interrupted task(s)")
+    
+    # ==================== Task Lifecycle ====================
+    
     def create_task(
         self,
         task_type: TaskType,
-        request_params: Optional[dict] = None
+        request_params: Optional[dict] = None,
+        context: Optional[dict] = None
     ) -> Task:
         """
         Create a new task
@@ -86,6 +376,7 @@ class TaskManager:
         Args:
             task_type: Type of task
             request_params: Original request parameters
+            context: Server-side context the task handler needs to re-run the task
             
         Returns:
             Created task
@@ -96,16 +387,17 @@ class TaskManager:
             task_type=task_type,
             status=TaskStatus.PENDING,
             request_params=request_params,
+            context=context,
         )
         
-        self._tasks[task_id] = task
+        self._save(task)
         logger.info(f"Created task {task_id} ({task_type})")
         return task
     
     async def execute_task(
         self,
         task_id: str,
-        coro_func: Callable,
+        coro_func: Optional[Callable] = None,
         *args,
         **kwargs
     ):
@@ -114,44 +406,100 @@ class TaskManager:
         
         Args:
             task_id: Task ID
-            coro_func: Async function to execute
+            coro_func: Async function to execute (default: registered handler of the task type,
+                       called with the task)
             *args: Positional arguments
             **kwargs: Keyword arguments
+        
+        Returns:
+            The asyncio task running it (None if not started here)
         """
-        task = self._tasks.get(task_id)
+        task = self.get_task(task_id)
         if not task:
             logger.error(f"Task {task_id} not found")
-            return
+            return None
+        
+        if coro_func is None:
+            if self.remote_execution:
+                logger.info(f"Task {task_id} queued for workers")
+                return None
+            
+            handler = self._handlers.get(task.task_type)
+            if handler is None:
+                logger.error(f"No handler registered for task type {task.task_type}")
+                return None
+            coro_func, args, kwargs = handler, (task,), {}
         
         # Create async task
         async def _execute():
             try:
-                task.status = TaskStatus.RUNNING
-                task.started_at = datetime.now()
-                logger.info(f"Task {task_id} started")
-                
-                # Execute the actual work
-                result = await coro_func(*args, **kwargs)
+                # Wait for a free slot (max_concurrent_tasks), the task stays pending meanwhile
+                async with self.slot(task_id):
+                    task.status = TaskStatus.RUNNING
+                    task.started_at = datetime.now()
+                    task.queue_position = None
+                    task.attempts += 1
+                    self._save(task)
+                    logger.info(f"Task {task_id} started")
+                    
+                    # Execute the actual work
+                    result = await coro_func(*args, **kwargs)
                 
                 # Update task with result
                 task.status = TaskStatus.COMPLETED
                 task.result = result
                 task.completed_at = datetime.now()
+                self._save(task)
                 logger.info(f"Task {task_id} completed")
                 
             except Exception as e:
                 task.status = TaskStatus.FAILED
                 task.error = str(e)
                 task.completed_at = datetime.now()
+                self._save(task)
                 logger.error(f"Task {task_id} failed: {e}")
+            
+            finally:
+                self._task_futures.pop(task_id, None)
+                self._progress_saved_at.pop(task_id, None)
+                self._change_events.pop(task_id, None)
+        
+        # Reserve the queue entry now: _execute() only starts on a later loop iteration,
+        # and admission checks made in between must already count this task
+        self._waiting.setdefault(task_id, None)
         
         # Start execution
         future = asyncio.create_task(_execute())
         self._task_futures[task_id] = future
+        # Also drops the reservation if the task is cancelled before it started
+        future.add_done_callback(lambda _: self._leave_queue(task_id))
+        return future
     
     def get_task(self, task_id: str) -> Optional[Task]:
-        """Get task by ID"""
-        return self._tasks.get(task_id)
+        """Get task by ID (hot cache first, then the store)"""
+        task = self._tasks.get(task_id)
+        # Active tasks run by worker processes change in the store, not in the cache
+        if task is not None and not (
+            self.remote_execution
+            and task.status in INCOMPLETE_STATUSES
+            and task_id not in self._task_futures
+        ):
+            self._tasks.move_to_end(task_id)
+            return task
+        
+        try:
+            task = self.store.get(task_id)
+        except Exception as e:
+            logger.error(f"Failed to load task {task_id}: {e}")
+            return None
+        if task is not None:
+            self._cache(task)
+        return task
+    
+    def get_task_status(self, task_id: str) -> Optional[Task]:
+        """Get task by ID, with its queue position if pending"""
+        task = self.get_task(task_id)
+        return self._with_queue_positions([task])[0] if task else None
     
     def list_tasks(
         self,
@@ -168,22 +516,23 @@ class TaskManager:
         Returns:
             List of tasks
         """
-        tasks = list(self._tasks.values())
+        tasks = self.store.list(status=status, limit=limit)
         
-        if status:
-            tasks = [t for t in tasks if t.status == status]
-        
-        # Sort by created_at descending
-        tasks.sort(key=lambda t: t.created_at, reverse=True)
-        
-        return tasks[:limit]
+        # Prefer cached instances: they carry the latest (unthrottled) progress
+        # (only tasks run in this process when workers execute them)
+        if self.remote_execution:
+            tasks = [self._tasks[t.task_id] if t.task_id in self._task_futures else t for t in tasks]
+        else:
+            tasks = [self._tasks.get(t.task_id, t) for t in tasks]
+        return self._with_queue_positions(tasks)
     
     def update_progress(
         self,
         task_id: str,
         current: int,
         total: int,
-        message: str = ""
+        message: str = "",
+        event: Optional[ProgressEvent] = None
     ):
         """
         Update task progress
@@ -193,6 +542,7 @@ class TaskManager:
             current: Current progress
             total: Total steps
             message: Progress message
+            event: Pipeline progress event the update comes from (optional, adds frame details)
         """
         task = self._tasks.get(task_id)
         if not task:
@@ -203,8 +553,105 @@ class TaskManager:
             current=current,
             total=total,
             percentage=percentage,
-            message=message
+            message=message,
+            event_type=event.event_type if event else None,
+            frame_current=event.frame_current if event else None,
+            frame_total=event.frame_total if event else None,
+            action=event.action if event else None,
         )
+        
+        # Persist at most once per interval (the cached task is always current,
+        # and waiters are woken up on every update)
+        now = time.monotonic()
+        if now - self._progress_saved_at.get(task_id, 0) >= self.PROGRESS_SAVE_INTERVAL:
+            self._progress_saved_at[task_id] = now
+            self._save(task)
+        else:
+            self._notify(task)
+    
+    def progress_callback(self, task_id: str) -> Callable[[ProgressEvent], None]:
+        """
+        Create a pipeline progress callback that feeds a task's progress
+        
+        Must be created on the event loop; events reported from worker
+        threads are forwarded to it.
+        
+        Args:
+            task_id: Task ID
+            
+        Returns:
+            Callback for the pipeline's progress_callback parameter
+        """
+        loop = asyncio.get_running_loop()
+        
+        def on_progress(event: ProgressEvent):
+            message = event.event_type
+            if event.frame_current and event.frame_total:
+                message = f"{event.event_type} ({event.frame_current}/{event.frame_total})"
+            if event.extra_info:
+                message = f"{message} - {event.extra_info}"
+            
+            def update():
+                self.update_progress(task_id, round(event.progress * 100), 100, message, event=event)
+            
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            if running_loop is loop:
+                update()
+            else:
+                loop.call_soon_threadsafe(update)
+        
+        return on_progress
+    
+    def heartbeat(self, task_id: str) -> bool:
+        """
+        Record that a task running in this process is alive (worker mode)
+        
+        Args:
+            task_id: Task ID
+            
+        Returns:
+            False if the task was cancelled through another process (its run is cancelled here)
+        """
+        task = self._tasks.get(task_id)
+        if task is None:
+            return False
+        
+        stored = self.store.get(task_id)
+        if stored is not None and stored.status == TaskStatus.CANCELLED:
+            future = self._task_futures.get(task_id)
+            if future and not future.done():
+                future.cancel()
+            self._tasks[task_id] = stored
+            logger.info(f"Task {task_id} was cancelled, stopping it")
+            return False
+        
+        task.heartbeat_at = datetime.now()
+        self._save(task)
+        return True
+    
+    def release_task(self, task_id: str):
+        """
+        Hand an interrupted task back to the queue, e.g. on graceful worker shutdown
+        
+        The interrupted run does not count as an attempt.
+        
+        Args:
+            task_id: Task ID
+        """
+        task = self._tasks.get(task_id) or self.get_task(task_id)
+        if task is None or task.status not in INCOMPLETE_STATUSES:
+            return
+        
+        task.status = TaskStatus.PENDING
+        task.started_at = None
+        task.heartbeat_at = None
+        task.progress = None
+        task.attempts = max(0, task.attempts - 1)
+        self._save(task)
+        logger.info(f"Task {task_id} handed back to the queue")
     
     def cancel_task(self, task_id: str) -> bool:
         """
@@ -216,11 +663,12 @@ class TaskManager:
         Returns:
             True if cancelled, False otherwise
         """
-        task = self._tasks.get(task_id)
+        task = self.get_task(task_id)
         if not task:
             return False
         
-        # Cancel future if running
+        # Cancel future if running (a worker process running the task stops it
+        # when its next heartbeat sees the cancelled status)
         future = self._task_futures.get(task_id)
         if future and not future.done():
             future.cancel()
@@ -228,6 +676,7 @@ class TaskManager:
         # Update task status
         task.status = TaskStatus.CANCELLED
         task.completed_at = datetime.now()
+        self._save(task)
         logger.info(f"Cancelled task {task_id}")
         return True
     
@@ -243,24 +692,21 @@ class TaskManager:
                 logger.error(f"Error in cleanup loop: {e}")
     
     def _cleanup_old_tasks(self):
-        """Remove old completed/failed tasks"""
+        """Remove old completed/failed tasks from the store and the hot cache"""
         cutoff_time = datetime.now() - timedelta(seconds=api_config.task_retention_time)
         
-        tasks_to_remove = []
-        for task_id, task in self._tasks.items():
-            if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-                if task.completed_at and task.completed_at < cutoff_time:
-                    tasks_to_remove.append(task_id)
-        
+        tasks_to_remove = [
+            task_id for task_id, task in self._tasks.items()
+            if task.status not in INCOMPLETE_STATUSES
+            and task.completed_at and task.completed_at < cutoff_time
+        ]
         for task_id in tasks_to_remove:
             del self._tasks[task_id]
-            if task_id in self._task_futures:
-                del self._task_futures[task_id]
         
-        if tasks_to_remove:
-            logger.info(f"Cleaned up {len(tasks_to_remove)} old tasks")
+        removed = self.store.delete_finished_before(cutoff_time)
+        if removed:
+            logger.info(f"Cleaned up {removed} old tasks")
 
 
 # Global task manager instance
 task_manager = TaskManager()
-
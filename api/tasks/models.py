@@ -40,6 +40,12 @@ class TaskProgress(BaseModel):
     total: int = 0
     percentage: float = 0.0
     message: str = ""
+    
+    # Pipeline progress details (from ProgressEvent, when available)
+    event_type: Optional[str] = None
+    frame_current: Optional[int] = None
+    frame_total: Optional[int] = None
+    action: Optional[str] = None
 
 
 class Task(BaseModel):
@@ -50,6 +56,7 @@ class Task(BaseModel):
     
     # Progress tracking
     progress: Optional[TaskProgress] = None
+    queue_position: Optional[int] = None  # 1-based position while pending (waiting for a free slot)
     
     # Result
     result: Optional[Any] = None
@@ -59,10 +66,21 @@ class Task(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None  # Last sign of life from the worker running the task
     
     # Request parameters (for reference)
     request_params: Optional[dict] = None
     
+    # Change counter, incremented on every status/progress update (for long-polling and event streams)
+    version: int = 0
+    
+    # Execution attempts (incremented on every start, including recovery after a restart)
+    attempts: int = 0
+    
+    # Server-side execution context needed to re-run the task (e.g. base URL for result links);
+    # persisted by the task store, never returned to clients
+    context: Optional[dict] = Field(default=None, exclude=True)
+    
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat()
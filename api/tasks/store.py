@@ -0,0 +1,390 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Task Stores
+
+Persistence backends for TaskManager:
+
+- SQLiteTaskStore: durable local store (default), tasks survive restarts
+- MemoryTaskStore: process-local dict (previous behavior, nothing persisted)
+
+Each task is stored as its JSON document plus a few indexed columns
+(status, created_at, completed_at) used for listing and cleanup.
+
+The SQLite store doubles as the job queue for worker processes
+(api_config.task_execution = "worker"): workers atomically claim the
+oldest pending task and hand abandoned ones (no heartbeat) back.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from api.tasks.models import Task, TaskStatus
+
+# Statuses of tasks that have not reached a final state
+INCOMPLETE_STATUSES = (TaskStatus.PENDING, TaskStatus.RUNNING)
+
+
+class TaskStore(ABC):
+    """
+    Task persistence backend
+
+    Implementations must be safe to call from the event loop thread
+    (calls are short and synchronous).
+    """
+
+    @abstractmethod
+    def save(self, task: Task):
+        """Insert or update a task"""
+        pass
+
+    @abstractmethod
+    def get(self, task_id: str) -> Optional[Task]:
+        """Get a task by ID (None if unknown)"""
+        pass
+
+    @abstractmethod
+    def list(self, status: Optional[TaskStatus] = None, limit: int = 100) -> List[Task]:
+        """List tasks, newest first"""
+        pass
+
+    @abstractmethod
+    def list_incomplete(self) -> List[Task]:
+        """List pending/running tasks, oldest first"""
+        pass
+
+    @abstractmethod
+    def count(self, status: TaskStatus, created_before: Optional[datetime] = None) -> int:
+        """
+        Count tasks in a status
+
+        Args:
+            status: Task status
+            created_before: Only count tasks created earlier (e.g. for a queue position)
+
+        Returns:
+            Number of tasks
+        """
+        pass
+
+    @abstractmethod
+    def delete_finished_before(self, cutoff: datetime) -> int:
+        """Delete final-state tasks completed before cutoff; returns the number deleted"""
+        pass
+
+    @abstractmethod
+    def claim_next(self, task_types: Iterable[str], worker_id: str) -> Optional[Task]:
+        """
+        Atomically move the oldest pending task of the given types to running
+
+        Args:
+            task_types: Task types the caller can run
+            worker_id: Claiming worker (stored in the task context)
+
+        Returns:
+            Claimed task, or None if nothing is pending
+        """
+        pass
+
+    @abstractmethod
+    def release_abandoned(self, cutoff: datetime, max_attempts: int) -> List[Task]:
+        """
+        Hand back running tasks whose last heartbeat is older than cutoff
+
+        Tasks below max_attempts go back to pending, the others are failed.
+
+        Returns:
+            Released tasks (in their new state)
+        """
+        pass
+
+    def close(self):
+        """Release resources"""
+        pass
+
+
+def _claim(task: Task, worker_id: str) -> Task:
+    task.status = TaskStatus.RUNNING
+    task.started_at = datetime.now()
+    task.heartbeat_at = task.started_at
+    task.context = {**(task.context or {}), "worker_id": worker_id}
+    task.version += 1
+    return task
+
+
+def _release(task: Task, max_attempts: int) -> Task:
+    if task.attempts < max_attempts:
+        task.status = TaskStatus.PENDING
+        task.started_at = None
+        task.progress = None
+    else:
+        task.status = TaskStatus.FAILED
+        task.error = "Task was abandoned by its worker"
+        task.completed_at = datetime.now()
+    task.version += 1
+    return task
+
+
+def _is_abandoned(task: Task, cutoff: datetime) -> bool:
+    last_seen = task.heartbeat_at or task.started_at
+    return task.status == TaskStatus.RUNNING and (last_seen is None or last_seen < cutoff)
+
+
+class MemoryTaskStore(TaskStore):
+    """Non-durable in-memory store"""
+
+    def __init__(self):
+        self._tasks: Dict[str, Task] = {}
+
+    def save(self, task: Task):
+        self._tasks[task.task_id] = task
+
+    def get(self, task_id: str) -> Optional[Task]:
+        return self._tasks.get(task_id)
+
+    def list(self, status: Optional[TaskStatus] = None, limit: int = 100) -> List[Task]:
+        tasks = [t for t in self._tasks.values() if status is None or t.status == status]
+        tasks.sort(key=lambda t: t.created_at, reverse=True)
+        return tasks[:limit]
+
+    def list_incomplete(self) -> List[Task]:
+        tasks = [t for t in self._tasks.values() if t.status in INCOMPLETE_STATUSES]
+        tasks.sort(key=lambda t: t.created_at)
+        return tasks
+
+    def count(self, status: TaskStatus, created_before: Optional[datetime] = None) -> int:
+        return sum(
+            1 for t in self._tasks.values()
+            if t.status == status and (created_before is None or t.created_at < created_before)
+        )
+
+    def delete_finished_before(self, cutoff: datetime) -> int:
+        expired = [
+            task_id for task_id, t in self._tasks.items()
+            if t.status not in INCOMPLETE_STATUSES and t.completed_at and t.completed_at < cutoff
+        ]
+        for task_id in expired:
+            del self._tasks[task_id]
+        return len(expired)
+
+    def claim_next(self, task_types: Iterable[str], worker_id: str) -> Optional[Task]:
+        task_types = set(task_types)
+        for task in self.list_incomplete():
+            if task.status == TaskStatus.PENDING and task.task_type in task_types:
+                return _claim(task, worker_id)
+        return None
+
+    def release_abandoned(self, cutoff: datetime, max_attempts: int) -> List[Task]:
+        return [_release(t, max_attempts) for t in self.list_incomplete() if _is_abandoned(t, cutoff)]
+
+
+class SQLiteTaskStore(TaskStore):
+    """
+    Durable SQLite store (WAL mode)
+
+    Usage:
+        store = SQLiteTaskStore("data/tasks/tasks.db")
+        store.save(task)
+        pending = store.list_incomplete()
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            task_id      TEXT PRIMARY KEY,
+            status       TEXT NOT NULL,
+            created_at   TEXT NOT NULL,
+            completed_at TEXT,
+            data         TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+        CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
+        CREATE INDEX IF NOT EXISTS idx_tasks_status_created_at ON tasks (status, created_at);
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize store
+
+        Args:
+            db_path: SQLite database path (parent directories are created)
+        """
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+
+        logger.debug(f"Task store opened: {db_path}")
+
+    def save(self, task: Task):
+        with self._lock, self._conn:
+            self._write(task)
+
+    def _write(self, task: Task):
+        """Upsert a task (lock held); cancellation is final, even against late writes from a worker"""
+        self._conn.execute(
+            "INSERT INTO tasks (task_id, status, created_at, completed_at, data) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (task_id) DO UPDATE SET "
+            "status = excluded.status, completed_at = excluded.completed_at, data = excluded.data "
+            "WHERE tasks.status != ?",
+            (
+                task.task_id,
+                task.status.value,
+                task.created_at.isoformat(),
+                task.completed_at.isoformat() if task.completed_at else None,
+                self._dump(task),
+                TaskStatus.CANCELLED.value,
+            ),
+        )
+
+    @staticmethod
+    def _dump(task: Task) -> str:
+        data = task.model_dump(mode="json")
+        # Queue position is computed when the task is read
+        data.pop("queue_position", None)
+        # Server-side execution context is excluded from API responses but must persist
+        data["context"] = task.context
+        return json.dumps(data, ensure_ascii=False)
+
+    @staticmethod
+    def _load(data: str) -> Optional[Task]:
+        try:
+            return Task.model_validate(json.loads(data))
+        except Exception as e:
+            logger.warning(f"Skipping unreadable task record: {e}")
+            return None
+
+    def get(self, task_id: str) -> Optional[Task]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return self._load(row[0]) if row else None
+
+    def list(self, status: Optional[TaskStatus] = None, limit: int = 100) -> List[Task]:
+        sql = "SELECT data FROM tasks"
+        args: list = []
+        if status is not None:
+            sql += " WHERE status = ?"
+            args.append(status.value)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        args.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [task for task in (self._load(row[0]) for row in rows) if task]
+
+    def list_incomplete(self) -> List[Task]:
+        placeholders = ", ".join("?" for _ in INCOMPLETE_STATUSES)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM tasks WHERE status IN ({placeholders}) ORDER BY created_at ASC",
+                [s.value for s in INCOMPLETE_STATUSES],
+            ).fetchall()
+        return [task for task in (self._load(row[0]) for row in rows) if task]
+
+    def count(self, status: TaskStatus, created_before: Optional[datetime] = None) -> int:
+        sql = "SELECT COUNT(*) FROM tasks WHERE status = ?"
+        args: list = [status.value]
+        if created_before is not None:
+            sql += " AND created_at < ?"
+            args.append(created_before.isoformat())
+
+        with self._lock:
+            return self._conn.execute(sql, args).fetchone()[0]
+
+    def delete_finished_before(self, cutoff: datetime) -> int:
+        placeholders = ", ".join("?" for _ in INCOMPLETE_STATUSES)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"DELETE FROM tasks WHERE status NOT IN ({placeholders}) "
+                "AND completed_at IS NOT NULL AND completed_at < ?",
+                [*(s.value for s in INCOMPLETE_STATUSES), cutoff.isoformat()],
+            )
+            return cursor.rowcount
+
+    def claim_next(self, task_types: Iterable[str], worker_id: str) -> Optional[Task]:
+        task_types = set(task_types)
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock up front, so two workers never claim the same task
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT data FROM tasks WHERE status = ? ORDER BY created_at ASC",
+                    (TaskStatus.PENDING.value,),
+                ).fetchall()
+                for row in rows:
+                    task = self._load(row[0])
+                    if task and task.task_type in task_types:
+                        self._write(_claim(task, worker_id))
+                        self._conn.commit()
+                        return task
+                self._conn.commit()
+                return None
+            except BaseException:
+                self._conn.rollback()
+                raise
+
+    def release_abandoned(self, cutoff: datetime, max_attempts: int) -> List[Task]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT data FROM tasks WHERE status = ?", (TaskStatus.RUNNING.value,)
+                ).fetchall()
+                released = []
+                for row in rows:
+                    task = self._load(row[0])
+                    if task and _is_abandoned(task, cutoff):
+                        self._write(_release(task, max_attempts))
+                        released.append(task)
+                self._conn.commit()
+                return released
+            except BaseException:
+                self._conn.rollback()
+                raise
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_task_store(backend: str, path: Optional[str] = None) -> TaskStore:
+    """
+    Create a task store
+
+    Args:
+        backend: "sqlite" or "memory"
+        path: SQLite database path (default: data/tasks/tasks.db)
+
+    Returns:
+        TaskStore instance
+    """
+    if backend == "memory":
+        return MemoryTaskStore()
+    if backend == "sqlite":
+        if path is None:
+            from pixelle_video.utils.os_util import get_data_path
+            path = get_data_path("tasks", "tasks.db")
+        return SQLiteTaskStore(path)
+    raise ValueError(f"Unknown task store backend: {backend} (expected 'sqlite' or 'memory')")
@@ -0,0 +1,187 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Pixelle-Video Task Worker
+
+Runs async API tasks (video generation) outside the API process. With
+api_config.task_execution = "worker" the API only enqueues tasks in the
+task store and reports their status; any number of workers claim and run
+them, so rendering (Chromium, FFmpeg) never competes with API requests.
+
+While a task runs, its worker records a heartbeat; tasks of a worker that
+died are handed back to the queue once worker_lease_timeout has passed.
+
+Run a worker (from the project root):
+    uv run python -m api.worker
+
+Or with custom settings:
+    uv run python -m api.worker --concurrency 2
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to sys.path for module imports
+_script_dir = Path(__file__).resolve().parent
+_project_root = _script_dir.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from loguru import logger
+
+from api.config import api_config
+from api.tasks import task_manager
+from api.dependencies import shutdown_pixelle_video
+
+# Registers the task handlers with the task manager
+import api.routers.video  # noqa: F401
+
+
+class TaskWorker:
+    """
+    Pulls pending tasks from the task store and runs them
+
+    Usage:
+        worker = TaskWorker(concurrency=2)
+        await worker.run()  # Until stop() is called
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 1,
+        poll_interval: float = 1.0,
+        worker_id: Optional[str] = None
+    ):
+        """
+        Initialize worker
+
+        Args:
+            concurrency: Maximum tasks run at once
+            poll_interval: Seconds between queue polls when idle or full
+            worker_id: Worker name stored with claimed tasks (default: host:pid)
+        """
+        # Tasks beyond the per-process slot limit would sit claimed but idle
+        self.concurrency = max(1, min(concurrency, api_config.max_concurrent_tasks))
+        if self.concurrency < concurrency:
+            logger.warning(f"Worker concurrency capped at max_concurrent_tasks={api_config.max_concurrent_tasks}")
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._active: Dict[str, asyncio.Task] = {}
+        self._stop_event = asyncio.Event()
+
+    def stop(self):
+        """Stop claiming tasks; running tasks are handed back to the queue"""
+        self._stop_event.set()
+
+    async def run(self):
+        """Claim and run tasks until stopped"""
+        store = task_manager.store
+        handlers = task_manager.handlers
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+
+        logger.info(f"👷 Worker {self.worker_id} started (concurrency={self.concurrency})")
+
+        try:
+            while not self._stop_event.is_set():
+                while len(self._active) < self.concurrency:
+                    task = store.claim_next(handlers, self.worker_id)
+                    if task is None:
+                        break
+
+                    future = await task_manager.execute_task(task.task_id, handlers[task.task_type], task)
+                    if future is not None:
+                        self._active[task.task_id] = future
+                        future.add_done_callback(lambda _, task_id=task.task_id: self._active.pop(task_id, None))
+                        logger.info(f"📥 Claimed task {task.task_id} ({task.task_type.value})")
+
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            heartbeat.cancel()
+            await self._hand_back()
+            logger.info(f"👷 Worker {self.worker_id} stopped")
+
+    async def _heartbeat_loop(self):
+        """Keep leases of running tasks alive and hand back tasks of dead workers"""
+        interval = max(1.0, api_config.worker_lease_timeout / 4)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                for task_id in list(self._active):
+                    task_manager.heartbeat(task_id)
+
+                cutoff = datetime.now() - timedelta(seconds=api_config.worker_lease_timeout)
+                for task in task_manager.store.release_abandoned(cutoff, api_config.task_max_attempts):
+                    logger.warning(f"♻️  Task {task.task_id} was abandoned by its worker -> {task.status.value}")
+            except Exception as e:
+                logger.error(f"Worker heartbeat error: {e}")
+
+    async def _hand_back(self):
+        """Cancel running tasks and return them to the queue"""
+        if not self._active:
+            return
+
+        interrupted = dict(self._active)
+        for future in interrupted.values():
+            future.cancel()
+        await asyncio.gather(*interrupted.values(), return_exceptions=True)
+
+        for task_id in interrupted:
+            task_manager.release_task(task_id)
+
+
+async def main(concurrency: int, poll_interval: float):
+    """Run a worker until SIGINT/SIGTERM"""
+    if api_config.task_store != "sqlite":
+        raise ValueError("Task workers require the sqlite task store (api_config.task_store)")
+
+    worker = TaskWorker(concurrency=concurrency, poll_interval=poll_interval)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: KeyboardInterrupt cancels run() instead
+
+    try:
+        await worker.run()
+    finally:
+        await task_manager.stop()
+        await shutdown_pixelle_video()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Start a Pixelle-Video task worker")
+    parser.add_argument(
+        "--concurrency", type=int, default=api_config.worker_concurrency,
+        help="Tasks run at once by this worker"
+    )
+    parser.add_argument(
+        "--poll-interval", type=float, default=api_config.worker_poll_interval,
+        help="Seconds between queue polls"
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(main(args.concurrency, args.poll_interval))
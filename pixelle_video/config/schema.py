@@ -24,6 +24,10 @@ class LLMConfig(BaseModel):
     api_key: str = Field(default="", description="LLM API Key")
     base_url: str = Field(default="", description="LLM API Base URL")
     model: str = Field(default="", description="LLM Model Name")
+    max_connections: int = Field(default=20, ge=1, le=1000, description="Maximum HTTP connections per pooled LLM client")
+    max_keepalive_connections: int = Field(default=10, ge=0, le=1000, description="Idle keep-alive connections kept per pooled LLM client")
+    timeout: float = Field(default=600, gt=0, description="LLM request timeout in seconds")
+    stream_narrations: bool = Field(default=False, description="Stream narrations in generate mode so frame production starts before the LLM finishes")
 
 
 class TTSLocalConfig(BaseModel):
@@ -86,6 +90,64 @@ class TemplateConfig(BaseModel):
         default="1080x1920/default.html",
         description="Default frame template path"
     )
+    bundle_remote_assets: bool = Field(
+        default=True,
+        description="Bundle remote template assets (fonts, CSS, images) into data/template_assets/ and render them locally"
+    )
+
+
+class BrowserPoolConfig(BaseModel):
+    """Headless browser pool configuration (under render.browser_pool)"""
+    enabled: bool = Field(default=True, description="Render frames on a pool of warm headless browsers")
+    size: int = Field(default=2, ge=1, le=16, description="Maximum number of browser processes (1-16)")
+    max_renders: int = Field(default=200, ge=1, description="Recycle a browser after this many renders")
+    health_check_interval: float = Field(default=30.0, ge=0, description="Seconds before an idle browser is pinged again")
+    render_timeout: float = Field(default=30.0, gt=0, description="Timeout in seconds for browser startup and each render")
+
+
+class RenderConfig(BaseModel):
+    """Frame rendering configuration"""
+    browser_pool: BrowserPoolConfig = Field(default_factory=BrowserPoolConfig, description="Headless browser pool configuration")
+
+
+class ConcurrencyConfig(BaseModel):
+    """Frame production concurrency limits (per resource class)"""
+    frames: int = Field(default=4, ge=1, le=64, description="Maximum frames processed at once")
+    tts: int = Field(default=2, ge=1, le=32, description="Concurrent TTS requests")
+    media: int = Field(default=1, ge=1, le=32, description="Concurrent image/video generations (self-hosted ComfyUI)")
+    html: int = Field(default=2, ge=1, le=32, description="Concurrent HTML frame renders")
+    ffmpeg: int = Field(default=2, ge=1, le=64, description="Concurrent FFmpeg segment encodes")
+    ffmpeg_workers: int = Field(default=0, ge=0, le=256, description="FFmpeg worker pool size shared by all tasks (0 = CPU count)")
+    downloads: int = Field(default=8, ge=1, le=64, description="Concurrent downloads of generated media (pooled HTTP client)")
+    llm: int = Field(default=4, ge=1, le=32, description="Concurrent LLM requests per batched generation (e.g. image prompt batches)")
+
+
+class TTSCacheConfig(BaseModel):
+    """TTS audio cache configuration (under cache.tts)"""
+    enabled: bool = Field(default=True, description="Reuse audio for identical text/voice/speed/workflow")
+    max_size_mb: float = Field(default=1024, gt=0, description="Cache size budget in MB (least recently used entries are evicted)")
+    link_mode: str = Field(default="hardlink", description="How cache hits are placed in the task folder: 'hardlink' or 'copy'")
+
+
+class MediaCacheConfig(BaseModel):
+    """Generated image/video cache configuration (under cache.media)"""
+    enabled: bool = Field(default=True, description="Reuse images/videos for identical prompt/workflow/size/seed")
+    max_size_mb: float = Field(default=5120, gt=0, description="Cache size budget in MB (least recently used entries are evicted)")
+    link_mode: str = Field(default="hardlink", description="How cache hits are placed in the task folder: 'hardlink' or 'copy'")
+
+
+class LLMCacheConfig(BaseModel):
+    """LLM response cache configuration (under cache.llm)"""
+    enabled: bool = Field(default=False, description="Reuse LLM responses for identical prompt/model/base_url/temperature/max_tokens (opt-in)")
+    ttl_hours: float = Field(default=168, ge=0, description="Cached responses expire after this many hours (0 = never)")
+    max_size_mb: float = Field(default=100, gt=0, description="Cache size budget in MB (least recently used entries are evicted)")
+
+
+class CacheConfig(BaseModel):
+    """Generated content cache configuration"""
+    tts: TTSCacheConfig = Field(default_factory=TTSCacheConfig, description="TTS audio cache configuration")
+    media: MediaCacheConfig = Field(default_factory=MediaCacheConfig, description="Generated image/video cache configuration")
+    llm: LLMCacheConfig = Field(default_factory=LLMCacheConfig, description="LLM response cache configuration")
 
 
 class PixelleVideoConfig(BaseModel):
@@ -94,6 +156,9 @@ class PixelleVideoConfig(BaseModel):
     llm: LLMConfig = Field(default_factory=LLMConfig)
     comfyui: ComfyUIConfig = Field(default_factory=ComfyUIConfig)
     template: TemplateConfig = Field(default_factory=TemplateConfig)
+    render: RenderConfig = Field(default_factory=RenderConfig)
+    concurrency: ConcurrencyConfig = Field(default_factory=ConcurrencyConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
     
     def is_llm_configured(self) -> bool:
         """Check if LLM is properly configured"""
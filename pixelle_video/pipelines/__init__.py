@@ -19,6 +19,7 @@ Each pipeline implements a specific video generation approach.
 
 from pixelle_video.pipelines.base import BasePipeline
 from pixelle_video.pipelines.linear import LinearVideoPipeline, PipelineContext
+from pixelle_video.pipelines.step_graph import PipelineStep, StepGraph
 from pixelle_video.pipelines.standard import StandardPipeline
 from pixelle_video.pipelines.custom import CustomPipeline
 from pixelle_video.pipelines.asset_based import AssetBasedPipeline
@@ -27,6 +28,8 @@ __all__ = [
     "BasePipeline",
     "LinearVideoPipeline",
     "PipelineContext",
+    "PipelineStep",
+    "StepGraph",
     "StandardPipeline",
     "CustomPipeline",
     "AssetBasedPipeline",
@@ -627,7 +627,14 @@ class AssetBasedPipeline(LinearVideoPipeline):
                     str(combined_audio_path)
                 ]
                 
-                subprocess.run(concat_cmd, check=True, capture_output=True)
+                # Run on the FFmpeg worker pool to keep the event loop responsive
+                import asyncio
+                import functools
+                from pixelle_video.services.video import get_ffmpeg_executor
+                await asyncio.get_running_loop().run_in_executor(
+                    get_ffmpeg_executor(),
+                    functools.partial(subprocess.run, concat_cmd, check=True, capture_output=True)
+                )
                 frame.audio_path = str(combined_audio_path)
                 
                 logger.info(f"✅ Combined {len(narration_audios)} narrations into one audio")
@@ -655,17 +662,9 @@ class AssetBasedPipeline(LinearVideoPipeline):
                 action="compose"
             ))
             
-            # Get audio duration for frame duration
-            import subprocess
-            duration_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                frame.audio_path
-            ]
-            duration_result = subprocess.run(duration_cmd, capture_output=True, text=True, check=True)
-            frame.duration = float(duration_result.stdout.strip())
+            # Get audio duration for frame duration (cached, FrameProcessor reuses it)
+            from pixelle_video.services.media_probe import media_probe
+            frame.duration = float((await media_probe.probe_async(frame.audio_path)).duration)
             
             # Emit progress for video composition
             frame_progress = base_progress + ((i - 1) + 0.75) / total_frames * progress_range
@@ -735,7 +734,7 @@ class AssetBasedPipeline(LinearVideoPipeline):
         if bgm_path:
             logger.info(f"🎵 Adding BGM: {bgm_path} (volume={bgm_volume}, mode={bgm_mode})")
         
-        self.core.video.concat_videos(
+        await self.core.video.concat_videos_async(
             videos=scene_videos,
             output=str(final_video_path),
             bgm_path=bgm_path,
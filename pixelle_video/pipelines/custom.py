@@ -179,7 +179,7 @@ class CustomPipeline(BasePipeline):
         # ========== Step 0.5: Check template requirements ==========
         # Detect template type by filename prefix
         from pathlib import Path
-        from pixelle_video.services.frame_html import HTMLFrameGenerator
+        from pixelle_video.services.template_registry import template_registry
         from pixelle_video.utils.template_util import resolve_template_path, get_template_type
         
         template_name = Path(frame_template).name
@@ -188,8 +188,7 @@ class CustomPipeline(BasePipeline):
         
         # Read media size from template meta tags
         template_path = resolve_template_path(frame_template)
-        generator = HTMLFrameGenerator(template_path)
-        media_width, media_height = generator.get_media_size()
+        media_width, media_height = template_registry.get(template_path).get_media_size()
         logger.info(f"📐 Media size from template: {media_width}x{media_height}")
         
         if template_type == "image":
@@ -335,7 +334,7 @@ class CustomPipeline(BasePipeline):
             from pixelle_video.services.video import VideoService
             video_service = VideoService()
             
-            final_video_path = video_service.concat_videos(
+            final_video_path = await video_service.concat_videos_async(
                 videos=segment_paths,
                 output=output_path,
                 bgm_path=bgm_path,
@@ -19,10 +19,11 @@ process orchestration.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, AsyncIterator, Tuple
 from loguru import logger
 
 from pixelle_video.pipelines.base import BasePipeline
+from pixelle_video.pipelines.step_graph import PipelineStep, StepGraph
 from pixelle_video.models.storyboard import (
     Storyboard,
     VideoGenerationResult,
@@ -50,6 +51,8 @@ class PipelineContext:
     # === Content ===
     title: Optional[str] = None
     narrations: List[str] = field(default_factory=list)
+    # Set when narrations are streamed: consumed by produce_assets, which fills `narrations`
+    narration_stream: Optional[AsyncIterator[str]] = None
     
     # === Visuals ===
     image_prompts: List[Optional[str]] = field(default_factory=list)
@@ -79,8 +82,16 @@ class LinearVideoPipeline(BasePipeline):
     
     Subclasses should override specific steps to customize behavior while maintaining
     the overall workflow structure.
+    
+    Steps 1-7 run strictly in order by default. A subclass can set `steps` to a
+    sequence of PipelineStep declaring the PipelineContext fields each step reads
+    and writes; independent steps then run concurrently (see step_graph).
+    finalize always runs last.
     """
     
+    # Optional data-flow declaration of steps 1-7 (None = run in order)
+    steps: Optional[Tuple[PipelineStep, ...]] = None
+    
     async def __call__(
         self,
         text: str,
@@ -98,6 +109,11 @@ class LinearVideoPipeline(BasePipeline):
         )
         
         try:
+            if self.steps:
+                # === Phases 1-5: dependency-driven, independent steps run concurrently ===
+                await StepGraph(self.steps).run(self, ctx)
+                return await self.finalize(ctx)
+            
             # === Phase 1: Preparation ===
             await self.setup_environment(ctx)
             
@@ -27,6 +27,7 @@ import shutil
 from loguru import logger
 
 from pixelle_video.pipelines.linear import LinearVideoPipeline, PipelineContext
+from pixelle_video.pipelines.step_graph import PipelineStep
 from pixelle_video.models.progress import ProgressEvent
 from pixelle_video.models.storyboard import (
     Storyboard,
@@ -38,6 +39,7 @@ from pixelle_video.models.storyboard import (
 from pixelle_video.utils.content_generators import (
     generate_title,
     generate_narrations_from_topic,
+    stream_narrations_from_topic,
     split_narration_script,
     generate_image_prompts,
 )
@@ -48,6 +50,7 @@ from pixelle_video.utils.os_util import (
 from pixelle_video.utils.template_util import get_template_type
 from pixelle_video.utils.prompt_helper import build_image_prompt
 from pixelle_video.services.video import VideoService
+from pixelle_video.services.frame_scheduler import FrameScheduler
 
 
 
@@ -71,8 +74,38 @@ class StandardPipeline(LinearVideoPipeline):
     Supports two modes:
     - "generate": LLM generates narrations from topic
     - "fixed": Use provided script as-is (each line = one narration)
+    
+    Title generation, narration generation and task setup are independent
+    and run concurrently (see `steps`).
     """
     
+    # Data flow between lifecycle steps (PipelineContext fields read -> written)
+    steps = (
+        PipelineStep("setup_environment", inputs=("params",), outputs=("task_id", "task_dir", "final_video_path")),
+        PipelineStep("determine_title", inputs=("input_text", "params"), outputs=("title",)),
+        PipelineStep("generate_content", inputs=("input_text", "params"), outputs=("narrations", "narration_stream")),
+        PipelineStep(
+            "plan_visuals",
+            inputs=("params", "narrations", "narration_stream"),
+            outputs=("image_prompts",),
+        ),
+        PipelineStep(
+            "initialize_storyboard",
+            inputs=("params", "task_id", "title", "narrations", "narration_stream", "image_prompts"),
+            outputs=("config", "storyboard"),
+        ),
+        PipelineStep(
+            "produce_assets",
+            inputs=("config", "storyboard", "narration_stream"),
+            outputs=("storyboard", "narrations", "image_prompts", "narration_stream"),
+        ),
+        PipelineStep(
+            "post_production",
+            inputs=("params", "storyboard", "final_video_path"),
+            outputs=("storyboard", "final_video_path"),
+        ),
+    )
+    
     # ==================== Lifecycle Methods ====================
 
     async def setup_environment(self, ctx: PipelineContext):
@@ -111,7 +144,19 @@ class StandardPipeline(LinearVideoPipeline):
         min_words = ctx.params.get("min_narration_words", 5)
         max_words = ctx.params.get("max_narration_words", 20)
         
-        if mode == "generate":
+        if mode == "generate" and self._should_stream_narrations(ctx):
+            # Narrations are consumed in produce_assets: each frame starts as soon
+            # as its narration is complete, while the LLM is still writing the rest
+            self._report_progress(ctx.progress_callback, "generating_narrations", 0.05)
+            ctx.narration_stream = stream_narrations_from_topic(
+                self.llm,
+                topic=text,
+                n_scenes=n_scenes,
+                min_words=min_words,
+                max_words=max_words
+            )
+            logger.info(f"📡 Streaming {n_scenes} narrations into frame production")
+        elif mode == "generate":
             self._report_progress(ctx.progress_callback, "generating_narrations", 0.05)
             ctx.narrations = await generate_narrations_from_topic(
                 self.llm,
@@ -128,12 +173,19 @@ class StandardPipeline(LinearVideoPipeline):
             logger.info(f"✅ Split script into {len(ctx.narrations)} segments (mode={split_mode})")
             logger.info(f"   Note: n_scenes={n_scenes} is ignored in fixed mode")
 
+    @staticmethod
+    def _should_stream_narrations(ctx: PipelineContext) -> bool:
+        """Stream narrations if requested (stream_narrations param, default: llm.stream_narrations)"""
+        stream = ctx.params.get("stream_narrations")
+        if stream is None:
+            from pixelle_video.config import config_manager
+            stream = config_manager.config.llm.stream_narrations
+        return bool(stream)
+
     async def determine_title(self, ctx: PipelineContext):
         """Step 3: Determine or generate video title."""
-        # Note: Swapped order with generate_content in base class call, 
-        # but in StandardPipeline original code, title was determined BEFORE narrations.
-        # However, LinearVideoPipeline defines generate_content BEFORE determine_title.
-        # This is fine as they are independent in StandardPipeline logic.
+        # Independent of generate_content in StandardPipeline, so the two run
+        # concurrently (title is listed first in `steps`, as in the original code).
         
         title = ctx.params.get("title")
         mode = ctx.params.get("mode", "generate")
@@ -168,6 +220,12 @@ class StandardPipeline(LinearVideoPipeline):
             logger.info(f"⚡ Static template - skipping media generation pipeline")
             logger.info(f"   💡 Benefits: Faster generation + Lower cost + No ComfyUI dependency")
         
+        if ctx.narration_stream is not None:
+            # Narrations are not known yet: prompts are generated per frame in produce_assets
+            if template_requires_media:
+                logger.info("📡 Image prompts will be generated per frame as narrations arrive")
+            return
+        
         # Only generate image prompts if template requires media
         if template_requires_media:
             self._report_progress(ctx.progress_callback, "generating_image_prompts", 0.15)
@@ -254,7 +312,8 @@ class StandardPipeline(LinearVideoPipeline):
         # Create config
         ctx.config = StoryboardConfig(
             task_id=ctx.task_id,
-            n_storyboard=len(ctx.narrations), # Use actual length
+            # Use actual length (requested count when streaming; the stream enforces it)
+            n_storyboard=ctx.params.get("n_scenes", 5) if ctx.narration_stream is not None else len(ctx.narrations),
             min_narration_words=ctx.params.get("min_narration_words", 5),
             max_narration_words=ctx.params.get("max_narration_words", 20),
             min_image_prompt_words=ctx.params.get("min_image_prompt_words", 30),
@@ -289,121 +348,93 @@ class StandardPipeline(LinearVideoPipeline):
                 created_at=datetime.now()
             )
             ctx.storyboard.frames.append(frame)
+        
+        # First checkpoint: script and storyboard config, so the task can be resumed
+        await self._save_checkpoint(ctx)
 
     async def produce_assets(self, ctx: PipelineContext):
         """Step 6: Generate audio, images, and render frames (Core processing)."""
         storyboard = ctx.storyboard
         config = ctx.config
         
-        # Check if using RunningHub workflows for parallel processing
-        is_runninghub = (
-            (config.tts_workflow and config.tts_workflow.startswith("runninghub/")) or
-            (config.media_workflow and config.media_workflow.startswith("runninghub/"))
-        )
-        
-        # Get concurrent limit from config_manager (supports hot reload without restart)
-        from pixelle_video.config import config_manager
-        runninghub_concurrent_limit = config_manager.config.comfyui.runninghub_concurrent_limit or 1
-        
-        if is_runninghub and runninghub_concurrent_limit > 1:
-            logger.info(f"🚀 Using parallel processing for RunningHub workflows (max {runninghub_concurrent_limit} concurrent)")
-            
-            semaphore = asyncio.Semaphore(runninghub_concurrent_limit)
-            completed_count = 0
-            
-            async def process_frame_with_semaphore(i: int, frame: StoryboardFrame):
-                nonlocal completed_count
-                async with semaphore:
-                    base_progress = 0.2
-                    frame_range = 0.6
-                    per_frame_progress = frame_range / len(storyboard.frames)
-                    
-                    # Create frame-specific progress callback
-                    def frame_progress_callback(event: ProgressEvent):
-                        overall_progress = base_progress + (per_frame_progress * completed_count) + (per_frame_progress * event.progress)
-                        if ctx.progress_callback:
-                            adjusted_event = ProgressEvent(
-                                event_type=event.event_type,
-                                progress=overall_progress,
-                                frame_current=i+1,
-                                frame_total=len(storyboard.frames),
-                                step=event.step,
-                                action=event.action
-                            )
-                            ctx.progress_callback(adjusted_event)
-                    
-                    # Report frame start
-                    self._report_progress(
-                        ctx.progress_callback,
-                        "processing_frame",
-                        base_progress + (per_frame_progress * completed_count),
-                        frame_current=i+1,
-                        frame_total=len(storyboard.frames)
-                    )
-                    
-                    processed_frame = await self.core.frame_processor(
-                        frame=frame,
-                        storyboard=storyboard,
-                        config=config,
-                        total_frames=len(storyboard.frames),
-                        progress_callback=frame_progress_callback
-                    )
-                    
-                    completed_count += 1
-                    logger.info(f"✅ Frame {i+1} completed ({processed_frame.duration:.2f}s) [{completed_count}/{len(storyboard.frames)}]")
-                    return i, processed_frame
-            
-            # Create all tasks and execute in parallel
-            tasks = [process_frame_with_semaphore(i, frame) for i, frame in enumerate(storyboard.frames)]
-            results = await asyncio.gather(*tasks)
-            
-            # Update frames in order and calculate total duration
-            for idx, processed_frame in sorted(results, key=lambda x: x[0]):
-                storyboard.frames[idx] = processed_frame
-                storyboard.total_duration += processed_frame.duration
-            
-            logger.info(f"✅ All frames processed in parallel (total duration: {storyboard.total_duration:.2f}s)")
+        # Frames run concurrently; each step is bounded by its resource class limit
+        # (tts / media / html / ffmpeg, plus runninghub for RunningHub workflows)
+        scheduler = FrameScheduler(self.core.frame_processor)
+        if ctx.narration_stream is not None:
+            processed_frames = await self._produce_streamed_assets(ctx, scheduler)
         else:
-            # Serial processing for non-RunningHub workflows
-            logger.info("⚙️ Using serial processing (non-RunningHub workflow)")
+            # Frames restored from a checkpoint (resume) already have their segment
+            pending_frames = [frame for frame in storyboard.frames if not frame.video_segment_path]
+            if len(pending_frames) < len(storyboard.frames):
+                logger.info(f"⏭️  Reusing {len(storyboard.frames) - len(pending_frames)} frames from checkpoint")
             
-            for i, frame in enumerate(storyboard.frames):
-                base_progress = 0.2
-                frame_range = 0.6
-                per_frame_progress = frame_range / len(storyboard.frames)
-                
-                # Create frame-specific progress callback
-                def frame_progress_callback(event: ProgressEvent):
-                    overall_progress = base_progress + (per_frame_progress * i) + (per_frame_progress * event.progress)
-                    if ctx.progress_callback:
-                        adjusted_event = ProgressEvent(
-                            event_type=event.event_type,
-                            progress=overall_progress,
-                            frame_current=event.frame_current,
-                            frame_total=event.frame_total,
-                            step=event.step,
-                            action=event.action
-                        )
-                        ctx.progress_callback(adjusted_event)
-                
-                # Report frame start
-                self._report_progress(
-                    ctx.progress_callback,
-                    "processing_frame",
-                    base_progress + (per_frame_progress * i),
-                    frame_current=i+1,
-                    frame_total=len(storyboard.frames)
-                )
-                
-                processed_frame = await self.core.frame_processor(
-                    frame=frame,
-                    storyboard=storyboard,
-                    config=config,
-                    total_frames=len(storyboard.frames),
-                    progress_callback=frame_progress_callback
+            processed_frames = await scheduler.run(
+                storyboard=storyboard,
+                config=config,
+                progress_callback=ctx.progress_callback,
+                base_progress=0.2,
+                progress_range=0.6,
+                frames=pending_frames,
+                on_frame_complete=lambda frame: self._checkpoint_frame(ctx, frame)
+            )
+        
+        for processed_frame in processed_frames:
+            storyboard.frames[processed_frame.index] = processed_frame
+        storyboard.total_duration = sum(frame.duration for frame in storyboard.frames)
+        
+        logger.info(f"✅ All frames processed (total duration: {storyboard.total_duration:.2f}s)")
+
+    async def _produce_streamed_assets(self, ctx: PipelineContext, scheduler: FrameScheduler) -> List[StoryboardFrame]:
+        """
+        Feed frames to the scheduler as their narrations arrive from the LLM stream
+        
+        Image prompts (media templates only) are generated per frame, right
+        before the frame is processed.
+        """
+        frame_template = ctx.params.get("frame_template") or "1080x1920/default.html"
+        template_requires_media = get_template_type(Path(frame_template).name) in ["image", "video"]
+        
+        prompt_prefix = ctx.params.get("prompt_prefix")
+        if prompt_prefix is None:
+            prompt_prefix = self.core.config.get("comfyui", {}).get("image", {}).get("prompt_prefix", "")
+        
+        async def arriving_frames():
+            async for narration in ctx.narration_stream:
+                ctx.narrations.append(narration)
+                yield StoryboardFrame(
+                    index=len(ctx.narrations) - 1,
+                    narration=narration,
+                    image_prompt=None,
+                    created_at=datetime.now()
                 )
-                storyboard.total_duration += processed_frame.duration
-                logger.info(f"✅ Frame {i+1} completed ({processed_frame.duration:.2f}s)")
+        
+        async def prepare_frame(frame: StoryboardFrame):
+            if not template_requires_media:
+                return
+            base_prompts = await generate_image_prompts(
+                self.llm,
+                narrations=[frame.narration],
+                min_words=ctx.params.get("min_image_prompt_words", 30),
+                max_words=ctx.params.get("max_image_prompt_words", 60)
+            )
+            frame.image_prompt = build_image_prompt(base_prompts[0], prompt_prefix)
+        
+        processed_frames = await scheduler.run_stream(
+            storyboard=ctx.storyboard,
+            config=ctx.config,
+            frames=arriving_frames(),
+            total_frames=ctx.config.n_storyboard,
+            prepare_frame=prepare_frame,
+            progress_callback=ctx.progress_callback,
+            base_progress=0.2,
+            progress_range=0.6,
+            on_frame_complete=lambda frame: self._checkpoint_frame(ctx, frame)
+        )
+        
+        ctx.narration_stream = None
+        ctx.image_prompts = [frame.image_prompt for frame in processed_frames]
+        logger.info(f"✅ Streamed {len(ctx.narrations)} narrations into frame production")
+        return processed_frames
 
     async def post_production(self, ctx: PipelineContext):
         """Step 7: Concatenate videos and add BGM."""
@@ -414,7 +445,7 @@ class StandardPipeline(LinearVideoPipeline):
         
         video_service = VideoService()
         
-        final_video_path = video_service.concat_videos(
+        final_video_path = await video_service.concat_videos_async(
             videos=segment_paths,
             output=ctx.final_video_path,
             bgm_path=ctx.params.get("bgm_path"),
@@ -462,6 +493,162 @@ class StandardPipeline(LinearVideoPipeline):
         
         return result
 
+    async def handle_exception(self, ctx: PipelineContext, error: Exception):
+        """Mark checkpointed tasks as failed so they can be resumed later."""
+        await super().handle_exception(ctx, error)
+        if ctx.task_id and ctx.storyboard is not None:
+            await self.core.persistence.update_task_status(ctx.task_id, "failed", str(error))
+
+    # ==================== Resume ====================
+
+    async def resume(
+        self,
+        task_id: str,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None
+    ) -> VideoGenerationResult:
+        """
+        Resume an interrupted task from its last storyboard checkpoint
+        
+        Frames whose video segment still exists and is a valid video are
+        reused; the remaining frames are produced again, then the video is
+        concatenated as usual.
+        
+        Args:
+            task_id: ID of a task started by this pipeline
+            progress_callback: Optional progress callback
+        
+        Returns:
+            VideoGenerationResult
+        
+        Raises:
+            ValueError: If the task has no checkpoint to resume from
+        """
+        persistence = self.core.persistence
+        metadata = await persistence.load_task_metadata(task_id)
+        storyboard = await persistence.load_storyboard(task_id)
+        if not metadata or not storyboard:
+            raise ValueError(f"Task {task_id} has no checkpoint to resume from")
+        if len(storyboard.frames) < storyboard.config.n_storyboard:
+            raise ValueError(
+                f"Task {task_id} checkpoint is incomplete "
+                f"({len(storyboard.frames)}/{storyboard.config.n_storyboard} frames), start a new task instead"
+            )
+        
+        params = dict(metadata.get("input") or {})
+        text = params.pop("text", "")
+        ctx = PipelineContext(input_text=text, params=params, progress_callback=progress_callback)
+        ctx.task_id = task_id
+        ctx.task_dir = str(persistence.get_task_dir(task_id))
+        ctx.final_video_path = get_task_final_video_path(task_id)
+        ctx.title = storyboard.title
+        ctx.config = storyboard.config
+        ctx.storyboard = storyboard
+        ctx.narrations = [frame.narration for frame in storyboard.frames]
+        ctx.image_prompts = [frame.image_prompt for frame in storyboard.frames]
+        
+        logger.info(f"🔁 Resuming task {task_id} ({len(storyboard.frames)} frames)")
+        
+        try:
+            await self._validate_checkpointed_frames(ctx)
+            await self._save_checkpoint(ctx)
+            
+            await self.produce_assets(ctx)
+            await self.post_production(ctx)
+            return await self.finalize(ctx)
+        
+        except Exception as e:
+            await self.handle_exception(ctx, e)
+            raise
+
+    async def _validate_checkpointed_frames(self, ctx: PipelineContext):
+        """Reset frames whose artifacts are missing or unreadable so they are produced again."""
+        from pixelle_video.services.media_probe import media_probe
+        
+        async def is_valid_video(path: Optional[str]) -> bool:
+            if not path or not Path(path).is_file():
+                return False
+            try:
+                probe = await media_probe.probe_async(path)
+            except Exception as e:
+                logger.warning(f"Checkpointed segment is unreadable ({path}): {e}")
+                return False
+            return probe.has_video and bool(probe.duration)
+        
+        valid = await asyncio.gather(*(is_valid_video(frame.video_segment_path) for frame in ctx.storyboard.frames))
+        
+        for frame, is_valid in zip(ctx.storyboard.frames, valid):
+            if is_valid:
+                continue
+            frame.video_segment_path = None
+            frame.composed_image_path = None
+            frame.image_path = None
+            frame.video_path = None
+            frame.media_type = None
+            # Narration audio is reused when it survived (TTS is the slow part for local voices)
+            if not (frame.audio_path and Path(frame.audio_path).is_file() and frame.duration > 0):
+                frame.audio_path = None
+                frame.duration = 0.0
+        
+        pending = [frame for frame in ctx.storyboard.frames if not frame.video_segment_path]
+        logger.info(f"   {len(ctx.storyboard.frames) - len(pending)} frames reusable, {len(pending)} to produce")
+        
+        # Frames interrupted before their image prompt was generated (streamed mode)
+        frame_template = ctx.config.frame_template
+        if get_template_type(Path(frame_template).name) in ["image", "video"]:
+            missing = [frame for frame in pending if not frame.image_prompt]
+            if missing:
+                prompt_prefix = ctx.params.get("prompt_prefix")
+                if prompt_prefix is None:
+                    prompt_prefix = self.core.config.get("comfyui", {}).get("image", {}).get("prompt_prefix", "")
+                base_prompts = await generate_image_prompts(
+                    self.llm,
+                    narrations=[frame.narration for frame in missing],
+                    min_words=ctx.config.min_image_prompt_words,
+                    max_words=ctx.config.max_image_prompt_words
+                )
+                for frame, base_prompt in zip(missing, base_prompts):
+                    frame.image_prompt = build_image_prompt(base_prompt, prompt_prefix)
+                ctx.image_prompts = [frame.image_prompt for frame in ctx.storyboard.frames]
+
+    # ==================== Persistence ====================
+
+    def _build_task_input(self, ctx: PipelineContext) -> dict:
+        """Task input as stored in metadata (params plus text and title)."""
+        task_input = ctx.params.copy()
+        task_input["text"] = ctx.input_text # Ensure text is included
+        if not task_input.get("title"):
+            task_input["title"] = ctx.title
+        return task_input
+
+    async def _save_checkpoint(self, ctx: PipelineContext):
+        """
+        Save running-task metadata and the storyboard so far
+        
+        Failures are logged, not raised: a missing checkpoint only costs resumability.
+        """
+        try:
+            storyboard = ctx.storyboard
+            metadata = {
+                "task_id": ctx.task_id,
+                "created_at": storyboard.created_at.isoformat() if storyboard.created_at else None,
+                "completed_at": None,
+                "status": "running",
+                "input": self._build_task_input(ctx),
+            }
+            await self.core.persistence.save_task_metadata(ctx.task_id, metadata)
+            await self.core.persistence.save_storyboard(ctx.task_id, storyboard)
+            logger.debug(f"💾 Checkpointed task: {ctx.task_id}")
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint task {ctx.task_id}: {e}")
+
+    async def _checkpoint_frame(self, ctx: PipelineContext, frame: StoryboardFrame):
+        """Record a completed frame in the storyboard checkpoint."""
+        ctx.storyboard.frames[frame.index] = frame
+        try:
+            await self.core.persistence.save_storyboard(ctx.task_id, ctx.storyboard)
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint frame {frame.index + 1}: {e}")
+
     async def _persist_task_data(self, ctx: PipelineContext):
         """
         Persist task metadata and storyboard to filesystem
@@ -476,10 +663,7 @@ class StandardPipeline(LinearVideoPipeline):
                 return
             
             # Build metadata
-            input_with_title = ctx.params.copy()
-            input_with_title["text"] = ctx.input_text # Ensure text is included
-            if not input_with_title.get("title"):
-                input_with_title["title"] = storyboard.title
+            input_with_title = self._build_task_input(ctx)
             
             metadata = {
                 "task_id": task_id,
@@ -0,0 +1,128 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Step Graph - Dependency-driven execution of pipeline lifecycle steps
+
+Each PipelineStep names a lifecycle method and the PipelineContext fields it
+reads (inputs) and writes (outputs). Steps are listed in their sequential
+order; a step depends on every earlier step it conflicts with:
+
+- it reads a field an earlier step writes (read after write)
+- it writes a field an earlier step reads or writes (write after read/write)
+
+Steps without conflicts run concurrently, so the result is always the same
+as running the list in order, e.g. title generation and narration generation
+overlap when neither uses the other's output.
+
+Usage:
+    class MyPipeline(LinearVideoPipeline):
+        steps = (
+            PipelineStep("setup_environment", outputs=("task_id", "task_dir")),
+            PipelineStep("generate_content", inputs=("input_text",), outputs=("narrations",)),
+            PipelineStep("determine_title", inputs=("input_text",), outputs=("title",)),
+            ...
+        )
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Set, Tuple
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class PipelineStep:
+    """A lifecycle method and the PipelineContext fields it reads and writes"""
+    name: str
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+
+
+class StepGraph:
+    """
+    Runs pipeline steps as soon as the steps they depend on have finished
+
+    If a step fails, the steps still running are cancelled and the error is re-raised.
+    """
+
+    def __init__(self, steps: Sequence[PipelineStep]):
+        """
+        Initialize graph
+
+        Args:
+            steps: Steps in sequential order (dependencies point to earlier steps only)
+
+        Raises:
+            ValueError: If two steps have the same name
+        """
+        names = [step.name for step in steps]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate pipeline step names: {names}")
+
+        self.steps = list(steps)
+        self.dependencies: Dict[str, Set[str]] = {}
+        for i, step in enumerate(self.steps):
+            reads, writes = set(step.inputs), set(step.outputs)
+            self.dependencies[step.name] = {
+                earlier.name
+                for earlier in self.steps[:i]
+                if (set(earlier.outputs) & (reads | writes)) or (set(earlier.inputs) & writes)
+            }
+
+    def levels(self) -> List[List[str]]:
+        """
+        Steps grouped by depth (steps in one group can run concurrently)
+
+        Returns:
+            List of step-name groups, in execution order
+        """
+        depth: Dict[str, int] = {}
+        for step in self.steps:
+            depth[step.name] = 1 + max((depth[dep] for dep in self.dependencies[step.name]), default=-1)
+        groups: List[List[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for step in self.steps:
+            groups[depth[step.name]].append(step.name)
+        return groups
+
+    async def run(self, pipeline, ctx):
+        """
+        Run all steps on a pipeline
+
+        Args:
+            pipeline: Object with one async method per step name, each taking ctx
+            ctx: Pipeline context shared by all steps
+        """
+        logger.debug(f"Pipeline step graph: {' -> '.join(' | '.join(group) for group in self.levels())}")
+
+        pending = {step.name for step in self.steps}
+        done: Set[str] = set()
+        running: Dict[asyncio.Task, str] = {}
+
+        try:
+            while pending or running:
+                for step in self.steps:
+                    if step.name in pending and self.dependencies[step.name] <= done:
+                        pending.discard(step.name)
+                        running[asyncio.create_task(getattr(pipeline, step.name)(ctx))] = step.name
+
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    name = running.pop(task)
+                    task.result()  # Re-raise step failure
+                    done.add(name)
+        except BaseException:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            raise
@@ -221,7 +221,7 @@ class PixelleVideoCore:
     
     async def cleanup(self):
         """
-        Cleanup resources (close ComfyKit session)
+        Cleanup resources (close ComfyKit session, LLM/download clients and browser pool)
         
         Example:
             await pixelle_video.cleanup()
@@ -236,6 +236,15 @@ class PixelleVideoCore:
             finally:
                 self._comfykit = None
                 self._comfykit_config_hash = None
+        
+        if self.llm:
+            await self.llm.aclose()
+        
+        from pixelle_video.services.download_manager import close_download_manager
+        await close_download_manager()
+        
+        from pixelle_video.services.browser_pool import shutdown_browser_pool
+        shutdown_browser_pool()
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -293,7 +302,32 @@ class PixelleVideoCore:
             return await pipeline_instance(text=text, **kwargs)
         
         return generate_video_wrapper
-    
+
+    async def resume_video(
+        self,
+        task_id: str,
+        pipeline: str = "standard",
+        progress_callback=None
+    ):
+        """
+        Resume an interrupted video generation task from its checkpoint
+
+        Args:
+            task_id: Task ID (output/{task_id}/)
+            pipeline: Pipeline that started the task (must support resume)
+            progress_callback: Optional progress callback
+
+        Returns:
+            VideoGenerationResult
+
+        Example:
+            result = await pixelle_video.resume_video("20251028_143052_ab3d")
+        """
+        pipeline_instance = self.pipelines.get(pipeline)
+        if pipeline_instance is None or not hasattr(pipeline_instance, "resume"):
+            raise ValueError(f"Pipeline '{pipeline}' does not support resuming tasks")
+        return await pipeline_instance.resume(task_id, progress_callback=progress_callback)
+
     @property
     def project_name(self) -> str:
         """Get project name from config"""
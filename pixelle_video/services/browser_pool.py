@@ -0,0 +1,547 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Headless Browser Pool
+
+Keeps a small set of warm headless Chromium processes alive and drives them
+over the DevTools protocol, so HTML frames can be rendered without paying the
+browser cold start on every screenshot.
+
+Each browser is recycled after a configurable number of renders and is
+health-checked before being handed out. The pool is process-wide and
+thread-safe, so it is shared across frames, tasks and event loops.
+
+Usage:
+    from pixelle_video.services.browser_pool import get_browser_pool
+
+    pool = get_browser_pool()
+    if pool:
+        png_bytes = pool.render(html, width=1080, height=1920)
+"""
+
+import base64
+import json
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+from loguru import logger
+
+# Chrome flags for Linux headless environments
+CHROME_FLAGS = [
+    '--default-background-color=00000000',
+    '--no-sandbox',  # Bypass AppArmor/sandbox restrictions
+    '--disable-dev-shm-usage',  # Avoid shared memory issues
+    '--disable-gpu',  # Disable GPU acceleration
+    '--disable-software-rasterizer',  # Disable software rasterizer
+    '--disable-extensions',  # Disable extensions
+    '--disable-setuid-sandbox',  # Additional sandbox bypass
+    '--disable-dbus',  # Disable DBus to avoid permission errors
+    '--hide-scrollbars',  # Hide scrollbars for cleaner output
+    '--mute-audio',  # Mute audio
+    '--disable-background-networking',  # Disable background networking
+    '--allow-file-access-from-files',  # Let file:// templates load bundled file:// fonts and CSS
+    '--disable-features=TranslateUI',  # Disable translate UI
+    '--disable-ipc-flooding-protection',  # Improve performance
+    '--no-first-run',  # Skip first run dialogs
+    '--no-default-browser-check',  # Skip default browser check
+    '--disable-backgrounding-occluded-windows',  # Improve performance
+    '--disable-renderer-backgrounding',  # Improve performance
+]
+
+
+def find_chrome_executable() -> Optional[str]:
+    """
+    Find suitable Chrome/Chromium executable, preferring non-snap versions
+
+    Returns:
+        Path to Chrome executable or None to use default
+    """
+    if os.name != 'posix':
+        return None
+
+    # Preferred browsers (non-snap versions)
+    candidates = [
+        '/usr/bin/google-chrome',
+        '/usr/bin/google-chrome-stable',
+        '/usr/bin/chromium',
+        '/usr/bin/chromium-browser',
+        '/usr/local/bin/chrome',
+        '/usr/local/bin/chromium',
+    ]
+
+    # Check each candidate
+    for path in candidates:
+        if os.path.exists(path) and os.access(path, os.X_OK):
+            try:
+                # Verify it's not a snap by checking the path
+                result = subprocess.run(
+                    ['readlink', '-f', path],
+                    capture_output=True,
+                    text=True,
+                    timeout=1
+                )
+                real_path = result.stdout.strip()
+
+                if '/snap/' not in real_path:
+                    logger.info(f"✓ Found non-snap browser: {path} -> {real_path}")
+                    return path
+                else:
+                    logger.debug(f"✗ Skipping snap browser: {path}")
+            except Exception as e:
+                logger.debug(f"Error checking {path}: {e}")
+
+    # Warn if no suitable browser found
+    logger.warning(
+        "⚠️  No non-snap Chrome/Chromium found. Snap browsers have AppArmor restrictions.\n"
+        "   Install system Chrome with:\n"
+        "   wget https://dl.google.com/linux/direct/google-chrome-stable_current_amd64.deb\n"
+        "   sudo dpkg -i google-chrome-stable_current_amd64.deb\n"
+        "   Or install Chromium: sudo apt-get install -y chromium-browser"
+    )
+    return None
+
+
+def _resolve_browser_executable() -> Optional[str]:
+    """Resolve a browser executable for the pool (system lookup, then html2image's finder)"""
+    browser_path = find_chrome_executable()
+    if browser_path:
+        return browser_path
+
+    try:
+        # html2image knows the default install locations on Windows/macOS
+        from html2image.browsers.chrome import find_chrome
+        return find_chrome()
+    except Exception as e:
+        logger.debug(f"html2image could not locate Chrome: {e}")
+        return None
+
+
+class _DevToolsSession:
+    """Minimal synchronous DevTools protocol client bound to one page target"""
+
+    def __init__(self, ws_url: str, timeout: float):
+        # websocket-client is installed as a dependency of html2image
+        import websocket
+
+        self._ws = websocket.create_connection(ws_url, timeout=timeout, suppress_origin=True)
+        self._next_id = 0
+        self._events: List[dict] = []
+
+    def _recv(self, deadline: float) -> dict:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("DevTools response timed out")
+        self._ws.settimeout(remaining)
+        return json.loads(self._ws.recv())
+
+    def send(self, method: str, params: Optional[dict] = None, timeout: float = 30.0) -> dict:
+        """Send a command and wait for its result (events received meanwhile are buffered)"""
+        self._next_id += 1
+        message_id = self._next_id
+        self._ws.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+
+        deadline = time.monotonic() + timeout
+        while True:
+            message = self._recv(deadline)
+            if message.get("id") == message_id:
+                if "error" in message:
+                    raise RuntimeError(f"DevTools {method} failed: {message['error']}")
+                return message.get("result", {})
+            if "method" in message:
+                self._events.append(message)
+
+    def wait_for_event(self, method: str, timeout: float = 30.0) -> dict:
+        """Wait for an event, consuming buffered events first"""
+        for i, event in enumerate(self._events):
+            if event["method"] == method:
+                return self._events.pop(i)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            message = self._recv(deadline)
+            if message.get("method") == method:
+                return message
+
+    def clear_events(self):
+        self._events.clear()
+
+    def close(self):
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+
+class ChromiumInstance:
+    """
+    One long-lived headless Chromium process with a single reusable page
+
+    Not thread-safe by itself; the pool guarantees exclusive use.
+    """
+
+    def __init__(self, browser_path: str, timeout: float = 30.0):
+        self.browser_path = browser_path
+        self.timeout = timeout
+        self.instance_id = uuid.uuid4().hex[:8]
+        self.render_count = 0
+        self.last_health_check = 0.0
+        self._process: Optional[subprocess.Popen] = None
+        self._session: Optional[_DevToolsSession] = None
+        self._user_data_dir: Optional[str] = None
+
+    def start(self):
+        """Launch the browser and attach to its initial page"""
+        self._user_data_dir = tempfile.mkdtemp(prefix="pixelle_chromium_")
+        args = [
+            self.browser_path,
+            '--headless=new',
+            '--remote-debugging-port=0',
+            '--remote-allow-origins=*',
+            f'--user-data-dir={self._user_data_dir}',
+            *CHROME_FLAGS,
+            'about:blank',
+        ]
+        self._process = subprocess.Popen(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        port = self._wait_for_devtools_port()
+        ws_url = self._find_page_websocket(port)
+        self._session = _DevToolsSession(ws_url, self.timeout)
+        self._session.send("Page.enable", timeout=self.timeout)
+        self.last_health_check = time.monotonic()
+        logger.debug(f"Chromium instance {self.instance_id} started (pid={self._process.pid}, port={port})")
+
+    def _wait_for_devtools_port(self) -> int:
+        """Wait until Chromium writes its DevToolsActivePort file"""
+        port_file = Path(self._user_data_dir) / "DevToolsActivePort"
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Chromium exited during startup (code {self._process.returncode})")
+            if port_file.exists():
+                lines = port_file.read_text().splitlines()
+                if lines and lines[0].strip().isdigit():
+                    return int(lines[0].strip())
+            time.sleep(0.05)
+        raise TimeoutError("Chromium did not expose a DevTools port in time")
+
+    def _find_page_websocket(self, port: int) -> str:
+        """Find the websocket URL of the initial page target"""
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/list", timeout=self.timeout) as response:
+                targets = json.loads(response.read())
+            for target in targets:
+                if target.get("type") == "page" and target.get("webSocketDebuggerUrl"):
+                    return target["webSocketDebuggerUrl"]
+            time.sleep(0.05)
+        raise TimeoutError("No page target available in Chromium")
+
+    def is_alive(self) -> bool:
+        """Cheap liveness check (process still running)"""
+        return self._process is not None and self._process.poll() is None and self._session is not None
+
+    def ping(self) -> bool:
+        """Full health check: the page must answer a DevTools round trip"""
+        if not self.is_alive():
+            return False
+        try:
+            self._session.send("Runtime.evaluate", {"expression": "1"}, timeout=5)
+            self.last_health_check = time.monotonic()
+            return True
+        except Exception as e:
+            logger.debug(f"Chromium instance {self.instance_id} failed health check: {e}")
+            return False
+
+    def render(self, html: str, width: int, height: int) -> bytes:
+        """
+        Render HTML and capture a PNG of exactly width x height
+
+        Args:
+            html: HTML document
+            width: Viewport width in pixels
+            height: Viewport height in pixels
+
+        Returns:
+            PNG bytes
+        """
+        # Load through a file so relative resources and load events behave like html2image
+        html_file = Path(self._user_data_dir) / f"frame_{uuid.uuid4().hex[:16]}.html"
+        html_file.write_text(html, encoding="utf-8")
+
+        try:
+            session = self._session
+            session.send("Emulation.setDeviceMetricsOverride", {
+                "width": width,
+                "height": height,
+                "deviceScaleFactor": 1,
+                "mobile": False,
+            }, timeout=self.timeout)
+            session.send("Emulation.setDefaultBackgroundColorOverride", {
+                "color": {"r": 0, "g": 0, "b": 0, "a": 0}
+            }, timeout=self.timeout)
+
+            session.clear_events()
+            session.send("Page.navigate", {"url": html_file.as_uri()}, timeout=self.timeout)
+            session.wait_for_event("Page.loadEventFired", timeout=self.timeout)
+
+            # Web fonts may still be swapping in after the load event
+            session.send("Runtime.evaluate", {
+                "expression": "document.fonts ? document.fonts.ready.then(() => true) : true",
+                "awaitPromise": True,
+            }, timeout=self.timeout)
+
+            result = session.send("Page.captureScreenshot", {
+                "format": "png",
+                "clip": {"x": 0, "y": 0, "width": width, "height": height, "scale": 1},
+            }, timeout=self.timeout)
+
+            self.render_count += 1
+            return base64.b64decode(result["data"])
+        finally:
+            html_file.unlink(missing_ok=True)
+
+    def close(self):
+        """Terminate the browser and remove its profile directory"""
+        if self._session:
+            self._session.close()
+            self._session = None
+
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+            self._user_data_dir = None
+
+        logger.debug(f"Chromium instance {self.instance_id} closed after {self.render_count} renders")
+
+
+class BrowserPool:
+    """
+    Pool of warm headless Chromium instances
+
+    Instances are created lazily up to `size`, health-checked before reuse
+    and recycled after `max_renders` screenshots.
+    """
+
+    def __init__(
+        self,
+        browser_path: str,
+        size: int = 2,
+        max_renders: int = 200,
+        health_check_interval: float = 30.0,
+        render_timeout: float = 30.0,
+    ):
+        """
+        Initialize browser pool
+
+        Args:
+            browser_path: Chrome/Chromium executable
+            size: Maximum number of concurrent browser processes
+            max_renders: Recycle a browser after this many renders
+            health_check_interval: Seconds an idle browser may go without a DevTools ping
+            render_timeout: Timeout (seconds) for browser startup and each render
+        """
+        self.browser_path = browser_path
+        self.size = size
+        self.max_renders = max_renders
+        self.health_check_interval = health_check_interval
+        self.render_timeout = render_timeout
+
+        self._idle: "queue.LifoQueue[ChromiumInstance]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+    def _acquire(self) -> ChromiumInstance:
+        """Get a healthy instance, starting a new one if the pool is not full"""
+        deadline = time.monotonic() + self.render_timeout * 4
+        while True:
+            if self._closed:
+                raise RuntimeError("Browser pool is shut down")
+
+            try:
+                instance = self._idle.get_nowait()
+            except queue.Empty:
+                instance = None
+
+            if instance is not None:
+                if self._is_healthy(instance):
+                    return instance
+                self._discard(instance)
+                continue
+
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+
+            if can_create:
+                instance = ChromiumInstance(self.browser_path, timeout=self.render_timeout)
+                try:
+                    instance.start()
+                except Exception:
+                    instance.close()
+                    with self._lock:
+                        self._created -= 1
+                    raise
+                return instance
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Timed out waiting for a free browser")
+            try:
+                instance = self._idle.get(timeout=min(remaining, 1.0))
+            except queue.Empty:
+                continue
+            if self._is_healthy(instance):
+                return instance
+            self._discard(instance)
+
+    def _is_healthy(self, instance: ChromiumInstance) -> bool:
+        if not instance.is_alive():
+            return False
+        if time.monotonic() - instance.last_health_check >= self.health_check_interval:
+            return instance.ping()
+        return True
+
+    def _release(self, instance: ChromiumInstance, failed: bool = False):
+        """Return an instance to the pool, recycling it if needed"""
+        if failed or self._closed or instance.render_count >= self.max_renders:
+            if instance.render_count >= self.max_renders:
+                logger.debug(f"♻️  Recycling Chromium instance {instance.instance_id} after {instance.render_count} renders")
+            self._discard(instance)
+            return
+        self._idle.put(instance)
+
+    def _discard(self, instance: ChromiumInstance):
+        instance.close()
+        with self._lock:
+            self._created -= 1
+
+    def render(self, html: str, width: int, height: int) -> bytes:
+        """
+        Render HTML to PNG bytes on a pooled browser (blocking)
+
+        A failed render is retried once on a fresh browser.
+
+        Args:
+            html: HTML document
+            width: Output width in pixels
+            height: Output height in pixels
+
+        Returns:
+            PNG bytes
+        """
+        last_error: Optional[Exception] = None
+        for attempt in range(2):
+            instance = self._acquire()
+            try:
+                data = instance.render(html, width, height)
+            except Exception as e:
+                last_error = e
+                logger.warning(f"Render failed on Chromium instance {instance.instance_id} (attempt {attempt + 1}/2): {e}")
+                self._release(instance, failed=True)
+                continue
+            self._release(instance)
+            return data
+
+        raise RuntimeError(f"Browser pool render failed: {last_error}")
+
+    def shutdown(self):
+        """Close all idle browsers (busy ones are closed when released)"""
+        self._closed = True
+        while True:
+            try:
+                instance = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(instance)
+        logger.info("✅ Browser pool shut down")
+
+    def stats(self) -> dict:
+        """Pool statistics"""
+        return {
+            "size": self.size,
+            "created": self._created,
+            "idle": self._idle.qsize(),
+            "max_renders": self.max_renders,
+        }
+
+
+_browser_pool: Optional[BrowserPool] = None
+_browser_pool_unavailable = False
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> Optional[BrowserPool]:
+    """
+    Get the process-wide browser pool
+
+    Returns:
+        BrowserPool, or None if the pool is disabled in config or no browser
+        executable could be found (callers fall back to html2image)
+    """
+    global _browser_pool, _browser_pool_unavailable
+
+    from pixelle_video.config import config_manager
+    pool_config = config_manager.config.render.browser_pool
+    if not pool_config.enabled or _browser_pool_unavailable:
+        return None
+
+    with _browser_pool_lock:
+        if _browser_pool is None:
+            browser_path = _resolve_browser_executable()
+            if not browser_path:
+                logger.warning("⚠️  Browser pool disabled: no Chrome/Chromium executable found, falling back to html2image")
+                _browser_pool_unavailable = True
+                return None
+
+            _browser_pool = BrowserPool(
+                browser_path=browser_path,
+                size=pool_config.size,
+                max_renders=pool_config.max_renders,
+                health_check_interval=pool_config.health_check_interval,
+                render_timeout=pool_config.render_timeout,
+            )
+            logger.info(f"🚀 Browser pool created (size={pool_config.size}, browser={browser_path})")
+
+    return _browser_pool
+
+
+def shutdown_browser_pool():
+    """Shut down the process-wide browser pool if it was created"""
+    global _browser_pool
+
+    with _browser_pool_lock:
+        if _browser_pool is not None:
+            _browser_pool.shutdown()
+            _browser_pool = None
@@ -0,0 +1,278 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Download Manager - Shared, pooled downloads of ComfyUI/RunningHub outputs
+
+One connection-pooled httpx client per event loop (keep-alive, no TLS
+handshake per file), bounded concurrency (`concurrency.downloads`), chunked
+streaming straight to disk, retries that resume partial files with HTTP
+Range requests, and optional size/SHA-256 verification.
+
+Usage:
+    from pixelle_video.services.download_manager import get_download_manager
+
+    path = await get_download_manager().download(url, "output/task/frames/01_image.png")
+    text = await get_download_manager().fetch_text(text_url)
+"""
+
+import asyncio
+import hashlib
+import os
+import weakref
+from typing import Optional
+
+import httpx
+from loguru import logger
+
+
+class DownloadError(Exception):
+    """Raised when a download fails after all retries or fails verification"""
+    pass
+
+
+class DownloadManager:
+    """
+    Pooled, streaming, resumable downloader bound to one event loop
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, max_concurrent: int = 8, max_retries: int = 3, retry_backoff: float = 1.0):
+        """
+        Initialize
+
+        Args:
+            max_concurrent: Maximum downloads in flight
+            max_retries: Retries after the first attempt
+            retry_backoff: Base delay in seconds (doubled on every retry)
+        """
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(connect=10.0, read=60, write=60, pool=60),
+            limits=httpx.Limits(max_connections=max(1, max_concurrent) * 2, max_keepalive_connections=max(1, max_concurrent)),
+            follow_redirects=True,
+        )
+
+    async def download(
+        self,
+        url: str,
+        output_path: str,
+        expected_sha256: Optional[str] = None,
+        expected_size: Optional[int] = None,
+    ) -> str:
+        """
+        Stream a URL to a file
+
+        Data is written to "<output_path>.part" and moved into place once
+        complete and verified. Transfers interrupted during this call are
+        resumed with a Range request when the server supports it.
+
+        Args:
+            url: HTTP(S) URL
+            output_path: Destination file path
+            expected_sha256: Optional hex SHA-256 the file must match
+            expected_size: Optional size in bytes the file must match
+
+        Returns:
+            output_path
+
+        Raises:
+            DownloadError: If the download fails after all retries or fails verification
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        part_path = f"{output_path}.part"
+
+        async with self._semaphore:
+            # Only resume bytes written by this call: a leftover .part may belong to another URL
+            if os.path.exists(part_path):
+                os.unlink(part_path)
+
+            last_error: Optional[Exception] = None
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    delay = self.retry_backoff * (2 ** (attempt - 1))
+                    logger.warning(f"Retrying download ({attempt}/{self.max_retries}) in {delay:.1f}s: {url} ({last_error})")
+                    await asyncio.sleep(delay)
+                try:
+                    await self._stream_to_file(url, part_path, expected_size, expected_sha256)
+                    last_error = None
+                    break
+                except (httpx.TransportError, httpx.HTTPStatusError, DownloadError) as e:
+                    last_error = e
+                    # Client errors (other than timeout/rate limit) will not fix themselves
+                    if isinstance(e, httpx.HTTPStatusError) and 400 <= e.response.status_code < 500 \
+                            and e.response.status_code not in (408, 429):
+                        break
+
+            if last_error is not None:
+                if os.path.exists(part_path):
+                    os.unlink(part_path)
+                raise DownloadError(f"Failed to download {url}: {last_error}")
+
+        # Never write through an existing file: it may be a hard link into a cache
+        if os.path.lexists(output_path):
+            os.unlink(output_path)
+        os.replace(part_path, output_path)
+
+        logger.debug(f"Downloaded {url} -> {output_path} ({os.path.getsize(output_path)} bytes)")
+        return output_path
+
+    async def _stream_to_file(
+        self,
+        url: str,
+        part_path: str,
+        expected_size: Optional[int],
+        expected_sha256: Optional[str] = None,
+    ):
+        """One download attempt, resuming from the .part file of a previous attempt"""
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+        async with self._client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 416 and offset:
+                # Range not satisfiable: the partial file is stale or already complete
+                if self._is_complete(part_path, expected_size):
+                    if expected_sha256:
+                        digest = await asyncio.to_thread(self._hash_file, part_path)
+                        self._verify_sha256(part_path, digest, expected_sha256)
+                    return
+                os.unlink(part_path)
+                raise DownloadError("Stale partial file discarded")
+            response.raise_for_status()
+
+            # Content-Length / Content-Range count encoded bytes, but aiter_bytes() yields
+            # decoded ones, so they can only verify the size of unencoded responses
+            encoding = response.headers.get("content-encoding", "identity").strip().lower()
+            encoded = encoding not in ("", "identity")
+
+            if offset and response.status_code == 206 and encoded:
+                # A byte range of an encoded body cannot be decoded on its own
+                os.unlink(part_path)
+                raise DownloadError(f"Cannot resume {encoding}-encoded response, restarting")
+
+            if offset and response.status_code == 206:
+                mode = "ab"
+                total = self._content_range_total(response.headers.get("content-range"))
+                # Hash the bytes kept from the previous attempt, then continue with the new ones
+                digest = await asyncio.to_thread(self._hash_file, part_path) if expected_sha256 else None
+            else:
+                # Server ignored the Range header (or fresh start): rewrite from scratch
+                mode = "wb"
+                offset = 0
+                length = response.headers.get("content-length")
+                total = int(length) if length and length.isdigit() and not encoded else None
+                digest = hashlib.sha256() if expected_sha256 else None
+
+            with open(part_path, mode) as f:
+                async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                    f.write(chunk)
+                    if digest is not None:
+                        digest.update(chunk)
+
+        size = os.path.getsize(part_path)
+        expected = expected_size or total
+        if expected is not None and size != expected:
+            raise DownloadError(f"Incomplete download: {size} of {expected} bytes")
+
+        if digest is not None:
+            self._verify_sha256(part_path, digest, expected_sha256)
+
+    @staticmethod
+    def _content_range_total(content_range: Optional[str]) -> Optional[int]:
+        """Total size from a 'bytes start-end/total' header"""
+        if not content_range or "/" not in content_range:
+            return None
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+
+    @staticmethod
+    def _is_complete(part_path: str, expected_size: Optional[int]) -> bool:
+        return (
+            expected_size is not None
+            and os.path.exists(part_path)
+            and os.path.getsize(part_path) == expected_size
+        )
+
+    @staticmethod
+    def _hash_file(path: str) -> "hashlib._Hash":
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest
+
+    @staticmethod
+    def _verify_sha256(part_path: str, digest: "hashlib._Hash", expected_sha256: str):
+        """Discard the partial file (so the next attempt starts over) on a checksum mismatch"""
+        actual = digest.hexdigest()
+        if actual != expected_sha256.lower():
+            os.unlink(part_path)
+            raise DownloadError(f"Checksum mismatch: expected {expected_sha256}, got {actual}")
+
+    async def fetch_text(self, url: str) -> str:
+        """
+        Fetch a small text resource (e.g. a RunningHub .txt output) with retries
+
+        Args:
+            url: HTTP(S) URL
+
+        Returns:
+            Response body as text
+
+        Raises:
+            DownloadError: If the request fails after all retries
+        """
+        async with self._semaphore:
+            last_error: Optional[Exception] = None
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    await asyncio.sleep(self.retry_backoff * (2 ** (attempt - 1)))
+                try:
+                    response = await self._client.get(url)
+                    response.raise_for_status()
+                    return response.text
+                except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                    last_error = e
+            raise DownloadError(f"Failed to fetch {url}: {last_error}")
+
+    async def aclose(self):
+        """Close the pooled client"""
+        await self._client.aclose()
+
+
+_managers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, DownloadManager]" = weakref.WeakKeyDictionary()
+
+
+def get_download_manager() -> DownloadManager:
+    """
+    Get the download manager of the running event loop
+
+    httpx clients are bound to the loop they were created on, so each loop
+    (API server, web UI worker thread) gets its own pooled manager.
+    """
+    loop = asyncio.get_running_loop()
+    manager = _managers.get(loop)
+    if manager is None:
+        from pixelle_video.config import config_manager
+        manager = DownloadManager(max_concurrent=config_manager.config.concurrency.downloads)
+        _managers[loop] = manager
+    return manager
+
+
+async def close_download_manager():
+    """Close the download manager of the running event loop (if any)"""
+    manager = _managers.pop(asyncio.get_running_loop(), None)
+    if manager is not None:
+        await manager.aclose()
@@ -24,8 +24,13 @@ Linux Environment Requirements:
 """
 
 from math import log
+import asyncio
+import atexit
+import io
 import os
-import re
+import shutil
+import tempfile
+import threading
 import uuid
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -33,7 +38,27 @@ from html2image import Html2Image
 from loguru import logger
 from PIL import Image
 
-from pixelle_video.utils.template_util import parse_template_size
+from pixelle_video.services.browser_pool import CHROME_FLAGS, find_chrome_executable, get_browser_pool
+from pixelle_video.services.template_registry import CompiledTemplate, template_registry, tokenize_template
+
+
+_screenshot_dir: Optional[str] = None
+_screenshot_dir_lock = threading.Lock()
+
+
+def _get_screenshot_dir() -> str:
+    """
+    Process-wide temp directory for Html2Image screenshots (created once, removed at exit)
+    
+    Screenshot names are unique, so all generators share it; the shared cwd
+    is racy when frames render concurrently.
+    """
+    global _screenshot_dir
+    with _screenshot_dir_lock:
+        if _screenshot_dir is None or not os.path.isdir(_screenshot_dir):
+            _screenshot_dir = tempfile.mkdtemp(prefix="pixelle_frames_")
+            atexit.register(shutil.rmtree, _screenshot_dir, True)
+        return _screenshot_dir
 
 
 class HTMLFrameGenerator:
@@ -60,6 +85,8 @@ class HTMLFrameGenerator:
     # This is a temporary workaround until the issue is fixed in Chromium.
     CHROMIUM_HEIGHT_OFFSET = 87
     
+    _dependencies_checked = False
+    
     def __init__(self, template_path: str):
         """
         Initialize HTML frame generator
@@ -68,10 +95,13 @@ class HTMLFrameGenerator:
             template_path: Path to HTML template file (e.g., "templates/1080x1920/default.html")
         """
         self.template_path = template_path
-        self.template = self._load_template(template_path)
         
-        # Parse video size from template path
-        self.width, self.height = parse_template_size(template_path)
+        # Parsed once per (path, mtime) and shared by all generators
+        self.compiled = template_registry.get(template_path)
+        self.template = self.compiled.source
+        
+        # Video size is parsed from template path
+        self.width, self.height = self.compiled.width, self.compiled.height
         
         self.hti = None  # Lazy init to avoid overhead
         self._check_linux_dependencies()
@@ -79,9 +109,10 @@ class HTMLFrameGenerator:
     
     
     def _check_linux_dependencies(self):
-        """Check Linux system dependencies and warn if missing"""
-        if os.name != 'posix':
+        """Check Linux system dependencies and warn if missing (once per process)"""
+        if os.name != 'posix' or HTMLFrameGenerator._dependencies_checked:
             return
+        HTMLFrameGenerator._dependencies_checked = True
         
         try:
             import subprocess
@@ -114,52 +145,6 @@ class HTMLFrameGenerator:
         except Exception as e:
             logger.debug(f"Could not check fontconfig status: {e}")
     
-    def _load_template(self, template_path: str) -> str:
-        """Load HTML template from file"""
-        path = Path(template_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
-        
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        logger.debug(f"Template loaded: {len(content)} chars")
-        return content
-    
-    def _parse_media_size_from_meta(self) -> tuple[Optional[int], Optional[int]]:
-        """
-        Parse media size from meta tags in template
-        
-        Looks for meta tags:
-        - <meta name="template:media-width" content="1024">
-        - <meta name="template:media-height" content="1024">
-        
-        Returns:
-            Tuple of (width, height) or (None, None) if not found
-        """
-        from bs4 import BeautifulSoup
-        
-        try:
-            soup = BeautifulSoup(self.template, 'html.parser')
-            
-            # Find width and height meta tags
-            width_meta = soup.find('meta', attrs={'name': 'template:media-width'})
-            height_meta = soup.find('meta', attrs={'name': 'template:media-height'})
-            
-            if width_meta and height_meta:
-                width = int(width_meta.get('content', 0))
-                height = int(height_meta.get('content', 0))
-                
-                if width > 0 and height > 0:
-                    logger.debug(f"Found media size in meta tags: {width}x{height}")
-                    return width, height
-            
-            return None, None
-            
-        except Exception as e:
-            logger.warning(f"Failed to parse media size from meta tags: {e}")
-            return None, None
-    
     def get_media_size(self) -> tuple[int, int]:
         """
         Get media size for image/video generation
@@ -169,14 +154,7 @@ class HTMLFrameGenerator:
         Returns:
             Tuple of (width, height)
         """
-        media_width, media_height = self._parse_media_size_from_meta()
-        
-        if media_width and media_height:
-            return media_width, media_height
-        
-        # Fallback to default if not specified (should not happen with properly configured templates)
-        logger.warning(f"No media size meta tags found in template {self.template_path}, using fallback 1024x1024")
-        return 1024, 1024
+        return self.compiled.get_media_size()
     
     def parse_template_parameters(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -200,100 +178,14 @@ class HTMLFrameGenerator:
                 }
             }
         """
-        # Preset parameters that should be ignored (auto-injected by system)
-        PRESET_PARAMS = {'title', 'text', 'image', 'index'}
-        
-        # Pattern: {{param_name:type=default}} or {{param_name=default}} or {{param_name:type}} or {{param_name}}
-        # Param name: must start with letter or underscore, can contain letters, digits, underscores
-        PARAM_PATTERN = r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}'
-        
-        params = {}
-        
-        for match in re.finditer(PARAM_PATTERN, self.template):
-            param_name = match.group(1)
-            param_type = match.group(2) or 'text'  # Default to text
-            default_value = match.group(3)
-            
-            # Skip preset parameters
-            if param_name in PRESET_PARAMS:
-                continue
-            
-            # Skip if already parsed (use first occurrence)
-            if param_name in params:
-                continue
-            
-            # Validate type
-            if param_type not in {'text', 'number', 'color', 'bool'}:
-                logger.warning(f"Unknown parameter type '{param_type}' for '{param_name}', defaulting to 'text'")
-                param_type = 'text'
-            
-            # Parse default value based on type
-            parsed_default = self._parse_default_value(param_type, default_value)
-            
-            params[param_name] = {
-                'type': param_type,
-                'default': parsed_default,
-                'label': param_name,  # Use param name as label
-            }
-        
-        if params:
-            logger.debug(f"Parsed {len(params)} custom parameter(s) from template: {list(params.keys())}")
-        
-        return params
-    
-    def _parse_default_value(self, param_type: str, value_str: Optional[str]) -> Any:
-        """
-        Parse default value based on parameter type
-        
-        Args:
-            param_type: Type of parameter (text, number, color, bool)
-            value_str: String value to parse (can be None)
-        
-        Returns:
-            Parsed value with appropriate type
-        """
-        if value_str is None:
-            # No default value specified, return type-specific defaults
-            return {
-                'text': '',
-                'number': 0,
-                'color': '#000000',
-                'bool': False,
-            }.get(param_type, '')
-        
-        if param_type == 'number':
-            try:
-                # Try int first, then float
-                if '.' in value_str:
-                    return float(value_str)
-                else:
-                    return int(value_str)
-            except ValueError:
-                logger.warning(f"Invalid number value '{value_str}', using 0")
-                return 0
-        
-        elif param_type == 'bool':
-            # Accept: true/false, 1/0, yes/no, on/off (case-insensitive)
-            return value_str.lower() in {'true', '1', 'yes', 'on'}
-        
-        elif param_type == 'color':
-            # Auto-add # if missing
-            if value_str.startswith('#'):
-                return value_str
-            else:
-                return f'#{value_str}'
-        
-        else:  # text
-            return value_str
+        return self.compiled.get_parameters()
     
     def _replace_parameters(self, html: str, values: Dict[str, Any]) -> str:
         """
         Replace parameter placeholders with actual values
         
-        Supports DSL syntax: {{param:type=default}}
-        - If value provided in values dict, use it
-        - Otherwise, use default value from placeholder
-        - If no default, use empty string
+        The loaded template uses its pre-tokenized form (a list join);
+        any other HTML is tokenized on the fly.
         
         Args:
             html: HTML template content
@@ -302,30 +194,17 @@ class HTMLFrameGenerator:
         Returns:
             HTML with placeholders replaced
         """
-        PARAM_PATTERN = r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}'
-        
-        def replacer(match):
-            param_name = match.group(1)
-            param_type = match.group(2) or 'text'
-            default_value_str = match.group(3)
-            
-            # Check if value is provided
-            if param_name in values:
-                value = values[param_name]
-                # Convert bool to string for HTML
-                if isinstance(value, bool):
-                    return 'true' if value else 'false'
-                return str(value) if value is not None else ''
-            
-            # Use default value from placeholder if available
-            elif default_value_str:
-                return default_value_str
-            
-            # No value and no default
-            else:
-                return ''
-        
-        return re.sub(PARAM_PATTERN, replacer, html)
+        if html is self.template:
+            return self.compiled.render(values)
+        return CompiledTemplate(
+            path=self.template_path,
+            mtime_ns=0,
+            source=html,
+            tokens=tokenize_template(html),
+            width=self.width,
+            height=self.height,
+            media_size=None,
+        ).render(values)
     
     def _find_chrome_executable(self) -> Optional[str]:
         """
@@ -334,85 +213,24 @@ class HTMLFrameGenerator:
         Returns:
             Path to Chrome executable or None to use default
         """
-        if os.name != 'posix':
-            return None
-        
-        import subprocess
-        
-        # Preferred browsers (non-snap versions)
-        candidates = [
-            '/usr/bin/google-chrome',
-            '/usr/bin/google-chrome-stable',
-            '/usr/bin/chromium',
-            '/usr/bin/chromium-browser',
-            '/usr/local/bin/chrome',
-            '/usr/local/bin/chromium',
-        ]
-        
-        # Check each candidate
-        for path in candidates:
-            if os.path.exists(path) and os.access(path, os.X_OK):
-                try:
-                    # Verify it's not a snap by checking the path
-                    result = subprocess.run(
-                        ['readlink', '-f', path],
-                        capture_output=True,
-                        text=True,
-                        timeout=1
-                    )
-                    real_path = result.stdout.strip()
-                    
-                    if '/snap/' not in real_path:
-                        logger.info(f"✓ Found non-snap browser: {path} -> {real_path}")
-                        return path
-                    else:
-                        logger.debug(f"✗ Skipping snap browser: {path}")
-                except Exception as e:
-                    logger.debug(f"Error checking {path}: {e}")
-        
-        # Warn if no suitable browser found
-        logger.warning(
-            "⚠️  No non-snap Chrome/Chromium found. Snap browsers have AppArmor restrictions.\n"
-            "   Install system Chrome with:\n"
-            "   wget https://dl.google.com/linux/direct/google-chrome-stable_current_amd64.deb\n"
-            "   sudo dpkg -i google-chrome-stable_current_amd64.deb\n"
-            "   Or install Chromium: sudo apt-get install -y chromium-browser"
-        )
-        return None
+        return find_chrome_executable()
     
     def _ensure_hti(self, width: int, height: int):
         """Lazily initialize Html2Image instance"""
         if self.hti is None:
             # Configure Chrome flags for Linux headless environment
-            custom_flags = [
-                '--default-background-color=00000000',
-                '--no-sandbox',  # Bypass AppArmor/sandbox restrictions
-                '--disable-dev-shm-usage',  # Avoid shared memory issues
-                '--disable-gpu',  # Disable GPU acceleration
-                '--disable-software-rasterizer',  # Disable software rasterizer
-                '--disable-extensions',  # Disable extensions
-                '--disable-setuid-sandbox',  # Additional sandbox bypass
-                '--disable-dbus',  # Disable DBus to avoid permission errors
-                '--hide-scrollbars',  # Hide scrollbars for cleaner output
-                '--mute-audio',  # Mute audio
-                '--disable-background-networking',  # Disable background networking
-                '--disable-features=TranslateUI',  # Disable translate UI
-                '--disable-ipc-flooding-protection',  # Improve performance
-                '--no-first-run',  # Skip first run dialogs
-                '--no-default-browser-check',  # Skip default browser check
-                '--disable-backgrounding-occluded-windows',  # Improve performance
-                '--disable-renderer-backgrounding',  # Improve performance
-            ]
+            custom_flags = list(CHROME_FLAGS)
             
             # Try to find non-snap browser
             browser_path = self._find_chrome_executable()
             
             # Workaround: Add extra height to compensate for Chromium screenshot cropping bug
-            # The extra pixels will be cropped back in generate_frame() after rendering
+            # The extra pixels will be cropped back in _render_with_html2image() after rendering
             # See CHROMIUM_HEIGHT_OFFSET constant for details
             kwargs = {
                 'size': (width, height + self.CHROMIUM_HEIGHT_OFFSET),
-                'custom_flags': custom_flags
+                'custom_flags': custom_flags,
+                'output_path': _get_screenshot_dir(),
             }
             
             if browser_path:
@@ -425,29 +243,14 @@ class HTMLFrameGenerator:
             else:
                 logger.debug(f"Initialized Html2Image with size ({width}, {height}) and {len(custom_flags)} custom flags")
     
-    async def generate_frame(
+    def _build_html(
         self,
         title: str,
         text: str,
         image: str,
-        ext: Optional[Dict[str, Any]] = None,
-        output_path: Optional[str] = None
+        ext: Optional[Dict[str, Any]] = None
     ) -> str:
-        """
-        Generate frame from HTML template
-        
-        Video size is automatically determined from template path during initialization.
-        
-        Args:
-            title: Video title
-            text: Narration text for this frame
-            image: Path to AI-generated image (supports relative path, absolute path, or HTTP URL)
-            ext: Additional data (content_title, content_author, etc.)
-            output_path: Custom output path (auto-generated if None)
-        
-        Returns:
-            Path to generated frame image
-        """
+        """Build the final HTML of a frame (variable substitution)"""
         # Convert image path to absolute path or file:// URL for html2image
         if image and not image.startswith(('http://', 'https://', 'data:', 'file://')):
             # Local file path - convert to absolute path and file:// URL
@@ -477,7 +280,102 @@ class HTMLFrameGenerator:
             context.update(ext)
         
         # Replace variables in HTML (supports DSL syntax: {{param:type=default}})
-        html = self._replace_parameters(self.template, context)
+        return self._replace_parameters(self.template, context)
+    
+    def _render_with_html2image(self, html: str) -> bytes:
+        """
+        Render HTML with Html2Image (fallback when the browser pool is unavailable)
+        
+        Screenshots go to a process-wide temp directory (never the shared cwd),
+        are cropped in memory and deleted right away.
+        
+        Returns:
+            PNG bytes of exactly (width, height)
+        """
+        screenshot_name = f"frame_{uuid.uuid4().hex[:16]}.png"
+        screenshot_path = os.path.join(self.hti.output_path, screenshot_name)
+        try:
+            self.hti.screenshot(html_str=html, save_as=screenshot_name)
+            
+            # Workaround: Crop image to remove extra height added to compensate for Chromium bug
+            # Chromium screenshots are cropped at the bottom, so we render with extra height
+            # and then crop it back to the desired size. See CHROMIUM_HEIGHT_OFFSET constant.
+            # Reference: https://issues.chromium.org/issues/405165895
+            with Image.open(screenshot_path) as img:
+                cropped_img = img.crop((0, 0, self.width, self.height))
+                buffer = io.BytesIO()
+                cropped_img.save(buffer, format="PNG")
+            return buffer.getvalue()
+        finally:
+            if os.path.exists(screenshot_path):
+                os.unlink(screenshot_path)
+    
+    async def render_frame_bytes(
+        self,
+        title: str,
+        text: str,
+        image: str,
+        ext: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Render a frame to PNG bytes in memory
+        
+        Uses the shared browser pool (screenshot clipped to the template size),
+        falling back to Html2Image. Nothing is written to the working directory.
+        
+        Args:
+            title: Video title
+            text: Narration text for this frame
+            image: Path to AI-generated image (supports relative path, absolute path, or HTTP URL)
+            ext: Additional data (content_title, content_author, etc.)
+        
+        Returns:
+            PNG bytes of size (width, height)
+        """
+        html = self._build_html(title, text, image, ext)
+        
+        # Prefer the shared pool of warm browsers (no Chromium cold start per frame)
+        pool = get_browser_pool()
+        if pool is not None:
+            logger.debug(f"Rendering HTML template on browser pool (size: {self.width}x{self.height})")
+            try:
+                return await asyncio.to_thread(pool.render, html, self.width, self.height)
+            except Exception as e:
+                logger.warning(f"Browser pool render failed, falling back to html2image: {e}")
+        
+        logger.debug(f"Rendering HTML template with html2image (size: {self.width}x{self.height})")
+        try:
+            # Initialize on the event loop thread so concurrent renders share one instance
+            self._ensure_hti(self.width, self.height)
+            return await asyncio.to_thread(self._render_with_html2image, html)
+        except Exception as e:
+            logger.error(f"Failed to render HTML template: {e}")
+            raise RuntimeError(f"HTML rendering failed: {e}")
+    
+    async def generate_frame(
+        self,
+        title: str,
+        text: str,
+        image: str,
+        ext: Optional[Dict[str, Any]] = None,
+        output_path: Optional[str] = None
+    ) -> str:
+        """
+        Generate frame from HTML template
+        
+        Video size is automatically determined from template path during initialization.
+        The frame is rendered in memory and written to disk exactly once.
+        
+        Args:
+            title: Video title
+            text: Narration text for this frame
+            image: Path to AI-generated image (supports relative path, absolute path, or HTTP URL)
+            ext: Additional data (content_title, content_author, etc.)
+            output_path: Custom output path (auto-generated if None)
+        
+        Returns:
+            Path to generated frame image
+        """
         # Use provided output path or auto-generate
         if output_path is None:
             # Fallback: auto-generate (for backward compatibility)
@@ -486,47 +384,13 @@ class HTMLFrameGenerator:
             output_path = get_output_path(output_filename)
         else:
             # Ensure parent directory exists
-            import os
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        # Extract filename from output_path for html2image
-        import os
-        output_filename = os.path.basename(output_path)
-        output_dir = os.path.dirname(output_path)
+        png_bytes = await self.render_frame_bytes(title, text, image, ext)
         
-        # Ensure Html2Image is initialized with template's size
-        self._ensure_hti(self.width, self.height)
+        with open(output_path, 'wb') as f:
+            f.write(png_bytes)
         
-        # Render HTML to image
-        logger.debug(f"Rendering HTML template to {output_path} (size: {self.width}x{self.height})")
-        try:
-            self.hti.screenshot(
-                html_str=html,
-                save_as=output_filename
-            )
-            
-            # html2image saves to current directory by default, move to target directory
-            import shutil
-            temp_file = os.path.join(os.getcwd(), output_filename)
-            if os.path.exists(temp_file) and temp_file != output_path:
-                shutil.move(temp_file, output_path)
-            
-            # Workaround: Crop image to remove extra height added to compensate for Chromium bug
-            # Chromium screenshots are cropped at the bottom, so we render with extra height
-            # and then crop it back to the desired size. See CHROMIUM_HEIGHT_OFFSET constant.
-            # Reference: https://issues.chromium.org/issues/405165895
-            if os.path.exists(output_path):
-                with Image.open(output_path) as img:
-                    # Crop from (0, 0) to (originWidth, originHeight)
-                    # This removes the extra CHROMIUM_HEIGHT_OFFSET pixels added during rendering
-                    cropped_img = img.crop((0, 0, self.width, self.height))
-                    cropped_img.save(output_path)
-                    logger.debug(f"Cropped image to size: {self.width}x{self.height} (removed {self.CHROMIUM_HEIGHT_OFFSET}px workaround offset)")
-            
-            logger.info(f"✅ Frame generated: {output_path}")
-            return output_path
-            
-        except Exception as e:
-            logger.error(f"Failed to render HTML template: {e}")
-            raise RuntimeError(f"HTML rendering failed: {e}")
+        logger.info(f"✅ Frame generated: {output_path}")
+        return output_path
 
@@ -22,11 +22,12 @@ Key Feature:
 
 from typing import Callable, Optional
 
-import httpx
 from loguru import logger
 
 from pixelle_video.models.progress import ProgressEvent
 from pixelle_video.models.storyboard import Storyboard, StoryboardFrame, StoryboardConfig
+from pixelle_video.services.frame_scheduler import get_resource_limiter, is_runninghub_workflow
+from pixelle_video.services.media_probe import media_probe
 
 
 class FrameProcessor:
@@ -139,7 +140,8 @@ class FrameProcessor:
                     action="video"
                 ))
             
-            await self._step_create_video_segment(frame, config)
+            async with get_resource_limiter().slot("ffmpeg"):
+                await self._step_create_video_segment(frame, config)
             
             logger.info(f"✅ Frame {frame.index} completed")
             return frame
@@ -185,7 +187,9 @@ class FrameProcessor:
             if config.ref_audio:
                 tts_params["ref_audio"] = config.ref_audio
         
-        audio_path = await self.core.tts(**tts_params)
+        limiter = get_resource_limiter()
+        async with limiter.slot("tts", runninghub=is_runninghub_workflow(tts_params.get("workflow"))):
+            audio_path = await self.core.tts(**tts_params)
         
         frame.audio_path = audio_path
         
@@ -210,6 +214,8 @@ class FrameProcessor:
         
         logger.debug(f"  → Media type: {media_type} (workflow: {workflow_name})")
         
+        from pixelle_video.utils.os_util import get_task_frame_path
+        
         # Build media generation parameters
         media_params = {
             "prompt": frame.image_prompt,
@@ -218,6 +224,8 @@ class FrameProcessor:
             "width": config.media_width,
             "height": config.media_height,
             "index": frame.index + 1,  # 1-based index for workflow
+            # Saved straight into the task folder (and served from the media cache when possible)
+            "output_path": get_task_frame_path(config.task_id, frame.index, media_type),
         }
         
         # For video workflows: pass audio duration as target video duration
@@ -227,30 +235,22 @@ class FrameProcessor:
             logger.info(f"  → Generating video with target duration: {frame.duration:.2f}s (from TTS audio)")
         
         # Call Media generation
-        media_result = await self.core.media(**media_params)
+        limiter = get_resource_limiter()
+        async with limiter.slot("media", runninghub=is_runninghub_workflow(config.media_workflow)):
+            media_result = await self.core.media(**media_params)
         
         # Store media type
         frame.media_type = media_result.media_type
         
         if media_result.is_image:
-            # Download image to local (pass task_id)
-            local_path = await self._download_media(
-                media_result.url,
-                frame.index,
-                config.task_id,
-                media_type="image"
-            )
+            # MediaService already saved the image to the task folder
+            local_path = media_result.url
             frame.image_path = local_path
             logger.debug(f"  ✓ Image generated: {local_path}")
         
         elif media_result.is_video:
-            # Download video to local (pass task_id)
-            local_path = await self._download_media(
-                media_result.url,
-                frame.index,
-                config.task_id,
-                media_type="video"
-            )
+            # MediaService already saved the video to the task folder
+            local_path = media_result.url
             frame.video_path = local_path
             
             # Update duration from video if available
@@ -281,7 +281,8 @@ class FrameProcessor:
         # For video type: render HTML as transparent overlay image
         # For image type: render HTML with image background
         # In both cases, we need the composed image
-        composed_path = await self._compose_frame_html(frame, storyboard, config, output_path)
+        async with get_resource_limiter().slot("html"):
+            composed_path = await self._compose_frame_html(frame, storyboard, config, output_path)
         
         frame.composed_image_path = composed_path
         
@@ -347,41 +348,27 @@ class FrameProcessor:
         
         # Branch based on media type
         if frame.media_type == "video":
-            # Video workflow: overlay HTML template on video, then add audio
+            # Video workflow: overlay HTML template on video and add audio
             logger.debug(f"  → Using video-based composition with HTML overlay")
             
-            # Step 1: Overlay transparent HTML image on video
-            # The composed_image_path contains the rendered HTML with transparent background
-            temp_video_with_overlay = get_task_frame_path(config.task_id, frame.index, "video") + "_overlay.mp4"
-            
-            video_service.overlay_image_on_video(
+            # Overlay the transparent HTML render, replace the audio with the narration and
+            # pad/trim to the narration length - all in one FFmpeg pass
+            segment_path = await video_service.build_video_segment_async(
                 video=frame.video_path,
                 overlay_image=frame.composed_image_path,
-                output=temp_video_with_overlay,
-                scale_mode="contain"  # Scale video to fit template size (contain mode)
-            )
-            
-            # Step 2: Add narration audio to the overlaid video
-            # Note: The video might have audio (replaced) or be silent (audio added)
-            segment_path = video_service.merge_audio_video(
-                video=temp_video_with_overlay,
                 audio=frame.audio_path,
                 output=output_path,
-                replace_audio=True,  # Replace video audio with narration
-                audio_volume=1.0
+                scale_mode="contain",  # Scale video to fit template size (contain mode)
+                pad_strategy="freeze",
+                fps=config.video_fps  # Same fps as image segments, so concat stays lossless
             )
-            
-            # Clean up temp file
-            import os
-            if os.path.exists(temp_video_with_overlay):
-                os.unlink(temp_video_with_overlay)
         
         elif frame.media_type == "image" or frame.media_type is None:
             # Image workflow: Use composed image directly
             # The asset_default.html template includes the image in the composition
             logger.debug(f"  → Using image-based composition")
             
-            segment_path = video_service.create_video_from_image(
+            segment_path = await video_service.create_video_from_image_async(
                 image=frame.composed_image_path,
                 audio=frame.audio_path,
                 output=output_path,
@@ -398,11 +385,8 @@ class FrameProcessor:
     async def _get_audio_duration(self, audio_path: str) -> float:
         """Get audio duration in seconds"""
         try:
-            # Try using ffmpeg-python
-            import ffmpeg
-            probe = ffmpeg.probe(audio_path)
-            duration = float(probe['format']['duration'])
-            return duration
+            # Shared probe cache: later steps reuse this result for the same file
+            return float((await media_probe.probe_async(audio_path)).duration)
         except Exception as e:
             logger.warning(f"Failed to get audio duration: {e}, using estimate")
             # Fallback: estimate based on file size (very rough)
@@ -412,34 +396,10 @@ class FrameProcessor:
             estimated_duration = file_size / 2000
             return max(1.0, estimated_duration)  # At least 1 second
     
-    async def _download_media(
-        self,
-        url: str,
-        frame_index: int,
-        task_id: str,
-        media_type: str
-    ) -> str:
-        """Download media (image or video) from URL to local file"""
-        from pixelle_video.utils.os_util import get_task_frame_path
-        output_path = get_task_frame_path(task_id, frame_index, media_type)
-        
-        timeout = httpx.Timeout(connect=10.0, read=60, write=60, pool=60)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
-        
-        return output_path
-    
     async def _get_video_duration(self, video_path: str) -> float:
         """Get video duration in seconds"""
         try:
-            import ffmpeg
-            probe = ffmpeg.probe(video_path)
-            duration = float(probe['format']['duration'])
-            return duration
+            return float((await media_probe.probe_async(video_path)).duration)
         except Exception as e:
             logger.warning(f"Failed to get video duration: {e}, using audio duration")
             # Fallback: use audio duration if available
@@ -0,0 +1,312 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Frame scheduler - Parallel frame production with per-resource concurrency limits
+
+Frames are processed concurrently (up to `concurrency.frames` in flight), while
+each step of FrameProcessor holds a slot of its resource class:
+
+- tts: speech synthesis
+- media: image/video generation
+- html: HTML frame rendering
+- ffmpeg: video segment encoding
+
+TTS and media steps using RunningHub workflows hold a `runninghub` slot
+instead, limited by `comfyui.runninghub_concurrent_limit`.
+
+This lets TTS for frame N+1 overlap with encoding of frame N, instead of
+running every step of every frame strictly in sequence. With run_stream(),
+frames can also be fed while they are still being generated (e.g. narrations
+streamed from the LLM).
+"""
+
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from pixelle_video.models.progress import ProgressEvent
+from pixelle_video.models.storyboard import Storyboard, StoryboardConfig, StoryboardFrame
+
+
+def is_runninghub_workflow(workflow: Optional[str]) -> bool:
+    """Check whether a workflow runs on RunningHub"""
+    return bool(workflow and workflow.startswith("runninghub/"))
+
+
+def _get_configured_limits() -> Dict[str, int]:
+    """Read resource limits from config_manager (supports hot reload)"""
+    from pixelle_video.config import config_manager
+
+    concurrency = config_manager.config.concurrency
+    return {
+        "tts": concurrency.tts,
+        "media": concurrency.media,
+        "html": concurrency.html,
+        "ffmpeg": concurrency.ffmpeg,
+        "runninghub": config_manager.config.comfyui.runninghub_concurrent_limit or 1,
+    }
+
+
+class ResourceLimiter:
+    """
+    Per-resource-class semaphores bound to one event loop
+
+    Limits are re-read from config on every acquire; when they change the
+    semaphores are replaced (slots already held are released to the old ones).
+    """
+
+    def __init__(self):
+        self._limits: Dict[str, int] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_semaphore(self, resource: str) -> asyncio.Semaphore:
+        limits = _get_configured_limits()
+        if limits != self._limits:
+            if self._limits:
+                logger.info(f"🔧 Resource limits changed: {limits}")
+            self._limits = limits
+            self._semaphores = {name: asyncio.Semaphore(limit) for name, limit in limits.items()}
+        return self._semaphores[resource]
+
+    @asynccontextmanager
+    async def slot(self, resource: str, runninghub: bool = False):
+        """
+        Hold a slot of a resource class
+
+        Args:
+            resource: One of "tts", "media", "html", "ffmpeg"
+            runninghub: Hold a RunningHub slot instead (for runninghub/ workflows)
+
+        Example:
+            async with get_resource_limiter().slot("ffmpeg"):
+                ...
+        """
+        # RunningHub capacity is remote, so its own limit replaces the local one
+        semaphore = self._get_semaphore("runninghub" if runninghub else resource)
+        async with semaphore:
+            yield
+
+    def limits(self) -> Dict[str, int]:
+        """Current limits (empty until first use)"""
+        return dict(self._limits)
+
+
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ResourceLimiter]" = weakref.WeakKeyDictionary()
+
+
+def get_resource_limiter() -> ResourceLimiter:
+    """
+    Get the resource limiter of the running event loop
+
+    All tasks running on the same loop (e.g. the API server) share the limits.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = ResourceLimiter()
+        _limiters[loop] = limiter
+    return limiter
+
+
+class FrameScheduler:
+    """
+    Run FrameProcessor over all storyboard frames concurrently
+
+    Results keep storyboard order. If one frame fails, the remaining
+    frames are cancelled and the error is re-raised.
+    """
+
+    def __init__(self, frame_processor, max_in_flight: Optional[int] = None):
+        """
+        Initialize
+
+        Args:
+            frame_processor: FrameProcessor instance
+            max_in_flight: Maximum frames processed at once (default: concurrency.frames)
+        """
+        if max_in_flight is None:
+            from pixelle_video.config import config_manager
+            max_in_flight = config_manager.config.concurrency.frames
+
+        self.frame_processor = frame_processor
+        self.max_in_flight = max(1, max_in_flight)
+
+    async def run(
+        self,
+        storyboard: Storyboard,
+        config: StoryboardConfig,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        base_progress: float = 0.2,
+        progress_range: float = 0.6,
+        frames: Optional[List[StoryboardFrame]] = None,
+        on_frame_complete: Optional[Callable[[StoryboardFrame], Awaitable[None]]] = None,
+    ) -> List[StoryboardFrame]:
+        """
+        Process all frames of a storyboard
+
+        Args:
+            storyboard: Storyboard whose frames will be processed
+            config: Storyboard configuration
+            progress_callback: Optional pipeline progress callback
+            base_progress: Overall progress when frame production starts
+            progress_range: Share of overall progress covered by frame production
+            frames: Subset of storyboard frames to process (default: all, e.g. fewer on resume)
+            on_frame_complete: Optional async hook run after each frame completes
+                               (e.g. to checkpoint the storyboard)
+
+        Returns:
+            Processed frames, in storyboard order
+        """
+        if frames is None:
+            frames = storyboard.frames
+        if not frames:
+            return []
+
+        async def existing_frames():
+            for frame in frames:
+                yield frame
+
+        return await self._run(
+            storyboard, config, existing_frames(), len(frames),
+            None, progress_callback, base_progress, progress_range, on_frame_complete
+        )
+
+    async def run_stream(
+        self,
+        storyboard: Storyboard,
+        config: StoryboardConfig,
+        frames: AsyncIterable[StoryboardFrame],
+        total_frames: int,
+        prepare_frame: Optional[Callable[[StoryboardFrame], Awaitable[None]]] = None,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        base_progress: float = 0.2,
+        progress_range: float = 0.6,
+        on_frame_complete: Optional[Callable[[StoryboardFrame], Awaitable[None]]] = None,
+    ) -> List[StoryboardFrame]:
+        """
+        Process frames as they arrive (e.g. from a streamed LLM response)
+
+        Each frame is appended to storyboard.frames and scheduled as soon as the
+        iterator yields it, so early frames are produced while later ones are
+        still being written. A failure in the iterator cancels the frames in flight.
+
+        Args:
+            storyboard: Storyboard the arriving frames belong to
+            config: Storyboard configuration
+            frames: Async iterator of new frames, in order
+            total_frames: Expected number of frames (for progress reporting)
+            prepare_frame: Optional async hook run on each frame before processing
+                           (e.g. to generate its image prompt)
+            progress_callback: Optional pipeline progress callback
+            base_progress: Overall progress when frame production starts
+            progress_range: Share of overall progress covered by frame production
+            on_frame_complete: Optional async hook run after each frame completes
+
+        Returns:
+            Processed frames, in arrival order
+        """
+        async def arriving_frames():
+            async for frame in frames:
+                storyboard.frames.append(frame)
+                yield frame
+
+        return await self._run(
+            storyboard, config, arriving_frames(), max(1, total_frames),
+            prepare_frame, progress_callback, base_progress, progress_range, on_frame_complete
+        )
+
+    async def _run(
+        self,
+        storyboard: Storyboard,
+        config: StoryboardConfig,
+        frames: AsyncIterable[StoryboardFrame],
+        total: int,
+        prepare_frame: Optional[Callable[[StoryboardFrame], Awaitable[None]]],
+        progress_callback: Optional[Callable[[ProgressEvent], None]],
+        base_progress: float,
+        progress_range: float,
+        on_frame_complete: Optional[Callable[[StoryboardFrame], Awaitable[None]]] = None,
+    ) -> List[StoryboardFrame]:
+        """Schedule each frame as the iterator yields it and collect results in order"""
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        per_frame_progress = progress_range / total
+        completed_count = 0
+
+        logger.info(f"🚀 Processing {total} frames (max {self.max_in_flight} in flight)")
+
+        def report(event_type: str, progress: float, **kwargs):
+            if progress_callback:
+                progress_callback(ProgressEvent(
+                    event_type=event_type,
+                    progress=min(progress, 1.0),
+                    **kwargs
+                ))
+
+        async def process(i: int, frame: StoryboardFrame) -> Tuple[int, StoryboardFrame]:
+            nonlocal completed_count
+            async with semaphore:
+                def frame_progress_callback(event: ProgressEvent):
+                    report(
+                        event.event_type,
+                        base_progress + per_frame_progress * completed_count + per_frame_progress * event.progress,
+                        frame_current=i + 1,
+                        frame_total=total,
+                        step=event.step,
+                        action=event.action,
+                    )
+
+                report(
+                    "processing_frame",
+                    base_progress + per_frame_progress * completed_count,
+                    frame_current=i + 1,
+                    frame_total=total,
+                )
+
+                if prepare_frame is not None:
+                    await prepare_frame(frame)
+
+                processed_frame = await self.frame_processor(
+                    frame=frame,
+                    storyboard=storyboard,
+                    config=config,
+                    total_frames=total,
+                    progress_callback=frame_progress_callback
+                )
+
+                completed_count += 1
+                logger.info(f"✅ Frame {processed_frame.index + 1} completed ({processed_frame.duration:.2f}s) [{completed_count}/{total}]")
+
+                if on_frame_complete is not None:
+                    await on_frame_complete(processed_frame)
+                return i, processed_frame
+
+        tasks = []
+        try:
+            async for frame in frames:
+                # Fail fast: stop consuming the source once a frame has failed
+                for task in tasks:
+                    if task.done() and not task.cancelled() and task.exception():
+                        raise task.exception()
+                tasks.append(asyncio.create_task(process(len(tasks), frame)))
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return [frame for _, frame in sorted(results, key=lambda x: x[0])]
@@ -16,10 +16,14 @@ LLM (Large Language Model) Service - Direct OpenAI SDK implementation
 Supports structured output via response_type parameter (Pydantic model).
 """
 
+import asyncio
 import json
 import re
-from typing import Optional, Type, TypeVar, Union
+import weakref
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Optional, Tuple, Type, TypeVar, Union
 
+import httpx
 from openai import AsyncOpenAI
 from pydantic import BaseModel
 from loguru import logger
@@ -28,6 +32,33 @@ from loguru import logger
 T = TypeVar("T", bound=BaseModel)
 
 
+_llm_cache = None
+
+
+def get_llm_cache():
+    """
+    Get the process-wide LLM response cache
+    
+    Returns:
+        LLMResponseCache, or None if disabled via cache.llm.enabled (opt-in)
+    """
+    global _llm_cache
+    
+    from pixelle_video.config import config_manager
+    cache_config = config_manager.config.cache.llm
+    if not cache_config.enabled:
+        return None
+    
+    if _llm_cache is None:
+        from pixelle_video.utils.llm_cache import LLMResponseCache
+        _llm_cache = LLMResponseCache(ttl_hours=cache_config.ttl_hours, max_size_mb=cache_config.max_size_mb)
+    else:
+        # Pick up changes from config hot reload
+        _llm_cache.ttl_seconds = cache_config.ttl_hours * 3600
+        _llm_cache.max_size_bytes = int(cache_config.max_size_mb * 1024 * 1024)
+    return _llm_cache
+
+
 class LLMService:
     """
     LLM (Large Language Model) service
@@ -55,6 +86,9 @@ class LLMService:
         )
     """
     
+    # Maximum pooled clients kept per event loop (default + per-call overrides)
+    MAX_CACHED_CLIENTS = 8
+    
     def __init__(self, config: dict):
         """
         Initialize LLM service
@@ -64,7 +98,11 @@ class LLMService:
         """
         # Note: We no longer cache config here to support hot reload
         # Config is read dynamically from config_manager in _get_config_value()
-        self._client: Optional[AsyncOpenAI] = None
+        
+        # Pooled clients per event loop (httpx pools are loop-bound),
+        # keyed on (api_key, base_url); flushed when the LLM config changes
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict[Tuple[str, Optional[str]], AsyncOpenAI]]" = weakref.WeakKeyDictionary()
+        self._clients_config: Optional[Tuple] = None
     
     def _get_config_value(self, key: str, default=None):
         """
@@ -108,13 +146,79 @@ class LLMService:
             or self._get_config_value("base_url")
         )
         
-        # Create client
-        client_kwargs = {"api_key": final_api_key}
+        # Create client with a keep-alive connection pool
+        client_kwargs = {
+            "api_key": final_api_key,
+            "http_client": httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self._get_config_value("max_connections", 20),
+                    max_keepalive_connections=self._get_config_value("max_keepalive_connections", 10),
+                ),
+                timeout=self._get_config_value("timeout", 600),
+                follow_redirects=True,
+            ),
+        }
         if final_base_url:
             client_kwargs["base_url"] = final_base_url
         
         return AsyncOpenAI(**client_kwargs)
     
+    def _get_client(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+    ) -> AsyncOpenAI:
+        """
+        Get a pooled OpenAI client (created on first use)
+        
+        Clients are cached per event loop and keyed on (api_key, base_url), so
+        per-call overrides get their own pooled client without discarding the
+        default one. The cache is flushed when the LLM config changes.
+        
+        Args:
+            api_key: API key (optional, uses config if not provided)
+            base_url: Base URL (optional, uses config if not provided)
+        
+        Returns:
+            AsyncOpenAI client instance
+        """
+        from pixelle_video.config import config_manager
+        
+        llm_config = config_manager.config.llm
+        config_key = tuple(sorted(llm_config.model_dump(exclude={"model", "stream_narrations"}).items()))
+        if config_key != self._clients_config:
+            if self._clients_config is not None:
+                logger.info("🔄 LLM config changed, rebuilding client pool")
+                # Old clients are only dropped, not closed: concurrent calls may still be
+                # using them, and their connections are released once they are collected
+                self._clients = weakref.WeakKeyDictionary()
+            self._clients_config = config_key
+        
+        loop = asyncio.get_running_loop()
+        clients = self._clients.get(loop)
+        if clients is None:
+            clients = OrderedDict()
+            self._clients[loop] = clients
+        
+        key = (api_key or "", base_url or None)
+        client = clients.get(key)
+        if client is None:
+            client = self._create_client(api_key=api_key, base_url=base_url)
+            clients[key] = client
+            # Bound the number of pools kept for per-call overrides (dropped, not
+            # closed, for the same reason as above)
+            while len(clients) > self.MAX_CACHED_CLIENTS:
+                clients.popitem(last=False)
+        else:
+            clients.move_to_end(key)
+        return client
+    
+    async def aclose(self):
+        """Close all pooled clients of the running event loop"""
+        clients = self._clients.pop(asyncio.get_running_loop(), None)
+        if clients:
+            await asyncio.gather(*(client.close() for client in clients.values()), return_exceptions=True)
+    
     async def __call__(
         self,
         prompt: str,
@@ -124,6 +228,8 @@ class LLMService:
         temperature: float = 0.7,
         max_tokens: int = 2000,
         response_type: Optional[Type[T]] = None,
+        use_cache: bool = True,
+        validate: Optional[Callable[[str], bool]] = None,
         **kwargs
     ) -> Union[str, T]:
         """
@@ -138,6 +244,11 @@ class LLMService:
             max_tokens: Maximum tokens to generate
             response_type: Optional Pydantic model class for structured output.
                           If provided, returns parsed model instance instead of string.
+            use_cache: Reuse a cached response for an identical request (when cache.llm is
+                       enabled). Pass False to force a fresh generation.
+            validate: Optional check of the raw response text. A response it rejects (returns
+                      False or raises) is still returned but never cached, and a cached
+                      response it rejects is dropped and regenerated.
             **kwargs: Additional provider-specific parameters
         
         Returns:
@@ -159,8 +270,8 @@ class LLMService:
             )
             print(review.title)  # Structured access
         """
-        # Create client (new instance each time to support parameter overrides)
-        client = self._create_client(api_key=api_key, base_url=base_url)
+        # Pooled client (per-call overrides get their own cached pool)
+        client = self._get_client(api_key=api_key, base_url=base_url)
         
         # Get model (priority: parameter > config)
         final_model = (
@@ -171,83 +282,173 @@ class LLMService:
         
         logger.debug(f"LLM call: model={final_model}, base_url={client.base_url}, response_type={response_type}")
         
+        if response_type is not None:
+            # Structured output mode - JSON schema instruction appended to prompt
+            # for maximum compatibility across OpenAI-compatible providers
+            json_schema_instruction = self._get_json_schema_instruction(response_type)
+            final_prompt = f"{prompt}\n\n{json_schema_instruction}"
+        else:
+            final_prompt = prompt
+        
+        # Response cache (opt-in), keyed on everything that determines the response
+        cache = get_llm_cache() if use_cache else None
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.make_key(
+                prompt=final_prompt,
+                model=final_model,
+                base_url=str(client.base_url),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                extra=kwargs,
+            )
+            cached = cache.get(cache_key)
+            if cached is not None and not self._accepts(validate, cached):
+                logger.warning("Cached LLM response was rejected, regenerating")
+                cache.invalidate(cache_key)
+            elif cached is not None:
+                logger.debug(f"💾 LLM cache hit ({len(cached)} chars)")
+                try:
+                    return self._parse_response_as_model(cached, response_type) if response_type else cached
+                except ValueError:
+                    logger.warning("Cached LLM response no longer parses, regenerating")
+        
         try:
-            if response_type is not None:
-                # Structured output mode - try beta.chat.completions.parse first
-                return await self._call_with_structured_output(
-                    client=client,
-                    model=final_model,
-                    prompt=prompt,
-                    response_type=response_type,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    **kwargs
-                )
-            else:
-                # Standard text output mode
-                response = await client.chat.completions.create(
-                    model=final_model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    **kwargs
-                )
-                
-                result = response.choices[0].message.content
-                logger.debug(f"LLM response length: {len(result)} chars")
-                
-                return result
+            response = await client.chat.completions.create(
+                model=final_model,
+                messages=[{"role": "user", "content": final_prompt}],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+            content = response.choices[0].message.content
+            logger.debug(f"LLM response length: {len(content)} chars")
+            
+            # Parse before caching so unparseable responses are never reused
+            result = self._parse_response_as_model(content, response_type) if response_type else content
         
         except Exception as e:
             logger.error(f"LLM call error (model={final_model}, base_url={client.base_url}): {e}")
             raise
+        
+        if cache_key is not None and content and self._accepts(validate, content):
+            cache.put(cache_key, content)
+
+        return result
     
-    async def _call_with_structured_output(
+    async def stream(
         self,
-        client: AsyncOpenAI,
-        model: str,
         prompt: str,
-        response_type: Type[T],
-        temperature: float,
-        max_tokens: int,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        use_cache: bool = True,
+        validate: Optional[Callable[[str], bool]] = None,
         **kwargs
-    ) -> T:
+    ) -> AsyncIterator[str]:
         """
-        Call LLM with structured output support
-        
-        Uses JSON schema instruction appended to prompt for maximum compatibility
-        across all OpenAI-compatible providers (Qwen, DeepSeek, etc.).
-        
+        Generate text using LLM, yielding content deltas as they arrive
+
+        Same parameters as __call__ (without structured output). A cached
+        response is yielded as a single chunk; a completed stream that passes
+        validate is cached under the same key as the equivalent __call__.
+
         Args:
-            client: OpenAI client
-            model: Model name
-            prompt: The prompt
-            response_type: Pydantic model class
-            temperature: Sampling temperature
-            max_tokens: Max tokens
-            **kwargs: Additional parameters
-        
-        Returns:
-            Parsed Pydantic model instance
+            prompt: The prompt to generate from
+            api_key: API key (optional, uses config if not provided)
+            base_url: Base URL (optional, uses config if not provided)
+            model: Model name (optional, uses config if not provided)
+            temperature: Sampling temperature (0.0-2.0)
+            max_tokens: Maximum tokens to generate
+            use_cache: Reuse a cached response for an identical request (when cache.llm is enabled)
+            validate: Optional check of the full response text; rejected responses are not
+                      cached, and a rejected cached response is regenerated
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Text deltas
+
+        Example:
+            async for delta in pixelle_video.llm.stream("Write a poem"):
+                print(delta, end="")
         """
-        # Build JSON schema instruction and append to prompt
-        json_schema_instruction = self._get_json_schema_instruction(response_type)
-        enhanced_prompt = f"{prompt}\n\n{json_schema_instruction}"
-        
-        # Call LLM with enhanced prompt
-        response = await client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": enhanced_prompt}],
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs
+        client = self._get_client(api_key=api_key, base_url=base_url)
+        final_model = (
+            model
+            or self._get_config_value("model")
+            or "gpt-3.5-turbo"
         )
-        content = response.choices[0].message.content
-        
-        logger.debug(f"Structured output response length: {len(content)} chars")
+
+        logger.debug(f"LLM stream: model={final_model}, base_url={client.base_url}")
+
+        cache = get_llm_cache() if use_cache else None
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.make_key(
+                prompt=prompt,
+                model=final_model,
+                base_url=str(client.base_url),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                extra=kwargs,
+            )
+            cached = cache.get(cache_key)
+            if cached is not None and not self._accepts(validate, cached):
+                logger.warning("Cached LLM response was rejected, regenerating")
+                cache.invalidate(cache_key)
+            elif cached is not None:
+                logger.debug(f"💾 LLM cache hit ({len(cached)} chars)")
+                yield cached
+                return
+
+        parts = []
+        try:
+            response = await client.chat.completions.create(
+                model=final_model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **kwargs
+            )
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            logger.error(f"LLM stream error (model={final_model}, base_url={client.base_url}): {e}")
+            raise
+
+        content = "".join(parts)
+        logger.debug(f"LLM streamed response length: {len(content)} chars")
+
+        if cache_key is not None and content and self._accepts(validate, content):
+            cache.put(cache_key, content)
+    
+    @staticmethod
+    def _accepts(validate: Optional[Callable[[str], bool]], content: str) -> bool:
+        """Whether a response may be cached (no validate callback, or it accepts the content)"""
+        if validate is None:
+            return True
+        try:
+            return bool(validate(content))
+        except Exception:
+            return False
+    
+    def cache_stats(self) -> Optional[dict]:
+        """
+        LLM response cache statistics
         
-        # Parse JSON from response content
-        return self._parse_response_as_model(content, response_type)
+        Returns:
+            Stats dict (hits, misses, hit_rate, entries, size_bytes, max_size_bytes), or None if the cache is disabled
+        """
+        cache = get_llm_cache()
+        return cache.stats() if cache else None
     
     def _get_json_schema_instruction(self, response_type: Type[T]) -> str:
         """
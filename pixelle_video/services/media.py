@@ -17,13 +17,43 @@ Supports both image and video generation workflows.
 Automatically detects output type based on ExecuteResult.
 """
 
+import os
+import shutil
 from typing import Optional
 
 from comfykit import ComfyKit
 from loguru import logger
 
 from pixelle_video.services.comfy_base_service import ComfyBaseService
+from pixelle_video.services.download_manager import get_download_manager
 from pixelle_video.models.media import MediaResult
+from pixelle_video.utils.file_cache import FileCache, file_fingerprint
+
+
+_media_cache: Optional[FileCache] = None
+
+
+def get_media_cache() -> Optional[FileCache]:
+    """
+    Get the process-wide generated-media cache
+    
+    Returns:
+        FileCache, or None if disabled via cache.media.enabled
+    """
+    global _media_cache
+    
+    from pixelle_video.config import config_manager
+    cache_config = config_manager.config.cache.media
+    if not cache_config.enabled:
+        return None
+    
+    if _media_cache is None:
+        _media_cache = FileCache("media", max_size_mb=cache_config.max_size_mb, link_mode=cache_config.link_mode)
+    else:
+        # Pick up size changes from config hot reload
+        _media_cache.max_size_bytes = int(cache_config.max_size_mb * 1024 * 1024)
+        _media_cache.link_mode = cache_config.link_mode
+    return _media_cache
 
 
 class MediaService(ComfyBaseService):
@@ -51,7 +81,7 @@ class MediaService(ComfyBaseService):
         workflows = pixelle_video.media.list_workflows()
     """
     
-    WORKFLOW_PREFIX = ""  # Will be overridden by _scan_workflows
+    WORKFLOW_PREFIX = ""  # Not used, see _matches_workflow
     DEFAULT_WORKFLOW = None  # No hardcoded default, must be configured
     WORKFLOWS_DIR = "workflows"
     
@@ -65,47 +95,13 @@ class MediaService(ComfyBaseService):
         """
         super().__init__(config, service_name="image", core=core)  # Keep "image" for config compatibility
     
-    def _scan_workflows(self):
+    def _matches_workflow(self, filename: str) -> bool:
         """
-        Scan workflows for both image_ and video_ prefixes
+        Match workflows for both image_ and video_ prefixes
         
         Override parent method to support multiple prefixes
         """
-        from pixelle_video.utils.os_util import list_resource_dirs, list_resource_files, get_resource_path
-        from pathlib import Path
-        
-        workflows = []
-        
-        # Get all workflow source directories
-        source_dirs = list_resource_dirs("workflows")
-        
-        if not source_dirs:
-            logger.warning("No workflow source directories found")
-            return workflows
-        
-        # Scan each source directory for workflow files
-        for source_name in source_dirs:
-            # Get all JSON files for this source
-            workflow_files = list_resource_files("workflows", source_name)
-            
-            # Filter to only files matching image_ or video_ prefix
-            matching_files = [
-                f for f in workflow_files 
-                if (f.startswith("image_") or f.startswith("video_")) and f.endswith('.json')
-            ]
-            
-            for filename in matching_files:
-                try:
-                    # Get actual file path
-                    file_path = Path(get_resource_path("workflows", source_name, filename))
-                    workflow_info = self._parse_workflow_file(file_path, source_name)
-                    workflows.append(workflow_info)
-                    logger.debug(f"Found workflow: {workflow_info['key']}")
-                except Exception as e:
-                    logger.error(f"Failed to parse workflow {source_name}/{filename}: {e}")
-        
-        # Sort by key (source/name)
-        return sorted(workflows, key=lambda w: w["key"])
+        return filename.startswith(("image_", "video_")) and filename.endswith('.json')
     
     async def __call__(
         self,
@@ -125,6 +121,9 @@ class MediaService(ComfyBaseService):
         seed: Optional[int] = None,
         cfg: Optional[float] = None,
         sampler: Optional[str] = None,
+        # Local output (enables the media cache)
+        output_path: Optional[str] = None,
+        use_cache: bool = True,
         **params
     ) -> MediaResult:
         """
@@ -147,6 +146,10 @@ class MediaService(ComfyBaseService):
             seed: Random seed
             cfg: CFG scale
             sampler: Sampler name
+            output_path: Save the generated media to this local path (url of the result
+                then points to it). Required for the media cache.
+            use_cache: Reuse a previous result for identical prompt/workflow/size/seed/params
+                (default True; set False for fresh output)
             **params: Additional workflow parameters
         
         Returns:
@@ -225,6 +228,26 @@ class MediaService(ComfyBaseService):
         
         logger.debug(f"Workflow parameters: {workflow_params}")
         
+        # 3. Serve identical requests from the media cache (needs a local destination)
+        cache = get_media_cache() if (use_cache and output_path) else None
+        cache_key = None
+        if cache is not None:
+            cache_key = FileCache.make_key(
+                media_type=media_type,
+                workflow=workflow_info.get("workflow_id") or workflow_info["key"],
+                workflow_file=file_fingerprint(workflow_info.get("path")),
+                # Frame index does not affect the output
+                params={k: v for k, v in workflow_params.items() if k != "index"},
+            )
+            if cache.materialize(cache_key, output_path):
+                meta = cache.metadata(cache_key) or {}
+                logger.info(f"♻️  Media cache hit: {output_path}")
+                return MediaResult(
+                    media_type=media_type,
+                    url=output_path,
+                    duration=meta.get("duration")
+                )
+        
         # 4. Execute workflow using shared ComfyKit instance from core
         try:
             # Get shared ComfyKit instance (lazy initialization + config hot-reload)
@@ -263,6 +286,11 @@ class MediaService(ComfyBaseService):
                 if hasattr(result, 'duration') and result.duration:
                     duration = result.duration
                 
+                if output_path:
+                    video_url = await self._save_media(video_url, output_path)
+                    if cache is not None:
+                        cache.put(cache_key, output_path, meta={"duration": duration})
+                
                 return MediaResult(
                     media_type="video",
                     url=video_url,
@@ -277,6 +305,11 @@ class MediaService(ComfyBaseService):
                 image_url = result.images[0]
                 logger.info(f"✅ Generated image: {image_url}")
                 
+                if output_path:
+                    image_url = await self._save_media(image_url, output_path)
+                    if cache is not None:
+                        cache.put(cache_key, output_path)
+                
                 return MediaResult(
                     media_type="image",
                     url=image_url
@@ -285,3 +318,24 @@ class MediaService(ComfyBaseService):
         except Exception as e:
             logger.error(f"Media generation error: {e}")
             raise
+    
+    async def _save_media(self, url: str, output_path: str) -> str:
+        """
+        Save generated media (URL or local path) to output_path
+        
+        Returns:
+            output_path
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        
+        # Never write through an existing file: it may be a hard link into the cache
+        if os.path.lexists(output_path):
+            os.unlink(output_path)
+        
+        if url.startswith(('http://', 'https://')):
+            # Pooled, streaming, resumable download
+            await get_download_manager().download(url, output_path)
+        else:
+            shutil.copyfile(url, output_path)
+        
+        return output_path
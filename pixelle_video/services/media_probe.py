@@ -0,0 +1,270 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Media Probe Service
+
+Shared ffprobe front-end with an in-process cache keyed on
+(path, mtime, size), so a file is probed once no matter how many call
+sites ask for its duration or streams. Many paths can be probed at once
+concurrently.
+
+Usage:
+    from pixelle_video.services.media_probe import media_probe
+
+    info = media_probe.probe("frames/01_audio.mp3")
+    print(info.duration, info.has_audio)
+
+    infos = await media_probe.probe_many_async(segment_paths)
+"""
+
+import asyncio
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import ffmpeg
+from loguru import logger
+
+
+@dataclass
+class StreamInfo:
+    """One stream of a probed media file"""
+    index: int
+    codec_type: str
+    codec_name: Optional[str] = None
+    profile: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    pix_fmt: Optional[str] = None
+    r_frame_rate: Optional[str] = None
+    time_base: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+
+    @classmethod
+    def from_ffprobe(cls, stream: Dict[str, Any]) -> "StreamInfo":
+        sample_rate = stream.get("sample_rate")
+        return cls(
+            index=stream.get("index", 0),
+            codec_type=stream.get("codec_type", ""),
+            codec_name=stream.get("codec_name"),
+            profile=stream.get("profile"),
+            width=stream.get("width"),
+            height=stream.get("height"),
+            pix_fmt=stream.get("pix_fmt"),
+            r_frame_rate=stream.get("r_frame_rate"),
+            time_base=stream.get("time_base"),
+            sample_rate=int(sample_rate) if sample_rate else None,
+            channels=stream.get("channels"),
+        )
+
+
+@dataclass
+class ProbeResult:
+    """Structured ffprobe result"""
+    path: str
+    duration: Optional[float]
+    size: int
+    format_name: Optional[str] = None
+    streams: List[StreamInfo] = field(default_factory=list)
+
+    @property
+    def video_stream(self) -> Optional[StreamInfo]:
+        return next((s for s in self.streams if s.codec_type == "video"), None)
+
+    @property
+    def audio_stream(self) -> Optional[StreamInfo]:
+        return next((s for s in self.streams if s.codec_type == "audio"), None)
+
+    @property
+    def has_video(self) -> bool:
+        return self.video_stream is not None
+
+    @property
+    def has_audio(self) -> bool:
+        return self.audio_stream is not None
+
+    @property
+    def width(self) -> Optional[int]:
+        stream = self.video_stream
+        return stream.width if stream else None
+
+    @property
+    def height(self) -> Optional[int]:
+        stream = self.video_stream
+        return stream.height if stream else None
+
+    @property
+    def codec(self) -> Optional[str]:
+        """Video codec name (audio codec for audio-only files)"""
+        stream = self.video_stream or self.audio_stream
+        return stream.codec_name if stream else None
+
+    @property
+    def fps(self) -> Optional[float]:
+        stream = self.video_stream
+        if not stream or not stream.r_frame_rate:
+            return None
+        num, _, den = stream.r_frame_rate.partition("/")
+        try:
+            return float(num) / float(den or 1) if float(den or 1) != 0 else None
+        except ValueError:
+            return None
+
+
+class MediaProbeService:
+    """
+    Cached, batchable ffprobe
+
+    Cache entries are keyed on (absolute path, mtime, size), so a rewritten
+    file is probed again automatically.
+    """
+
+    def __init__(self, max_entries: int = 2048, max_workers: int = 8):
+        """
+        Initialize
+
+        Args:
+            max_entries: Maximum cached results (least recently used are dropped)
+            max_workers: Maximum concurrent ffprobe processes for batch probes
+        """
+        self.max_entries = max_entries
+        self.max_workers = max_workers
+        self._cache: "OrderedDict[Tuple[str, int, int], ProbeResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ffprobe")
+            return self._executor
+
+    @staticmethod
+    def _cache_key(path: str) -> Tuple[str, int, int]:
+        stat = os.stat(path)
+        return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+    def probe(self, path: str) -> ProbeResult:
+        """
+        Probe a media file (cached)
+
+        Args:
+            path: Media file path
+
+        Returns:
+            ProbeResult
+
+        Raises:
+            RuntimeError: If the file does not exist or ffprobe fails
+        """
+        try:
+            key = self._cache_key(path)
+        except OSError as e:
+            raise RuntimeError(f"Cannot probe {path}: {e}")
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        try:
+            raw = ffmpeg.probe(path)
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            raise RuntimeError(f"ffprobe failed for {path}: {error_msg}")
+
+        format_info = raw.get("format", {})
+        duration = format_info.get("duration")
+        result = ProbeResult(
+            path=path,
+            duration=float(duration) if duration not in (None, "N/A") else None,
+            size=key[2],
+            format_name=format_info.get("format_name"),
+            streams=[StreamInfo.from_ffprobe(s) for s in raw.get("streams", [])],
+        )
+
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+        return result
+
+    def probe_many(self, paths: List[str]) -> List[ProbeResult]:
+        """
+        Probe several files concurrently (cached)
+
+        Args:
+            paths: Media file paths
+
+        Returns:
+            ProbeResults in the same order
+
+        Raises:
+            RuntimeError: If any probe fails
+        """
+        if len(paths) <= 1:
+            return [self.probe(p) for p in paths]
+        return list(self._get_executor().map(self.probe, paths))
+
+    async def probe_async(self, path: str) -> ProbeResult:
+        """Async version of probe (ffprobe runs off the event loop)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self.probe, path)
+
+    async def probe_many_async(self, paths: List[str]) -> List[ProbeResult]:
+        """Async version of probe_many"""
+        return list(await asyncio.gather(*(self.probe_async(p) for p in paths)))
+
+    def get_duration(self, path: str, default: Optional[float] = None) -> Optional[float]:
+        """
+        Duration in seconds, or default if the file cannot be probed
+
+        Args:
+            path: Media file path
+            default: Value returned on failure
+        """
+        try:
+            duration = self.probe(path).duration
+            return duration if duration is not None else default
+        except Exception as e:
+            logger.warning(f"Failed to get duration of {path}: {e}")
+            return default
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop cached results for a path (or everything)"""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+                return
+            abs_path = os.path.abspath(path)
+            for key in [k for k in self._cache if k[0] == abs_path]:
+                del self._cache[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Cache statistics"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._cache)}
+
+
+# Global instance shared by all services
+media_probe = MediaProbeService()
@@ -17,12 +17,14 @@ Handles task metadata and storyboard persistence to filesystem.
 """
 
 import json
+import os
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from loguru import logger
 
 from pixelle_video.models.storyboard import Storyboard, StoryboardFrame, StoryboardConfig, ContentMetadata
+from pixelle_video.services.task_index import TaskIndex
 
 
 class PersistenceService:
@@ -67,9 +69,11 @@ class PersistenceService:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
-        # Index file for fast listing
-        self.index_file = self.output_dir / ".index.json"
-        self._ensure_index()
+        # SQLite index of task summaries for fast listing
+        # (replaces the legacy .index.json, which is migrated once)
+        self.index_file = self.output_dir / ".index.db"
+        self.index = TaskIndex(self.index_file)
+        self.index.migrate_from_json(self.output_dir / ".index.json")
     
     def get_task_dir(self, task_id: str) -> Path:
         """Get task directory path"""
@@ -218,8 +222,12 @@ class PersistenceService:
             # Convert storyboard to dict
             storyboard_dict = self._storyboard_to_dict(storyboard)
             
-            with open(storyboard_path, "w", encoding="utf-8") as f:
+            # Write-then-rename: storyboards are checkpointed during generation,
+            # so a crash must never leave a truncated file behind
+            temp_path = storyboard_path.with_suffix(".json.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
                 json.dump(storyboard_dict, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, storyboard_path)
             
             logger.debug(f"Saved storyboard: {task_id}")
             
@@ -469,34 +477,8 @@ class PersistenceService:
     # Index Management (for fast listing)
     # ========================================================================
     
-    def _ensure_index(self):
-        """Ensure index file exists, create if not"""
-        if not self.index_file.exists():
-            self._save_index({"version": "1.0", "tasks": []})
-    
-    def _load_index(self) -> Dict[str, Any]:
-        """Load index from file"""
-        try:
-            with open(self.index_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load index: {e}")
-            return {"version": "1.0", "tasks": []}
-    
-    def _save_index(self, index_data: Dict[str, Any]):
-        """Save index to file"""
-        try:
-            index_data["last_updated"] = datetime.now().isoformat()
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(index_data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save index: {e}")
-    
-    async def _update_index_for_task(self, task_id: str, metadata: Dict[str, Any]):
-        """Update index entry for a specific task"""
-        index = self._load_index()
-        
-        # Try to get title from multiple sources
+    async def _resolve_title(self, task_id: str, metadata: Dict[str, Any]) -> str:
+        """Resolve the display title of a task from multiple sources"""
         title = metadata.get("input", {}).get("title")
         if not title or title == "":
             # Try to get title from storyboard if input title is empty
@@ -511,36 +493,34 @@ class PersistenceService:
                     title = input_text[:30] + ("..." if len(input_text) > 30 else "")
                 else:
                     title = "Untitled"
-        
-        # Extract key info for index
-        index_entry = {
+        return title
+    
+    async def _build_index_entry(self, task_id: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the index summary of a task from its metadata"""
+        result = metadata.get("result") or {}
+        return {
             "task_id": task_id,
             "created_at": metadata.get("created_at"),
             "completed_at": metadata.get("completed_at"),
             "status": metadata.get("status", "unknown"),
-            "title": title,
-            "duration": metadata.get("result", {}).get("duration", 0),
-            "n_frames": metadata.get("result", {}).get("n_frames", 0),
-            "file_size": metadata.get("result", {}).get("file_size", 0),
-            "video_path": metadata.get("result", {}).get("video_path"),
+            "title": await self._resolve_title(task_id, metadata),
+            "duration": result.get("duration", 0),
+            "n_frames": result.get("n_frames", 0),
+            "file_size": result.get("file_size", 0),
+            "video_path": result.get("video_path"),
         }
-        
-        # Update or append
-        tasks = index.get("tasks", [])
-        existing_idx = next((i for i, t in enumerate(tasks) if t["task_id"] == task_id), None)
-        
-        if existing_idx is not None:
-            tasks[existing_idx] = index_entry
-        else:
-            tasks.append(index_entry)
-        
-        index["tasks"] = tasks
-        self._save_index(index)
+    
+    async def _update_index_for_task(self, task_id: str, metadata: Dict[str, Any]):
+        """Update index entry for a specific task"""
+        try:
+            self.index.upsert(await self._build_index_entry(task_id, metadata))
+        except Exception as e:
+            logger.error(f"Failed to update index for task {task_id}: {e}")
     
     async def rebuild_index(self):
         """Rebuild index by scanning all task directories"""
         logger.info("Rebuilding task index...")
-        index = {"version": "1.0", "tasks": []}
+        entries = []
         
         # Scan all directories
         for task_dir in self.output_dir.iterdir():
@@ -551,37 +531,10 @@ class PersistenceService:
             metadata = await self.load_task_metadata(task_id)
             
             if metadata:
-                # Try to get title from multiple sources
-                title = metadata.get("input", {}).get("title")
-                if not title or title == "":
-                    # Try to get title from storyboard if input title is empty
-                    storyboard = await self.load_storyboard(task_id)
-                    if storyboard and storyboard.title:
-                        title = storyboard.title
-                    else:
-                        # Fall back to using input text preview
-                        input_text = metadata.get("input", {}).get("text", "")
-                        if input_text:
-                            # Use first 30 characters of input text as title
-                            title = input_text[:30] + ("..." if len(input_text) > 30 else "")
-                        else:
-                            title = "Untitled"
-                
-                # Add to index
-                index["tasks"].append({
-                    "task_id": task_id,
-                    "created_at": metadata.get("created_at"),
-                    "completed_at": metadata.get("completed_at"),
-                    "status": metadata.get("status", "unknown"),
-                    "title": title,
-                    "duration": metadata.get("result", {}).get("duration", 0),
-                    "n_frames": metadata.get("result", {}).get("n_frames", 0),
-                    "file_size": metadata.get("result", {}).get("file_size", 0),
-                    "video_path": metadata.get("result", {}).get("video_path"),
-                })
+                entries.append(await self._build_index_entry(task_id, metadata))
         
-        self._save_index(index)
-        logger.info(f"Index rebuilt: {len(index['tasks'])} tasks")
+        self.index.replace_all(entries)
+        logger.info(f"Index rebuilt: {len(entries)} tasks")
     
     # ========================================================================
     # Paginated Listing
@@ -614,29 +567,15 @@ class PersistenceService:
                 "total_pages": 5         # Total pages
             }
         """
-        index = self._load_index()
-        tasks = index.get("tasks", [])
-        
-        # Filter by status
-        if status:
-            tasks = [t for t in tasks if t.get("status") == status]
-        
-        # Sort
-        reverse = (sort_order == "desc")
-        if sort_by in ["created_at", "completed_at"]:
-            tasks.sort(
-                key=lambda t: datetime.fromisoformat(t.get(sort_by, "1970-01-01T00:00:00")),
-                reverse=reverse
-            )
-        elif sort_by in ["title", "duration", "n_frames"]:
-            tasks.sort(key=lambda t: t.get(sort_by, ""), reverse=reverse)
-        
-        # Paginate
-        total = len(tasks)
+        # Filtering, sorting and pagination run in SQL
+        page_tasks, total = self.index.query(
+            page=page,
+            page_size=page_size,
+            status=status,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
         total_pages = (total + page_size - 1) // page_size
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        page_tasks = tasks[start_idx:end_idx]
         
         return {
             "tasks": page_tasks,
@@ -663,18 +602,7 @@ class PersistenceService:
                 "total_size": 1024000000,  # bytes
             }
         """
-        index = self._load_index()
-        tasks = index.get("tasks", [])
-        
-        stats = {
-            "total_tasks": len(tasks),
-            "completed": len([t for t in tasks if t.get("status") == "completed"]),
-            "failed": len([t for t in tasks if t.get("status") == "failed"]),
-            "total_duration": sum(t.get("duration", 0) for t in tasks),
-            "total_size": sum(t.get("file_size", 0) for t in tasks),
-        }
-        
-        return stats
+        return self.index.statistics()
     
     # ========================================================================
     # Delete Task
@@ -699,11 +627,7 @@ class PersistenceService:
                 logger.info(f"Deleted task directory: {task_dir}")
             
             # Update index
-            index = self._load_index()
-            tasks = index.get("tasks", [])
-            tasks = [t for t in tasks if t["task_id"] != task_id]
-            index["tasks"] = tasks
-            self._save_index(index)
+            self.index.delete(task_id)
             
             return True
         except Exception as e:
@@ -0,0 +1,263 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Task Index
+
+SQLite-backed index of task summaries (one row per task) used for history
+listing, pagination and statistics. Status updates touch a single row and
+pagination runs in SQL, instead of rewriting and re-sorting a JSON file
+holding every task.
+
+The database runs in WAL mode so readers (web UI, API) never block the
+writer, and concurrent writers are serialized by SQLite instead of losing
+updates.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+# Summary columns, in table order
+INDEX_COLUMNS = (
+    "task_id",
+    "created_at",
+    "completed_at",
+    "status",
+    "title",
+    "duration",
+    "n_frames",
+    "file_size",
+    "video_path",
+)
+
+# Columns accepted by query(sort_by=...)
+SORTABLE_COLUMNS = ("created_at", "completed_at", "title", "duration", "n_frames")
+
+
+class TaskIndex:
+    """
+    SQLite task summary index
+
+    Usage:
+        index = TaskIndex("output/.index.db")
+        index.upsert({"task_id": "abc", "status": "running", ...})
+        tasks, total = index.query(page=1, page_size=20, status="completed")
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            task_id      TEXT PRIMARY KEY,
+            created_at   TEXT,
+            completed_at TEXT,
+            status       TEXT NOT NULL DEFAULT 'unknown',
+            title        TEXT,
+            duration     REAL NOT NULL DEFAULT 0,
+            n_frames     INTEGER NOT NULL DEFAULT 0,
+            file_size    INTEGER NOT NULL DEFAULT 0,
+            video_path   TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
+        CREATE INDEX IF NOT EXISTS idx_tasks_status_created_at ON tasks (status, created_at);
+        CREATE INDEX IF NOT EXISTS idx_tasks_title ON tasks (title);
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (and create if needed) the index database
+
+        Args:
+            db_path: SQLite database file path
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+
+    @staticmethod
+    def _row_values(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (
+            entry["task_id"],
+            entry.get("created_at"),
+            entry.get("completed_at"),
+            entry.get("status") or "unknown",
+            entry.get("title"),
+            entry.get("duration") or 0,
+            entry.get("n_frames") or 0,
+            entry.get("file_size") or 0,
+            entry.get("video_path"),
+        )
+
+    def upsert(self, entry: Dict[str, Any]):
+        """
+        Insert or replace a task summary
+
+        Args:
+            entry: Summary dict with keys from INDEX_COLUMNS (task_id required)
+        """
+        placeholders = ", ".join("?" for _ in INDEX_COLUMNS)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO tasks ({', '.join(INDEX_COLUMNS)}) VALUES ({placeholders})",
+                self._row_values(entry),
+            )
+
+    def upsert_many(self, entries: Iterable[Dict[str, Any]]):
+        """Insert or replace several task summaries in one transaction"""
+        placeholders = ", ".join("?" for _ in INDEX_COLUMNS)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO tasks ({', '.join(INDEX_COLUMNS)}) VALUES ({placeholders})",
+                [self._row_values(entry) for entry in entries],
+            )
+
+    def replace_all(self, entries: Iterable[Dict[str, Any]]):
+        """Replace the whole index (used by rebuild)"""
+        placeholders = ", ".join("?" for _ in INDEX_COLUMNS)
+        rows = [self._row_values(entry) for entry in entries]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks")
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO tasks ({', '.join(INDEX_COLUMNS)}) VALUES ({placeholders})",
+                rows,
+            )
+
+    def delete(self, task_id: str):
+        """Remove a task summary"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a task summary, or None"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return dict(row) if row else None
+
+    def count(self, status: Optional[str] = None) -> int:
+        """Number of indexed tasks (optionally with a given status)"""
+        with self._lock:
+            if status:
+                row = self._conn.execute("SELECT COUNT(*) FROM tasks WHERE status = ?", (status,)).fetchone()
+            else:
+                row = self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()
+        return row[0]
+
+    def query(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        status: Optional[str] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc"
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Page through task summaries
+
+        Args:
+            page: Page number (1-indexed)
+            page_size: Items per page
+            status: Filter by status (optional)
+            sort_by: Sort column (one of SORTABLE_COLUMNS; anything else keeps insertion order)
+            sort_order: "asc" or "desc"
+
+        Returns:
+            (page of task summaries, total matching tasks)
+        """
+        where = "WHERE status = ?" if status else ""
+        params: List[Any] = [status] if status else []
+
+        direction = "DESC" if sort_order == "desc" else "ASC"
+        order_column = sort_by if sort_by in SORTABLE_COLUMNS else "rowid"
+
+        page = max(1, page)
+        offset = (page - 1) * page_size
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM tasks {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT {', '.join(INDEX_COLUMNS)} FROM tasks {where} "
+                f"ORDER BY {order_column} {direction}, task_id {direction} LIMIT ? OFFSET ?",
+                params + [page_size, offset],
+            ).fetchall()
+
+        return [dict(row) for row in rows], total
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Aggregate statistics over all tasks
+
+        Returns:
+            Dict with total_tasks, completed, failed, total_duration, total_size
+        """
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(status = 'completed'), 0),
+                    COALESCE(SUM(status = 'failed'), 0),
+                    COALESCE(SUM(duration), 0),
+                    COALESCE(SUM(file_size), 0)
+                FROM tasks
+                """
+            ).fetchone()
+        return {
+            "total_tasks": row[0],
+            "completed": row[1],
+            "failed": row[2],
+            "total_duration": row[3],
+            "total_size": row[4],
+        }
+
+    def migrate_from_json(self, json_path: str) -> int:
+        """
+        One-time import of a legacy .index.json
+
+        The JSON file is renamed to "<name>.migrated" afterwards, so the
+        import never runs twice.
+
+        Args:
+            json_path: Legacy index file path
+
+        Returns:
+            Number of imported tasks
+        """
+        json_file = Path(json_path)
+        if not json_file.exists():
+            return 0
+
+        try:
+            with open(json_file, "r", encoding="utf-8") as f:
+                tasks = json.load(f).get("tasks", [])
+            entries = [t for t in tasks if t.get("task_id")]
+            self.upsert_many(entries)
+            json_file.replace(json_file.with_name(json_file.name + ".migrated"))
+            logger.info(f"📦 Migrated {len(entries)} tasks from {json_file} to {self.db_path}")
+            return len(entries)
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy task index {json_file}: {e}")
+            return 0
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
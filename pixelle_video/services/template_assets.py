@@ -0,0 +1,378 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Template Asset Bundler - Local copies of remote template assets
+
+Templates may reference remote stylesheets (e.g. Google Fonts CSS), fonts
+and images. The bundler downloads each remote asset once into
+data/template_assets/ and rewrites the template to point at the local copy
+(file:// URL), so frame renders never wait on the network:
+
+- <link rel="stylesheet" href="https://..."> -> CSS is downloaded and its
+  url(...) / @import references (fonts) are bundled recursively
+- url(https://...) in inline CSS, src="https://..." attributes and
+  placeholder defaults like {{bg=https://...}}
+- <link rel="preconnect"/"dns-prefetch"> hints to remote hosts are dropped
+
+Template compiles never touch the network: localize_cached() only uses
+assets that are already bundled, and prefetch() downloads the missing ones
+in a background thread (the registry recompiles the template afterwards).
+
+Assets that cannot be fetched keep their remote URL (the render behaves as
+before) and are not retried for an hour, so air-gapped nodes do not keep
+re-downloading them.
+
+Run `python -m pixelle_video.services.template_assets` on a connected
+machine to bundle all templates ahead of time, then copy
+data/template_assets/ to offline render nodes.
+"""
+
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from loguru import logger
+
+from pixelle_video.utils.os_util import get_data_path
+
+# Seconds before a failed download is retried
+RETRY_INTERVAL = 3600
+
+LINK_TAG_PATTERN = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+ATTR_PATTERN = re.compile(r'\b(rel|href)\s*=\s*([\'"])(.*?)\2', re.IGNORECASE)
+CSS_URL_PATTERN = re.compile(r'url\(\s*([\'"]?)([^\'")]+?)\1\s*\)', re.IGNORECASE)
+CSS_IMPORT_PATTERN = re.compile(r'@import\s+([\'"])([^\'"]+)\1', re.IGNORECASE)
+SRC_ATTR_PATTERN = re.compile(r'(\bsrc\s*=\s*)([\'"])(https?://[^\'"]+)\2', re.IGNORECASE)
+PLACEHOLDER_DEFAULT_PATTERN = re.compile(
+    r'(\{\{[a-zA-Z_][a-zA-Z0-9_]*(?::[a-z]+)?=)(https?://[^}\s]+)(\}\})'
+)
+
+CONTENT_TYPE_EXTENSIONS = {
+    "text/css": ".css",
+    "font/woff2": ".woff2",
+    "font/woff": ".woff",
+    "font/ttf": ".ttf",
+    "font/otf": ".otf",
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+    "image/svg+xml": ".svg",
+}
+
+
+def _is_remote(url: str) -> bool:
+    return url.startswith(("http://", "https://"))
+
+
+class TemplateAssetBundler:
+    """
+    Downloads remote template assets once and rewrites templates to local copies
+
+    Usage:
+        from pixelle_video.services.template_assets import template_asset_bundler
+
+        local_html = template_asset_bundler.localize(html)  # Downloads (blocking)
+
+        # Without network I/O, e.g. on the event loop thread
+        local_html, missing = template_asset_bundler.localize_cached(html)
+        if missing:
+            template_asset_bundler.prefetch(html, on_done=...)
+    """
+
+    MANIFEST_FILE = "manifest.json"
+
+    def __init__(self, store_dir: Optional[str] = None, timeout: float = 15.0):
+        """
+        Initialize bundler
+
+        Args:
+            store_dir: Asset store directory (default: data/template_assets/)
+            timeout: Download timeout in seconds per asset
+        """
+        self.store_dir = Path(store_dir or get_data_path("template_assets"))
+        self.timeout = timeout
+        self._lock = threading.RLock()
+        self._manifest: Optional[Dict[str, Dict[str, Any]]] = None
+        self._client = None
+        self._prefetching = set()
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        if self._manifest is None:
+            manifest_path = self.store_dir / self.MANIFEST_FILE
+            self._manifest = {}
+            if manifest_path.exists():
+                try:
+                    with open(manifest_path, "r", encoding="utf-8") as f:
+                        self._manifest = json.load(f)
+                except Exception as e:
+                    logger.warning(f"Failed to load template asset manifest, starting empty: {e}")
+        return self._manifest
+
+    def _save_manifest(self):
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.store_dir / self.MANIFEST_FILE
+        temp_path = manifest_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, manifest_path)
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    def _get_client(self):
+        with self._lock:
+            if self._client is None:
+                import httpx
+                self._client = httpx.Client(timeout=self.timeout, follow_redirects=True)
+            return self._client
+
+    def _asset_path(self, url: str, content_type: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        extension = (
+            CONTENT_TYPE_EXTENSIONS.get(content_type)
+            or Path(urlparse(url).path).suffix
+            or mimetypes.guess_extension(content_type)
+            or ""
+        )
+        return self.store_dir / digest[:2] / f"{digest}{extension}"
+
+    def _fetch(self, url: str, missing: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Get the local file URL of a remote asset, downloading it if needed
+
+        Stylesheets are rewritten so the assets they reference are local too.
+        The lock only guards the manifest, never a download.
+
+        Args:
+            url: Remote asset URL
+            missing: Cache-only mode: instead of downloading, append the URL here
+
+        Returns:
+            file:// URL, or None if the asset is unavailable
+        """
+        with self._lock:
+            manifest = self._load_manifest()
+            entry = manifest.get(url)
+
+            if entry:
+                if entry.get("file"):
+                    local_path = self.store_dir / entry["file"]
+                    if local_path.exists():
+                        return local_path.resolve().as_uri()
+                elif time.time() - entry.get("failed_at", 0) < RETRY_INTERVAL:
+                    return None
+
+        if missing is not None:
+            missing.append(url)
+            return None
+
+        try:
+            response = self._get_client().get(url)
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to bundle template asset {url}: {e}")
+            with self._lock:
+                manifest[url] = {"failed_at": time.time(), "error": str(e)}
+                self._save_manifest()
+            return None
+
+        content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+        local_path = self._asset_path(url, content_type)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if content_type == "text/css" or local_path.suffix == ".css":
+            content = self._localize_css(response.text, base_url=url).encode("utf-8")
+        else:
+            content = response.content
+
+        temp_path = local_path.with_suffix(local_path.suffix + ".tmp")
+        temp_path.write_bytes(content)
+        os.replace(temp_path, local_path)
+
+        with self._lock:
+            manifest[url] = {
+                "file": local_path.relative_to(self.store_dir).as_posix(),
+                "content_type": content_type,
+                "size": len(content),
+                "fetched_at": time.time(),
+            }
+            self._save_manifest()
+        logger.info(f"📦 Bundled template asset: {url} ({len(content)} bytes)")
+
+        return local_path.resolve().as_uri()
+
+    # ------------------------------------------------------------------
+    # Rewriting
+    # ------------------------------------------------------------------
+
+    def _localize_css(
+        self,
+        css: str,
+        base_url: Optional[str] = None,
+        missing: Optional[List[str]] = None
+    ) -> str:
+        """Rewrite url(...) and @import references in CSS to local copies"""
+        def resolve(ref: str) -> Optional[str]:
+            if ref.startswith(("data:", "file:", "#")):
+                return None
+            absolute = urljoin(base_url, ref) if base_url else ref
+            return self._fetch(absolute, missing) if _is_remote(absolute) else None
+
+        def replace_url(match):
+            local = resolve(match.group(2).strip())
+            return f'url("{local}")' if local else match.group(0)
+
+        def replace_import(match):
+            local = resolve(match.group(2).strip())
+            return f'@import "{local}"' if local else match.group(0)
+
+        css = CSS_IMPORT_PATTERN.sub(replace_import, css)
+        return CSS_URL_PATTERN.sub(replace_url, css)
+
+    def _localize_link(self, match, missing: Optional[List[str]] = None) -> str:
+        tag = match.group(0)
+        attrs = {name.lower(): value for name, _, value in ATTR_PATTERN.findall(tag)}
+        href = attrs.get("href", "")
+        rel = attrs.get("rel", "").lower()
+
+        if not _is_remote(href):
+            return tag
+
+        # Connection hints to remote hosts are pointless once assets are local
+        if rel in ("preconnect", "dns-prefetch"):
+            return ""
+
+        if "stylesheet" in rel:
+            local = self._fetch(href, missing)
+            if local:
+                return tag.replace(href, local)
+
+        return tag
+
+    def _rewrite(self, html: str, missing: Optional[List[str]] = None) -> str:
+        def replace_src(match):
+            local = self._fetch(match.group(3), missing)
+            return f"{match.group(1)}{match.group(2)}{local}{match.group(2)}" if local else match.group(0)
+
+        def replace_default(match):
+            local = self._fetch(match.group(2), missing)
+            return f"{match.group(1)}{local}{match.group(3)}" if local else match.group(0)
+
+        html = LINK_TAG_PATTERN.sub(lambda match: self._localize_link(match, missing), html)
+        html = self._localize_css(html, missing=missing)
+        html = SRC_ATTR_PATTERN.sub(replace_src, html)
+        return PLACEHOLDER_DEFAULT_PATTERN.sub(replace_default, html)
+
+    def localize(self, html: str) -> str:
+        """
+        Rewrite remote assets in an HTML template to local file:// copies,
+        downloading missing ones (blocking, keep off the event loop)
+
+        Args:
+            html: Template source
+
+        Returns:
+            Template source with bundled assets rewritten (unavailable ones unchanged)
+        """
+        return self._rewrite(html)
+
+    def localize_cached(self, html: str) -> Tuple[str, List[str]]:
+        """
+        Rewrite remote assets that are already bundled, without network I/O
+
+        Args:
+            html: Template source
+
+        Returns:
+            (rewritten source, remote URLs that still need downloading)
+        """
+        missing: List[str] = []
+        html = self._rewrite(html, missing)
+        return html, missing
+
+    def prefetch(self, html: str, on_done: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Download the missing assets of a template in a background thread
+
+        Args:
+            html: Template source
+            on_done: Called (in the background thread) once the downloads are finished
+
+        Returns:
+            False if a prefetch of the same template is already running
+        """
+        key = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        with self._lock:
+            if key in self._prefetching:
+                return False
+            self._prefetching.add(key)
+
+        def run():
+            try:
+                self.localize(html)
+            except Exception as e:
+                logger.warning(f"Failed to prefetch template assets: {e}")
+            finally:
+                with self._lock:
+                    self._prefetching.discard(key)
+            if on_done is not None:
+                on_done()
+
+        threading.Thread(target=run, name="template-asset-prefetch", daemon=True).start()
+        return True
+
+
+# Global instance shared by the template registry
+template_asset_bundler = TemplateAssetBundler()
+
+
+def bundle_templates() -> int:
+    """
+    Bundle the remote assets of all templates (templates/ and data/templates/)
+
+    Returns:
+        Number of templates processed
+    """
+    from pixelle_video.utils.os_util import (
+        get_resource_path,
+        list_resource_dirs,
+        list_resource_files,
+    )
+
+    count = 0
+    for size_dir in list_resource_dirs("templates"):
+        for filename in list_resource_files("templates", size_dir):
+            if not filename.endswith(".html"):
+                continue
+            with open(get_resource_path("templates", size_dir, filename), "r", encoding="utf-8") as f:
+                template_asset_bundler.localize(f.read())
+            count += 1
+    return count
+
+
+if __name__ == "__main__":
+    total = bundle_templates()
+    logger.info(f"✅ Bundled assets of {total} templates into {template_asset_bundler.store_dir}")
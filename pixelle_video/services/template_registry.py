@@ -0,0 +1,361 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Template Registry - Parse-once cache of compiled HTML frame templates
+
+Each template file is read and parsed once into a CompiledTemplate:
+
+- tokenized placeholder list ({{param:type=default}} DSL), so rendering a
+  frame is a list join instead of a regex substitution over the document
+- video size (from the WIDTHxHEIGHT directory) and media size (from the
+  template:media-width/height meta tags)
+- custom parameter schema (for UIs and the API)
+
+Remote assets (fonts, CSS, images) are bundled into data/template_assets/
+at compile time (see template_assets), so renders are fully local.
+
+Entries are keyed on the absolute path and re-compiled when the file's
+mtime changes.
+
+Usage:
+    from pixelle_video.services.template_registry import template_registry
+
+    template = template_registry.get("templates/1080x1920/default.html")
+    html = template.render({"title": "...", "text": "...", "image": "..."})
+    media_width, media_height = template.get_media_size()
+"""
+
+import copy
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from pixelle_video.utils.template_util import parse_template_size
+
+# Pattern: {{param_name:type=default}} or {{param_name=default}} or {{param_name:type}} or {{param_name}}
+# Param name: must start with letter or underscore, can contain letters, digits, underscores
+PARAM_PATTERN = re.compile(r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}')
+
+# Preset parameters that are auto-injected by the system (not user-configurable)
+PRESET_PARAMS = {'title', 'text', 'image', 'index'}
+
+SUPPORTED_PARAM_TYPES = {'text', 'number', 'color', 'bool'}
+
+# Fallback media size when a template has no meta tags
+DEFAULT_MEDIA_SIZE = (1024, 1024)
+
+
+@dataclass(frozen=True)
+class Placeholder:
+    """A {{param:type=default}} occurrence in a template"""
+    name: str
+    type: str
+    default: Optional[str]  # Raw default string from the placeholder
+
+
+def parse_default_value(param_type: str, value_str: Optional[str]) -> Any:
+    """
+    Parse default value based on parameter type
+
+    Args:
+        param_type: Type of parameter (text, number, color, bool)
+        value_str: String value to parse (can be None)
+
+    Returns:
+        Parsed value with appropriate type
+    """
+    if value_str is None:
+        # No default value specified, return type-specific defaults
+        return {
+            'text': '',
+            'number': 0,
+            'color': '#000000',
+            'bool': False,
+        }.get(param_type, '')
+
+    if param_type == 'number':
+        try:
+            # Try int first, then float
+            if '.' in value_str:
+                return float(value_str)
+            else:
+                return int(value_str)
+        except ValueError:
+            logger.warning(f"Invalid number value '{value_str}', using 0")
+            return 0
+
+    elif param_type == 'bool':
+        # Accept: true/false, 1/0, yes/no, on/off (case-insensitive)
+        return value_str.lower() in {'true', '1', 'yes', 'on'}
+
+    elif param_type == 'color':
+        # Auto-add # if missing
+        if value_str.startswith('#'):
+            return value_str
+        else:
+            return f'#{value_str}'
+
+    else:  # text
+        return value_str
+
+
+def parse_media_size(html: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse media size from meta tags in template
+
+    Looks for meta tags:
+    - <meta name="template:media-width" content="1024">
+    - <meta name="template:media-height" content="1024">
+
+    Returns:
+        (width, height) or None if not found
+    """
+    from bs4 import BeautifulSoup
+
+    try:
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # Find width and height meta tags
+        width_meta = soup.find('meta', attrs={'name': 'template:media-width'})
+        height_meta = soup.find('meta', attrs={'name': 'template:media-height'})
+
+        if width_meta and height_meta:
+            width = int(width_meta.get('content', 0))
+            height = int(height_meta.get('content', 0))
+
+            if width > 0 and height > 0:
+                logger.debug(f"Found media size in meta tags: {width}x{height}")
+                return width, height
+
+        return None
+
+    except Exception as e:
+        logger.warning(f"Failed to parse media size from meta tags: {e}")
+        return None
+
+
+def tokenize_template(html: str) -> List[Union[str, Placeholder]]:
+    """Split a template into literal strings and Placeholders"""
+    tokens: List[Union[str, Placeholder]] = []
+    position = 0
+    for match in PARAM_PATTERN.finditer(html):
+        if match.start() > position:
+            tokens.append(html[position:match.start()])
+        tokens.append(Placeholder(
+            name=match.group(1),
+            type=match.group(2) or 'text',
+            default=match.group(3),
+        ))
+        position = match.end()
+    if position < len(html):
+        tokens.append(html[position:])
+    return tokens
+
+
+def build_parameter_schema(tokens: List[Union[str, Placeholder]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the custom parameter schema from template tokens
+
+    Preset parameters are skipped and the first occurrence of a parameter wins.
+    """
+    params = {}
+
+    for token in tokens:
+        if not isinstance(token, Placeholder):
+            continue
+
+        # Skip preset parameters and already parsed ones (use first occurrence)
+        if token.name in PRESET_PARAMS or token.name in params:
+            continue
+
+        # Validate type
+        param_type = token.type
+        if param_type not in SUPPORTED_PARAM_TYPES:
+            logger.warning(f"Unknown parameter type '{param_type}' for '{token.name}', defaulting to 'text'")
+            param_type = 'text'
+
+        params[token.name] = {
+            'type': param_type,
+            'default': parse_default_value(param_type, token.default),
+            'label': token.name,  # Use param name as label
+        }
+
+    return params
+
+
+@dataclass
+class CompiledTemplate:
+    """A parsed HTML frame template"""
+    path: str
+    mtime_ns: int
+    source: str
+    tokens: List[Union[str, Placeholder]]
+    width: int
+    height: int
+    media_size: Optional[Tuple[int, int]]
+    parameters: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def render(self, values: Dict[str, Any]) -> str:
+        """
+        Substitute placeholders
+
+        - If value provided in values dict, use it
+        - Otherwise, use default value from placeholder
+        - If no default, use empty string
+
+        Args:
+            values: Dictionary of parameter values
+
+        Returns:
+            Rendered HTML
+        """
+        parts = []
+        for token in self.tokens:
+            if isinstance(token, str):
+                parts.append(token)
+            elif token.name in values:
+                value = values[token.name]
+                # Convert bool to string for HTML
+                if isinstance(value, bool):
+                    parts.append('true' if value else 'false')
+                else:
+                    parts.append(str(value) if value is not None else '')
+            elif token.default:
+                parts.append(token.default)
+        return ''.join(parts)
+
+    def get_media_size(self) -> Tuple[int, int]:
+        """
+        Media size for image/video generation (meta tags, or 1024x1024 fallback)
+
+        Returns:
+            Tuple of (width, height)
+        """
+        if self.media_size:
+            return self.media_size
+
+        # Fallback to default if not specified (should not happen with properly configured templates)
+        logger.warning(f"No media size meta tags found in template {self.path}, using fallback 1024x1024")
+        return DEFAULT_MEDIA_SIZE
+
+    def get_parameters(self) -> Dict[str, Dict[str, Any]]:
+        """Custom parameter schema (a copy, safe to modify)"""
+        return copy.deepcopy(self.parameters)
+
+
+class TemplateRegistry:
+    """
+    Process-wide cache of compiled templates, keyed on (path, mtime)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._templates: Dict[str, CompiledTemplate] = {}
+
+    def _bundle_assets(self, template_path: str, source: str) -> str:
+        """
+        Rewrite remote assets to local copies (if enabled in config)
+
+        Only already bundled assets are used, since get() is called from async
+        code; missing ones are downloaded in the background and the template
+        is recompiled on its next use.
+        """
+        from pixelle_video.config import config_manager
+
+        if not config_manager.config.template.bundle_remote_assets:
+            return source
+
+        from pixelle_video.services.template_assets import template_asset_bundler
+        try:
+            localized, missing = template_asset_bundler.localize_cached(source)
+        except Exception as e:
+            logger.warning(f"Failed to bundle template assets, using remote URLs: {e}")
+            return source
+
+        if missing and template_asset_bundler.prefetch(source, on_done=lambda: self.invalidate(template_path)):
+            logger.info(f"📦 Downloading {len(missing)} remote asset(s) of {template_path} in the background")
+        return localized
+
+    def _compile(self, template_path: str, mtime_ns: int) -> CompiledTemplate:
+        with open(template_path, 'r', encoding='utf-8') as f:
+            source = f.read()
+
+        width, height = parse_template_size(template_path)
+
+        # Parameter schema keeps the original defaults (shown in UIs);
+        # rendering uses the source with remote assets bundled locally
+        parameters = build_parameter_schema(tokenize_template(source))
+        tokens = tokenize_template(self._bundle_assets(template_path, source))
+
+        logger.debug(
+            f"Compiled template {template_path}: {len(source)} chars, "
+            f"{sum(1 for t in tokens if isinstance(t, Placeholder))} placeholders, "
+            f"{len(parameters)} custom parameter(s)"
+        )
+
+        return CompiledTemplate(
+            path=template_path,
+            mtime_ns=mtime_ns,
+            source=source,
+            tokens=tokens,
+            width=width,
+            height=height,
+            media_size=parse_media_size(source),
+            parameters=parameters,
+        )
+
+    def get(self, template_path: str) -> CompiledTemplate:
+        """
+        Get the compiled form of a template (compiled on first use or after a change)
+
+        Args:
+            template_path: Path to HTML template file (e.g., "templates/1080x1920/default.html")
+
+        Returns:
+            CompiledTemplate
+
+        Raises:
+            FileNotFoundError: If the template does not exist
+            ValueError: If the template path has no valid WIDTHxHEIGHT directory
+        """
+        key = os.path.abspath(template_path)
+        try:
+            mtime_ns = os.stat(key).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template not found: {template_path}")
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None and template.mtime_ns == mtime_ns:
+                return template
+
+        template = self._compile(template_path, mtime_ns)
+        with self._lock:
+            self._templates[key] = template
+        return template
+
+    def invalidate(self, template_path: Optional[str] = None):
+        """Drop a compiled template (or all of them)"""
+        with self._lock:
+            if template_path is None:
+                self._templates.clear()
+            else:
+                self._templates.pop(os.path.abspath(template_path), None)
+
+
+# Global instance shared by FrameProcessor, pipelines and API routers
+template_registry = TemplateRegistry()
@@ -23,10 +23,37 @@ from comfykit import ComfyKit
 from loguru import logger
 
 from pixelle_video.services.comfy_base_service import ComfyBaseService
+from pixelle_video.utils.file_cache import FileCache, file_fingerprint
 from pixelle_video.utils.tts_util import edge_tts
 from pixelle_video.tts_voices import speed_to_rate
 
 
+_tts_cache: Optional[FileCache] = None
+
+
+def get_tts_cache() -> Optional[FileCache]:
+    """
+    Get the process-wide TTS audio cache
+    
+    Returns:
+        FileCache, or None if disabled via cache.tts.enabled
+    """
+    global _tts_cache
+    
+    from pixelle_video.config import config_manager
+    cache_config = config_manager.config.cache.tts
+    if not cache_config.enabled:
+        return None
+    
+    if _tts_cache is None:
+        _tts_cache = FileCache("tts", max_size_mb=cache_config.max_size_mb, link_mode=cache_config.link_mode)
+    else:
+        # Pick up size changes from config hot reload
+        _tts_cache.max_size_bytes = int(cache_config.max_size_mb * 1024 * 1024)
+        _tts_cache.link_mode = cache_config.link_mode
+    return _tts_cache
+
+
 class TTSService(ComfyBaseService):
     """
     TTS (Text-to-Speech) service - Workflow-based
@@ -116,27 +143,102 @@ class TTSService(ComfyBaseService):
         
         # Route to appropriate implementation
         if mode == "local":
-            return await self._call_local_tts(
-                text=text,
-                voice=voice,
-                speed=speed,
-                output_path=output_path
-            )
+            # Resolve defaults so explicit and implicit defaults share cache entries
+            local_config = self.config.get("local", {})
+            cache_parts = {
+                "mode": "local",
+                "text": text,
+                "voice": voice or local_config.get("voice", "zh-CN-YunjianNeural"),
+                "speed": speed if speed is not None else local_config.get("speed", 1.2),
+            }
+            
+            # Local mode always writes a file, so pick the path up front
+            if not output_path:
+                output_path = f"output/{uuid.uuid4().hex}.mp3"
+                Path("output").mkdir(parents=True, exist_ok=True)
+            
+            async def generate(path: Optional[str]) -> str:
+                return await self._call_local_tts(
+                    text=text,
+                    voice=voice,
+                    speed=speed,
+                    output_path=path
+                )
         else:  # comfyui
             # 1. Resolve workflow (returns structured info)
             workflow_info = self._resolve_workflow(workflow=workflow)
+            cache_parts = {
+                "mode": "comfyui",
+                "text": text,
+                "workflow": workflow_info.get("workflow_id") or workflow_info["key"],
+                "workflow_file": file_fingerprint(workflow_info.get("path")),
+                "voice": voice,
+                "speed": speed,
+                # Frame index does not affect the audio
+                "params": {
+                    k: file_fingerprint(v) or v
+                    for k, v in params.items() if k != "index"
+                },
+            }
             
             # 2. Execute ComfyUI workflow
-            return await self._call_comfyui_workflow(
-                workflow_info=workflow_info,
-                text=text,
-                comfyui_url=comfyui_url,
-                runninghub_api_key=runninghub_api_key,
-                voice=voice,
-                speed=speed,
-                output_path=output_path,
-                **params
-            )
+            async def generate(path: Optional[str]) -> str:
+                return await self._call_comfyui_workflow(
+                    workflow_info=workflow_info,
+                    text=text,
+                    comfyui_url=comfyui_url,
+                    runninghub_api_key=runninghub_api_key,
+                    voice=voice,
+                    speed=speed,
+                    output_path=path,
+                    **params
+                )
+        
+        return await self._generate_with_cache(cache_parts, output_path, generate)
+    
+    async def _generate_with_cache(self, cache_parts: dict, output_path: Optional[str], generate) -> str:
+        """
+        Serve audio from the TTS cache, or generate it and store the result
+        
+        Args:
+            cache_parts: Inputs that determine the audio (hashed into the cache key)
+            output_path: Where the audio must end up (None = wherever generate puts it)
+            generate: Async callable taking output_path and returning the audio path
+        
+        Returns:
+            Audio file path
+        """
+        cache = get_tts_cache()
+        
+        # Without a destination path (e.g. ComfyUI returning a URL) there is nothing to cache into
+        if cache is None or not output_path:
+            return await generate(output_path)
+        
+        key = FileCache.make_key(**cache_parts)
+        if cache.materialize(key, output_path):
+            logger.info(f"♻️  TTS cache hit: {output_path}")
+            return output_path
+        
+        # Never write through an existing file: it may be a hard link into the cache
+        if os.path.lexists(output_path):
+            os.unlink(output_path)
+        
+        audio_path = await generate(output_path)
+        
+        if audio_path and os.path.isfile(audio_path):
+            cache.put(key, audio_path)
+        
+        return audio_path
+    
+    def cache_stats(self) -> Optional[dict]:
+        """
+        TTS cache statistics
+        
+        Returns:
+            Stats dict (hits, misses, hit_rate, entries, size_bytes, max_size_bytes), or None if the cache is disabled
+        """
+        cache = get_tts_cache()
+        return cache.stats() if cache else None
     
     async def _call_local_tts(
         self,
@@ -293,19 +395,10 @@ class TTSService(ComfyBaseService):
             
             # If output_path provided and audio_path is URL, download to local
             if output_path and audio_path.startswith(('http://', 'https://')):
-                import httpx
-                import os
-                
-                # Ensure parent directory exists
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                from pixelle_video.services.download_manager import get_download_manager
                 
                 logger.info(f"Downloading audio from {audio_path} to {output_path}")
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(audio_path)
-                    response.raise_for_status()
-                    
-                    with open(output_path, 'wb') as f:
-                        f.write(response.content)
+                await get_download_manager().download(audio_path, output_path)
                 
                 logger.info(f"✅ Generated audio (ComfyUI): {output_path}")
                 return output_path
@@ -24,16 +24,22 @@ Features:
 Note: Requires FFmpeg to be installed on the system.
 """
 
+import asyncio
+import functools
 import os
 import shutil
 import tempfile
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
 import ffmpeg
 from loguru import logger
 
+from pixelle_video.services.media_probe import ProbeResult, media_probe
 from pixelle_video.utils.os_util import (
     get_resource_path,
     list_resource_files,
@@ -61,6 +67,68 @@ def check_ffmpeg() -> None:
 check_ffmpeg()
 
 
+_ffmpeg_executor: Optional[ThreadPoolExecutor] = None
+_ffmpeg_executor_lock = threading.Lock()
+
+
+def get_ffmpeg_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide worker pool for blocking FFmpeg jobs
+    
+    FFmpeg itself runs in a child process, so worker threads only wait on it;
+    the pool size bounds how many encodes run at once across all tasks.
+    Size comes from concurrency.ffmpeg_workers (0 = one per CPU core).
+    """
+    global _ffmpeg_executor
+    
+    with _ffmpeg_executor_lock:
+        if _ffmpeg_executor is None:
+            from pixelle_video.config import config_manager
+            workers = config_manager.config.concurrency.ffmpeg_workers or (os.cpu_count() or 2)
+            _ffmpeg_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ffmpeg")
+            logger.debug(f"FFmpeg worker pool created ({workers} workers)")
+    return _ffmpeg_executor
+
+
+@dataclass(frozen=True)
+class SegmentEncodingProfile:
+    """
+    Encoding parameters shared by every storyboard segment producer
+    
+    Segments encoded with the same profile (and fps) have identical codec
+    parameters, so concat_videos can join them with the `-c copy` demuxer
+    regardless of whether they came from an image or a generated video.
+    """
+    vcodec: str = "libx264"
+    pix_fmt: str = "yuv420p"
+    preset: str = "medium"
+    crf: int = 23
+    acodec: str = "aac"
+    audio_bitrate: str = "192k"
+    audio_sample_rate: int = 44100
+    audio_channels: int = 2
+    video_track_timescale: int = 90000
+    
+    def output_kwargs(self, fps: int) -> Dict[str, Any]:
+        """ffmpeg-python output() keyword arguments for this profile"""
+        return {
+            "vcodec": self.vcodec,
+            "pix_fmt": self.pix_fmt,
+            "preset": self.preset,
+            "crf": self.crf,
+            "r": fps,
+            "acodec": self.acodec,
+            "audio_bitrate": self.audio_bitrate,
+            "ar": self.audio_sample_rate,
+            "ac": self.audio_channels,
+            "video_track_timescale": self.video_track_timescale,
+        }
+
+
+# Profile used by create_video_from_image and build_video_segment
+DEFAULT_SEGMENT_PROFILE = SegmentEncodingProfile()
+
+
 class VideoService:
     """
     Video compositor for common video processing tasks
@@ -98,8 +166,47 @@ class VideoService:
         ...     "narration.mp3",
         ...     "segment.mp4"
         ... )
+        >>> 
+        >>> # From async code, use the *_async variants so the event loop is not blocked
+        >>> await compositor.create_video_from_image_async(
+        ...     "frame.png",
+        ...     "narration.mp3",
+        ...     "segment.mp4"
+        ... )
     """
     
+    async def _run_in_pool(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking VideoService method on the FFmpeg worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_ffmpeg_executor(),
+            functools.partial(func, *args, **kwargs)
+        )
+    
+    async def concat_videos_async(self, *args, **kwargs) -> str:
+        """Async version of concat_videos (runs on the FFmpeg worker pool)"""
+        return await self._run_in_pool(self.concat_videos, *args, **kwargs)
+    
+    async def merge_audio_video_async(self, *args, **kwargs) -> str:
+        """Async version of merge_audio_video (runs on the FFmpeg worker pool)"""
+        return await self._run_in_pool(self.merge_audio_video, *args, **kwargs)
+    
+    async def overlay_image_on_video_async(self, *args, **kwargs) -> str:
+        """Async version of overlay_image_on_video (runs on the FFmpeg worker pool)"""
+        return await self._run_in_pool(self.overlay_image_on_video, *args, **kwargs)
+    
+    async def create_video_from_image_async(self, *args, **kwargs) -> str:
+        """Async version of create_video_from_image (runs on the FFmpeg worker pool)"""
+        return await self._run_in_pool(self.create_video_from_image, *args, **kwargs)
+    
+    async def build_video_segment_async(self, *args, **kwargs) -> str:
+        """Async version of build_video_segment (runs on the FFmpeg worker pool)"""
+        return await self._run_in_pool(self.build_video_segment, *args, **kwargs)
+    
+    async def add_bgm_async(self, *args, **kwargs) -> str:
+        """Async version of add_bgm (runs on the FFmpeg worker pool)"""
+        return await self._run_in_pool(self.add_bgm, *args, **kwargs)
+    
     def concat_videos(
         self,
         videos: List[str],
@@ -147,6 +254,16 @@ class VideoService:
             shutil.copy(videos[0], output)
             return output
         
+        # The demuxer only works for segments with identical codec parameters
+        if method == "demuxer":
+            compatible, mismatches = self.validate_segments(videos)
+            if not compatible:
+                logger.warning(
+                    "⚠️ Segments differ in codec parameters, falling back to concat filter (re-encode):\n   "
+                    + "\n   ".join(mismatches)
+                )
+                method = "filter"
+        
         logger.info(f"Concatenating {len(videos)} videos using {method} method")
         
         # Step 1: Concatenate videos
@@ -177,6 +294,59 @@ class VideoService:
             else:
                 return self._concat_filter(videos, output)
     
+    def _stream_signature(self, info: ProbeResult) -> Tuple:
+        """Codec parameters that must match for stream-copy concatenation"""
+        video_info = info.video_stream
+        audio_info = info.audio_stream
+        
+        video_sig = None
+        if video_info:
+            video_sig = (
+                video_info.codec_name,
+                video_info.profile,
+                video_info.width,
+                video_info.height,
+                video_info.pix_fmt,
+                video_info.r_frame_rate,
+                video_info.time_base,
+            )
+        audio_sig = None
+        if audio_info:
+            audio_sig = (
+                audio_info.codec_name,
+                audio_info.sample_rate,
+                audio_info.channels,
+            )
+        return video_sig, audio_sig
+    
+    def validate_segments(self, videos: List[str]) -> Tuple[bool, List[str]]:
+        """
+        Check whether segments can be joined by the concat demuxer without re-encoding
+        
+        All segments are probed in one concurrent batch and compared against the first.
+        
+        Args:
+            videos: Segment file paths
+        
+        Returns:
+            (compatible, mismatches) where mismatches describes each differing segment
+        """
+        if len(videos) < 2:
+            return True, []
+        
+        try:
+            signatures = [self._stream_signature(info) for info in media_probe.probe_many(videos)]
+        except Exception as e:
+            return False, [f"probe failed: {e}"]
+        
+        reference = signatures[0]
+        mismatches = [
+            f"{os.path.basename(video)}: video={sig[0]} audio={sig[1]} (expected video={reference[0]} audio={reference[1]})"
+            for video, sig in zip(videos[1:], signatures[1:])
+            if sig != reference
+        ]
+        return not mismatches, mismatches
+    
     def _concat_demuxer(self, videos: List[str], output: str) -> str:
         """
         Concatenate using concat demuxer (fast, no re-encoding)
@@ -266,9 +436,7 @@ class VideoService:
     def _get_video_duration(self, video: str) -> float:
         """Get video duration in seconds"""
         try:
-            probe = ffmpeg.probe(video)
-            duration = float(probe['format']['duration'])
-            return duration
+            return float(media_probe.probe(video).duration)
         except Exception as e:
             logger.warning(f"Failed to get video duration: {e}")
             return 0.0
@@ -276,9 +444,7 @@ class VideoService:
     def _get_audio_duration(self, audio: str) -> float:
         """Get audio duration in seconds"""
         try:
-            probe = ffmpeg.probe(audio)
-            duration = float(probe['format']['duration'])
-            return duration
+            return float(media_probe.probe(audio).duration)
         except Exception as e:
             logger.warning(f"Failed to get audio duration: {e}, using estimate")
             # Fallback: estimate based on file size (very rough)
@@ -299,9 +465,7 @@ class VideoService:
             True if video has audio stream, False otherwise
         """
         try:
-            probe = ffmpeg.probe(video)
-            audio_streams = [s for s in probe.get('streams', []) if s['codec_type'] == 'audio']
-            has_audio = len(audio_streams) > 0
+            has_audio = media_probe.probe(video).has_audio
             logger.debug(f"Video {video} has_audio={has_audio}")
             return has_audio
         except Exception as e:
@@ -413,13 +577,10 @@ class VideoService:
             else:  # black
                 # Generate black frames for padding duration
                 # Get video properties
-                probe = ffmpeg.probe(video)
-                video_info = next(s for s in probe['streams'] if s['codec_type'] == 'video')
-                width = int(video_info['width'])
-                height = int(video_info['height'])
-                fps_str = video_info['r_frame_rate']
-                fps_num, fps_den = map(int, fps_str.split('/'))
-                fps = fps_num / fps_den if fps_den != 0 else 30
+                video_info = media_probe.probe(video)
+                width = int(video_info.width)
+                height = int(video_info.height)
+                fps = video_info.fps or 30
                 
                 # Create black video for padding
                 black_video_path = self._get_unique_temp_path("black_pad", os.path.basename(output))
@@ -555,10 +716,9 @@ class VideoService:
         
         try:
             # Get overlay image dimensions
-            overlay_probe = ffmpeg.probe(overlay_image)
-            overlay_stream = next(s for s in overlay_probe['streams'] if s['codec_type'] == 'video')
-            overlay_width = int(overlay_stream['width'])
-            overlay_height = int(overlay_stream['height'])
+            overlay_info = media_probe.probe(overlay_image)
+            overlay_width = int(overlay_info.width)
+            overlay_height = int(overlay_info.height)
             
             logger.debug(f"Overlay dimensions: {overlay_width}x{overlay_height}")
             
@@ -606,12 +766,126 @@ class VideoService:
             logger.error(f"FFmpeg overlay error: {error_msg}")
             raise RuntimeError(f"Failed to overlay image on video: {error_msg}")
     
+    def build_video_segment(
+        self,
+        video: str,
+        overlay_image: str,
+        audio: str,
+        output: str,
+        target_duration: Optional[float] = None,
+        pad_strategy: str = "freeze",
+        scale_mode: str = "contain",
+        audio_volume: float = 1.0,
+        duration_tolerance: float = 0.3,
+        fps: int = 30,
+        profile: SegmentEncodingProfile = DEFAULT_SEGMENT_PROFILE,
+    ) -> str:
+        """
+        Build a video segment in a single FFmpeg pass
+        
+        Equivalent to overlay_image_on_video followed by merge_audio_video
+        (with its pad/trim adjustment), but expressed as one filter graph and
+        encoded once instead of up to three times.
+        
+        Args:
+            video: Base video file path
+            overlay_image: Transparent overlay image path (its size is the output size)
+            audio: Narration audio path (replaces any audio in the video)
+            output: Output video file path
+            target_duration: Segment duration in seconds. If None, follows the
+                merge_audio_video rules: audio duration, unless the video is
+                longer by at most duration_tolerance (then the video duration)
+            pad_strategy: How to extend a short video - "freeze" (last frame) or "black"
+            scale_mode: How to fit the video to the overlay - "contain", "cover" or "stretch"
+            audio_volume: Volume of the narration audio
+            duration_tolerance: Tolerance for video being longer than audio (seconds)
+            fps: Output frame rate (keep equal across segments for lossless concat)
+            profile: Segment encoding profile
+        
+        Returns:
+            Path to the output video file
+        
+        Raises:
+            RuntimeError: If FFmpeg execution fails
+        """
+        video_duration = self._get_video_duration(video)
+        audio_duration = self._get_audio_duration(audio)
+        
+        if target_duration is None:
+            diff = video_duration - audio_duration
+            target_duration = video_duration if 0 <= diff <= duration_tolerance else audio_duration
+        
+        logger.info(
+            f"Building segment in one pass: video={video_duration:.2f}s, audio={audio_duration:.2f}s, "
+            f"target={target_duration:.2f}s (scale_mode={scale_mode}, pad_strategy={pad_strategy})"
+        )
+        
+        try:
+            # Output size follows the overlay image
+            overlay_info = media_probe.probe(overlay_image)
+            overlay_width = int(overlay_info.width)
+            overlay_height = int(overlay_info.height)
+            
+            # Trimming happens on input, no separate pass
+            input_video = ffmpeg.input(video, t=target_duration) if video_duration > target_duration else ffmpeg.input(video)
+            video_stream = input_video.video
+            
+            if scale_mode == "contain":
+                video_stream = (
+                    video_stream
+                    .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='decrease')
+                    .filter('pad', overlay_width, overlay_height, '(ow-iw)/2', '(oh-ih)/2', color='black')
+                )
+            elif scale_mode == "cover":
+                video_stream = (
+                    video_stream
+                    .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='increase')
+                    .filter('crop', overlay_width, overlay_height)
+                )
+            else:  # stretch
+                video_stream = video_stream.filter('scale', overlay_width, overlay_height)
+            
+            video_stream = ffmpeg.overlay(video_stream, ffmpeg.input(overlay_image))
+            
+            # Extend a short video inside the same graph
+            if video_duration < target_duration:
+                pad_duration = target_duration - video_duration
+                if pad_strategy == "freeze":
+                    video_stream = video_stream.filter('tpad', stop_mode='clone', stop_duration=pad_duration)
+                else:  # black
+                    video_stream = video_stream.filter('tpad', stop_mode='add', stop_duration=pad_duration, color='black')
+            
+            audio_stream = ffmpeg.input(audio).audio.filter('volume', audio_volume)
+            if audio_duration < target_duration:
+                audio_stream = audio_stream.filter('apad', whole_dur=target_duration)
+            
+            (
+                ffmpeg
+                .output(
+                    video_stream,
+                    audio_stream,
+                    output,
+                    t=target_duration,
+                    **profile.output_kwargs(fps)
+                )
+                .overwrite_output()
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+            
+            logger.success(f"Video segment built: {output} (duration: {target_duration:.2f}s)")
+            return output
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            logger.error(f"FFmpeg segment build error: {error_msg}")
+            raise RuntimeError(f"Failed to build video segment: {error_msg}")
+    
     def create_video_from_image(
         self,
         image: str,
         audio: str,
         output: str,
         fps: int = 30,
+        profile: SegmentEncodingProfile = DEFAULT_SEGMENT_PROFILE,
     ) -> str:
         """
         Create video from static image and audio
@@ -621,6 +895,7 @@ class VideoService:
             audio: Audio file path
             output: Output video path
             fps: Frames per second
+            profile: Segment encoding profile
         
         Returns:
             Path to the output video
@@ -644,8 +919,7 @@ class VideoService:
         
         try:
             # Get audio duration to ensure exact video duration match
-            probe = ffmpeg.probe(audio)
-            audio_duration = float(probe['format']['duration'])
+            audio_duration = float(media_probe.probe(audio).duration)
             logger.debug(f"Audio duration: {audio_duration:.3f}s")
             
             # Input image with loop (loop=1 means loop indefinitely)
@@ -662,13 +936,7 @@ class VideoService:
                     input_audio,
                     output,
                     t=audio_duration,  # Force video duration to match audio exactly
-                    vcodec='libx264',
-                    acodec='aac',
-                    pix_fmt='yuv420p',
-                    audio_bitrate='192k',
-                    preset='medium',
-                    crf=23,
-                    **{'b:v': '2M'}  # Video bitrate
+                    **profile.output_kwargs(fps)
                 )
                 .overwrite_output()
                 .run(capture_stdout=True, capture_stderr=True)
@@ -968,13 +1236,10 @@ class VideoService:
             else:  # black
                 # Generate black frames for padding duration
                 # Get video properties
-                probe = ffmpeg.probe(video)
-                video_info = next(s for s in probe['streams'] if s['codec_type'] == 'video')
-                width = int(video_info['width'])
-                height = int(video_info['height'])
-                fps_str = video_info['r_frame_rate']
-                fps_num, fps_den = map(int, fps_str.split('/'))
-                fps = fps_num / fps_den if fps_den != 0 else 30
+                video_info = media_probe.probe(video)
+                width = int(video_info.width)
+                height = int(video_info.height)
+                fps = video_info.fps or 30
                 
                 # Create black video for padding
                 black_input = ffmpeg.input(
@@ -182,15 +182,15 @@ class VideoAnalysisService(ComfyBaseService):
                     # Find text file entry
                     for item in raw_data:
                         if item.get('fileType') == 'txt' and 'fileUrl' in item:
-                            # Download text content from URL
-                            import aiohttp
-                            async with aiohttp.ClientSession() as session:
-                                async with session.get(item['fileUrl']) as resp:
-                                    if resp.status == 200:
-                                        description = await resp.text()
-                                        description = description.strip()
-                                        logger.debug(f"Downloaded description from URL: {description[:100]}...")
-                                        break
+                            # Download text content from URL (shared pooled client)
+                            from pixelle_video.services.download_manager import DownloadError, get_download_manager
+                            try:
+                                description = (await get_download_manager().fetch_text(item['fileUrl'])).strip()
+                            except DownloadError as e:
+                                logger.warning(f"Failed to download text output: {e}")
+                                continue
+                            logger.debug(f"Downloaded description from URL: {description[:100]}...")
+                            break
             
             if not description:
                 logger.error(f"No text found in result. Status: {result.status}, Outputs: {result.outputs}, Texts: {result.texts}")
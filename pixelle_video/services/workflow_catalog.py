@@ -0,0 +1,184 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Workflow Catalog - Process-wide cache of available ComfyUI workflows
+
+Scans workflows/{source}/*.json and data/workflows/{source}/*.json once and
+keeps the parsed workflow info keyed by "{source}/{filename}". The catalog is
+rebuilt only when the modification time of one of the workflow directories
+changes (a workflow file or source directory was added, removed or replaced),
+so resolving a workflow on the hot path costs a few stat() calls and a dict
+lookup instead of directory listings and JSON parses.
+
+All ComfyBaseService subclasses share the global `workflow_catalog`.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from pixelle_video.utils.os_util import (
+    get_data_path,
+    get_resource_path,
+    get_root_path,
+    list_resource_dirs,
+    list_resource_files,
+)
+
+
+def parse_workflow_file(file_path: Path, source: str) -> Dict[str, Any]:
+    """
+    Parse workflow file and extract metadata
+
+    Args:
+        file_path: Path to workflow JSON file
+        source: Source directory name (e.g., "selfhost", "runninghub")
+
+    Returns:
+        Workflow info dict with structure:
+        {
+            "name": "image_flux.json",
+            "display_name": "image_flux.json - Runninghub",
+            "source": "runninghub",
+            "path": "workflows/runninghub/image_flux.json",
+            "key": "runninghub/image_flux.json",
+            "workflow_id": "123456"  # Only for RunningHub
+        }
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = json.load(f)
+
+    # Build base info
+    workflow_info = {
+        "name": file_path.name,
+        "display_name": f"{file_path.name} - {source.title()}",
+        "source": source,
+        "path": str(file_path),
+        "key": f"{source}/{file_path.name}"
+    }
+
+    # Check if it's a wrapper format (RunningHub, etc.)
+    if "source" in content:
+        # Wrapper format: {"source": "runninghub", "workflow_id": "xxx", ...}
+        if "workflow_id" in content:
+            workflow_info["workflow_id"] = content["workflow_id"]
+
+    return workflow_info
+
+
+class WorkflowCatalog:
+    """
+    Cached catalog of all workflow files, invalidated by directory mtime
+
+    Usage:
+        from pixelle_video.services.workflow_catalog import workflow_catalog
+
+        info = workflow_catalog.get("runninghub/image_flux.json")
+        tts_workflows = workflow_catalog.list(lambda name: name.startswith("tts_"))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._workflows: Dict[str, Dict[str, Any]] = {}
+        self._signature: Optional[Tuple[Tuple[str, int], ...]] = None
+
+    @staticmethod
+    def _directory_signature() -> Tuple[Tuple[str, int], ...]:
+        """mtimes of workflows/, data/workflows/ and every source directory in them"""
+        signature = []
+        for base_dir in (get_root_path("workflows"), get_data_path("workflows")):
+            try:
+                signature.append((base_dir, os.stat(base_dir).st_mtime_ns))
+                with os.scandir(base_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            signature.append((entry.path, entry.stat().st_mtime_ns))
+            except FileNotFoundError:
+                signature.append((base_dir, 0))
+        return tuple(sorted(signature))
+
+    def _scan(self) -> Dict[str, Dict[str, Any]]:
+        """Scan and parse all workflow files (merged from workflows/ and data/workflows/)"""
+        workflows = {}
+
+        source_dirs = list_resource_dirs("workflows")
+        if not source_dirs:
+            logger.warning("No workflow source directories found")
+            return workflows
+
+        for source_name in source_dirs:
+            for filename in list_resource_files("workflows", source_name):
+                if not filename.endswith('.json'):
+                    continue
+                try:
+                    # Get actual file path (custom > default)
+                    file_path = Path(get_resource_path("workflows", source_name, filename))
+                    workflow_info = parse_workflow_file(file_path, source_name)
+                    workflows[workflow_info["key"]] = workflow_info
+                    logger.debug(f"Found workflow: {workflow_info['key']}")
+                except Exception as e:
+                    logger.error(f"Failed to parse workflow {source_name}/{filename}: {e}")
+
+        return workflows
+
+    def _ensure_fresh(self) -> Dict[str, Dict[str, Any]]:
+        """Rescan if a workflow directory changed since the last scan"""
+        signature = self._directory_signature()
+        with self._lock:
+            if signature != self._signature:
+                self._workflows = self._scan()
+                self._signature = signature
+                logger.debug(f"📚 Workflow catalog loaded: {len(self._workflows)} workflows")
+            return self._workflows
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a workflow by key
+
+        Args:
+            key: Workflow key (e.g., "runninghub/image_flux.json")
+
+        Returns:
+            Copy of the workflow info dict, or None if not found
+        """
+        info = self._ensure_fresh().get(key)
+        return dict(info) if info else None
+
+    def list(self, name_filter: Optional[Callable[[str], bool]] = None) -> List[Dict[str, Any]]:
+        """
+        List workflows, sorted by key
+
+        Args:
+            name_filter: Optional predicate on the workflow filename
+
+        Returns:
+            Copies of the matching workflow info dicts
+        """
+        workflows = self._ensure_fresh()
+        return [
+            dict(workflows[key]) for key in sorted(workflows)
+            if name_filter is None or name_filter(workflows[key]["name"])
+        ]
+
+    def invalidate(self):
+        """Force a rescan on next access (e.g., after editing a workflow file in place)"""
+        with self._lock:
+            self._signature = None
+
+
+# Global instance shared by all ComfyUI services
+workflow_catalog = WorkflowCatalog()
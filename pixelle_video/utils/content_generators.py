@@ -17,9 +17,10 @@ Pure/stateless functions for generating content using LLM.
 These functions are reusable across different pipelines.
 """
 
+import asyncio
 import json
 import re
-from typing import List, Optional, Literal
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Literal
 
 from loguru import logger
 
@@ -126,7 +127,8 @@ async def generate_narrations_from_topic(
     response = await llm_service(
         prompt=prompt,
         temperature=0.8,
-        max_tokens=2000
+        max_tokens=2000,
+        validate=_has_items("narrations", n_scenes)
     )
     
     logger.debug(f"LLM response: {response[:200]}...")
@@ -184,7 +186,8 @@ async def generate_narrations_from_content(
     response = await llm_service(
         prompt=prompt,
         temperature=0.8,
-        max_tokens=2000
+        max_tokens=2000,
+        validate=_has_items("narrations", n_scenes)
     )
     
     # Parse JSON
@@ -206,6 +209,215 @@ async def generate_narrations_from_content(
     return narrations
 
 
+class NarrationStreamParser:
+    """
+    Incremental parser for the "narrations" array of a streamed LLM response
+    
+    Feed text deltas as they arrive; every narration string whose closing
+    quote has been received is returned once. Anything unexpected inside
+    the array (e.g. objects instead of strings) stops incremental parsing,
+    and the caller falls back to parsing the full response.
+    
+    Example:
+        parser = NarrationStreamParser()
+        parser.feed('{"narrations": ["First sce')   # -> []
+        parser.feed('ne", "Second')                  # -> ["First scene"]
+    """
+    
+    ARRAY_START_PATTERN = re.compile(r'"narrations"\s*:\s*\[')
+    
+    def __init__(self):
+        self.buffer = ""
+        self.done = False        # Closing bracket seen (or parsing abandoned)
+        self.failed = False      # Parsing abandoned, full-response fallback needed
+        self._pos = 0            # Next unscanned position in buffer
+        self._in_array = False
+        self._string_start: Optional[int] = None
+        self._escaped = False
+    
+    def feed(self, text: str) -> List[str]:
+        """
+        Add a text delta
+        
+        Args:
+            text: Next chunk of the response
+        
+        Returns:
+            Narrations completed by this chunk (possibly empty)
+        """
+        self.buffer += text
+        completed = []
+        
+        if self.done:
+            return completed
+        
+        if not self._in_array:
+            match = self.ARRAY_START_PATTERN.search(self.buffer)
+            if not match:
+                return completed
+            self._in_array = True
+            self._pos = match.end()
+        
+        buffer = self.buffer
+        while self._pos < len(buffer):
+            char = buffer[self._pos]
+            
+            if self._string_start is not None:
+                # Inside a string literal: look for the unescaped closing quote
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    literal = buffer[self._string_start:self._pos + 1]
+                    self._string_start = None
+                    try:
+                        completed.append(json.loads(literal))
+                    except json.JSONDecodeError:
+                        self.done = self.failed = True
+                        return completed
+            elif char == '"':
+                self._string_start = self._pos
+            elif char == "]":
+                self.done = True
+                return completed
+            elif not (char.isspace() or char == ","):
+                self.done = self.failed = True
+                return completed
+            
+            self._pos += 1
+        
+        return completed
+
+
+async def stream_narrations_from_topic(
+    llm_service,
+    topic: str,
+    n_scenes: int = 5,
+    min_words: int = 5,
+    max_words: int = 20
+) -> AsyncIterator[str]:
+    """
+    Generate narrations from topic, yielding each one as soon as the LLM has written it
+    
+    Streaming counterpart of generate_narrations_from_topic (same prompt and validation).
+    
+    Args:
+        llm_service: LLM service instance
+        topic: Topic/theme to generate narrations from
+        n_scenes: Number of narrations to generate
+        min_words: Minimum narration length
+        max_words: Maximum narration length
+    
+    Yields:
+        Narration texts, in order
+    
+    Raises:
+        ValueError: If the response has fewer than n_scenes narrations (raised after
+                    the narrations received so far have been yielded)
+    """
+    from pixelle_video.prompts import build_topic_narration_prompt
+    
+    logger.info(f"Streaming {n_scenes} narrations from topic: {topic}")
+    
+    prompt = build_topic_narration_prompt(
+        topic=topic,
+        n_storyboard=n_scenes,
+        min_words=min_words,
+        max_words=max_words
+    )
+    
+    async for narration in _stream_narrations(llm_service, prompt, n_scenes):
+        yield narration
+
+
+async def stream_narrations_from_content(
+    llm_service,
+    content: str,
+    n_scenes: int = 5,
+    min_words: int = 5,
+    max_words: int = 20
+) -> AsyncIterator[str]:
+    """
+    Generate narrations from user-provided content, yielding each one as soon as it is written
+    
+    Streaming counterpart of generate_narrations_from_content (same prompt and validation).
+    
+    Args:
+        llm_service: LLM service instance
+        content: User-provided content
+        n_scenes: Number of narrations to generate
+        min_words: Minimum narration length
+        max_words: Maximum narration length
+    
+    Yields:
+        Narration texts, in order
+    
+    Raises:
+        ValueError: If the response has fewer than n_scenes narrations
+    """
+    from pixelle_video.prompts import build_content_narration_prompt
+    
+    logger.info(f"Streaming {n_scenes} narrations from content ({len(content)} chars)")
+    
+    prompt = build_content_narration_prompt(
+        content=content,
+        n_storyboard=n_scenes,
+        min_words=min_words,
+        max_words=max_words
+    )
+    
+    async for narration in _stream_narrations(llm_service, prompt, n_scenes):
+        yield narration
+
+
+async def _stream_narrations(llm_service, prompt: str, n_scenes: int) -> AsyncIterator[str]:
+    """
+    Stream a narration prompt and yield up to n_scenes narrations as they complete
+    
+    Falls back to parsing the full response (e.g. markdown-wrapped or malformed
+    JSON) for narrations the incremental parser could not pick up.
+    """
+    parser = NarrationStreamParser()
+    received = 0
+    
+    stream = llm_service.stream(
+        prompt=prompt,
+        temperature=0.8,
+        max_tokens=2000,
+        validate=_has_items("narrations", n_scenes)
+    )
+    async for delta in stream:
+        for narration in parser.feed(delta):
+            received += 1
+            if received <= n_scenes:
+                logger.debug(f"Narration {received}/{n_scenes} streamed: {narration[:50]}...")
+                yield narration
+    
+    emitted = min(received, n_scenes)
+    if received < n_scenes:
+        # Incremental parsing failed or stopped early: recover from the full response
+        if parser.failed:
+            logger.warning("Narration stream did not parse incrementally, falling back to full response")
+        result = _parse_json(parser.buffer)
+        if "narrations" not in result:
+            raise ValueError("Invalid response format: missing 'narrations' key")
+        
+        narrations = result["narrations"]
+        received = len(narrations)
+        for narration in narrations[emitted:n_scenes]:
+            emitted += 1
+            yield narration
+    
+    # Validate count
+    if received > n_scenes:
+        logger.warning(f"Got {received} narrations, taking first {n_scenes}")
+    elif emitted < n_scenes:
+        raise ValueError(f"Expected {n_scenes} narrations, got only {emitted}")
+    
+    logger.info(f"Streamed {emitted} narrations successfully")
+
+
 async def split_narration_script(
     script: str,
     split_mode: Literal["paragraph", "line", "sentence"] = "paragraph",
@@ -273,10 +485,11 @@ async def generate_image_prompts(
     max_words: int = 60,
     batch_size: int = 10,
     max_retries: int = 3,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    max_concurrent_batches: Optional[int] = None
 ) -> List[str]:
     """
-    Generate image prompts from narrations (with batching and retry)
+    Generate image prompts from narrations (with concurrent batching and retry)
     
     Args:
         llm_service: LLM service instance
@@ -286,24 +499,16 @@ async def generate_image_prompts(
         batch_size: Max narrations per batch (default: 10)
         max_retries: Max retry attempts per batch (default: 3)
         progress_callback: Optional callback(completed, total, message) for progress updates
+        max_concurrent_batches: Batches sent to the LLM at once (default: concurrency.llm)
     
     Returns:
-        List of image prompts (base prompts, without prefix applied)
+        List of image prompts (base prompts, without prefix applied), in narration order
     """
     from pixelle_video.prompts import build_image_prompt_prompt
     
     logger.info(f"Generating image prompts for {len(narrations)} narrations (batch_size={batch_size})")
     
-    # Split narrations into batches
-    batches = [narrations[i:i + batch_size] for i in range(0, len(narrations), batch_size)]
-    logger.info(f"Split into {len(batches)} batches")
-    
-    all_prompts = []
-    
-    # Process each batch
-    for batch_idx, batch_narrations in enumerate(batches, 1):
-        logger.info(f"Processing batch {batch_idx}/{len(batches)} ({len(batch_narrations)} narrations)")
-        
+    async def process_batch(batch_idx: int, batch_narrations: List[str]) -> List[str]:
         # Retry logic for this batch
         for attempt in range(1, max_retries + 1):
             try:
@@ -317,7 +522,8 @@ async def generate_image_prompts(
                 response = await llm_service(
                     prompt=prompt,
                     temperature=0.7,
-                    max_tokens=8192
+                    max_tokens=8192,
+                    validate=_has_items("image_prompts", len(batch_narrations), exact=True)
                 )
                 
                 logger.debug(f"Batch {batch_idx} attempt {attempt}: LLM response length: {len(response)} chars")
@@ -347,17 +553,7 @@ async def generate_image_prompts(
                 
                 # Success!
                 logger.info(f"✅ Batch {batch_idx} completed successfully ({len(batch_prompts)} prompts)")
-                all_prompts.extend(batch_prompts)
-                
-                # Report progress
-                if progress_callback:
-                    progress_callback(
-                        len(all_prompts),
-                        len(narrations),
-                        f"Batch {batch_idx}/{len(batches)} completed"
-                    )
-                
-                break
+                return batch_prompts
                 
             except json.JSONDecodeError as e:
                 logger.error(f"Batch {batch_idx} JSON parse error (attempt {attempt}/{max_retries}): {e}")
@@ -365,6 +561,14 @@ async def generate_image_prompts(
                     raise
                 logger.info(f"Retrying batch {batch_idx}...")
     
+    all_prompts = await _run_batches(
+        narrations,
+        batch_size,
+        process_batch,
+        max_concurrent_batches,
+        progress_callback
+    )
+    
     logger.info(f"✅ Generated {len(all_prompts)} image prompts")
     return all_prompts
 
@@ -376,10 +580,11 @@ async def generate_video_prompts(
     max_words: int = 60,
     batch_size: int = 10,
     max_retries: int = 3,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    max_concurrent_batches: Optional[int] = None
 ) -> List[str]:
     """
-    Generate video prompts from narrations (with batching and retry)
+    Generate video prompts from narrations (with concurrent batching and retry)
     
     Args:
         llm_service: LLM service instance
@@ -389,24 +594,16 @@ async def generate_video_prompts(
         batch_size: Max narrations per batch (default: 10)
         max_retries: Max retry attempts per batch (default: 3)
         progress_callback: Optional callback(completed, total, message) for progress updates
+        max_concurrent_batches: Batches sent to the LLM at once (default: concurrency.llm)
     
     Returns:
-        List of video prompts (base prompts, without prefix applied)
+        List of video prompts (base prompts, without prefix applied), in narration order
     """
     from pixelle_video.prompts.video_generation import build_video_prompt_prompt
     
     logger.info(f"Generating video prompts for {len(narrations)} narrations (batch_size={batch_size})")
     
-    # Split narrations into batches
-    batches = [narrations[i:i + batch_size] for i in range(0, len(narrations), batch_size)]
-    logger.info(f"Split into {len(batches)} batches")
-    
-    all_prompts = []
-    
-    # Process each batch
-    for batch_idx, batch_narrations in enumerate(batches, 1):
-        logger.info(f"Processing batch {batch_idx}/{len(batches)} ({len(batch_narrations)} narrations)")
-        
+    async def process_batch(batch_idx: int, batch_narrations: List[str]) -> List[str]:
         # Retry logic for this batch
         for attempt in range(1, max_retries + 1):
             try:
@@ -420,7 +617,8 @@ async def generate_video_prompts(
                 response = await llm_service(
                     prompt=prompt,
                     temperature=0.7,
-                    max_tokens=8192
+                    max_tokens=8192,
+                    validate=_has_items("video_prompts", len(batch_narrations), exact=True)
                 )
                 
                 logger.debug(f"Batch {batch_idx} attempt {attempt}: LLM response length: {len(response)} chars")
@@ -439,17 +637,8 @@ async def generate_video_prompts(
                         f"Prompt count mismatch: expected {len(batch_narrations)}, got {len(batch_prompts)}"
                     )
                 
-                # Success - add to all_prompts
-                all_prompts.extend(batch_prompts)
                 logger.info(f"✓ Batch {batch_idx} completed: {len(batch_prompts)} video prompts")
-                
-                # Report progress
-                if progress_callback:
-                    completed = len(all_prompts)
-                    total = len(narrations)
-                    progress_callback(completed, total, f"Batch {batch_idx}/{len(batches)} completed")
-                
-                break  # Success, move to next batch
+                return batch_prompts
             
             except Exception as e:
                 logger.warning(f"✗ Batch {batch_idx} attempt {attempt} failed: {e}")
@@ -457,10 +646,82 @@ async def generate_video_prompts(
                     raise
                 logger.info(f"Retrying batch {batch_idx}...")
     
+    all_prompts = await _run_batches(
+        narrations,
+        batch_size,
+        process_batch,
+        max_concurrent_batches,
+        progress_callback
+    )
+    
     logger.info(f"✅ Generated {len(all_prompts)} video prompts")
     return all_prompts
 
 
+async def _run_batches(
+    narrations: List[str],
+    batch_size: int,
+    process_batch: Callable[[int, List[str]], Awaitable[List[str]]],
+    max_concurrent_batches: Optional[int] = None,
+    progress_callback: Optional[callable] = None
+) -> List[str]:
+    """
+    Split narrations into batches and process them concurrently
+    
+    Each batch retries on its own (inside process_batch) without holding up
+    the others. Results keep narration order. If a batch fails for good, the
+    remaining batches are cancelled and the error is re-raised.
+    
+    Args:
+        narrations: List of narrations
+        batch_size: Max narrations per batch
+        process_batch: async (batch_idx, batch_narrations) -> prompts
+        max_concurrent_batches: Batches in flight at once (default: concurrency.llm)
+        progress_callback: Optional callback(completed, total, message), called as batches finish
+    
+    Returns:
+        Prompts of all batches, in narration order
+    """
+    if max_concurrent_batches is None:
+        from pixelle_video.config import config_manager
+        max_concurrent_batches = config_manager.config.concurrency.llm
+    
+    # Split narrations into batches
+    batches = [narrations[i:i + batch_size] for i in range(0, len(narrations), batch_size)]
+    logger.info(f"Split into {len(batches)} batches (max {max_concurrent_batches} concurrent)")
+    
+    semaphore = asyncio.Semaphore(max(1, max_concurrent_batches))
+    completed = 0
+    
+    async def run(batch_idx: int, batch_narrations: List[str]) -> List[str]:
+        nonlocal completed
+        async with semaphore:
+            logger.info(f"Processing batch {batch_idx}/{len(batches)} ({len(batch_narrations)} narrations)")
+            batch_prompts = await process_batch(batch_idx, batch_narrations)
+        
+        # Report progress
+        completed += len(batch_prompts)
+        if progress_callback:
+            progress_callback(
+                completed,
+                len(narrations),
+                f"Batch {batch_idx}/{len(batches)} completed"
+            )
+        return batch_prompts
+    
+    tasks = [asyncio.create_task(run(i, batch)) for i, batch in enumerate(batches, 1)]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    
+    return [prompt for batch_prompts in results for prompt in batch_prompts]
+
+
 def _parse_json(text: str) -> dict:
     """
     Parse JSON from text, with fallback to extract JSON from markdown code blocks
@@ -501,3 +762,24 @@ def _parse_json(text: str) -> dict:
     # If all fails, raise error
     raise json.JSONDecodeError("No valid JSON found", text, 0)
 
+
+def _has_items(key: str, count: int, exact: bool = False) -> Callable[[str], bool]:
+    """
+    Build a response check for LLMService(validate=...), so rejected responses are never cached
+    
+    Args:
+        key: JSON key holding the generated list
+        count: Number of items the caller needs
+        exact: Require exactly count items (otherwise at least count)
+    
+    Returns:
+        Callable taking the raw response text
+    """
+    def check(response: str) -> bool:
+        items = _parse_json(response).get(key)
+        if not isinstance(items, list):
+            return False
+        return len(items) == count if exact else len(items) >= count
+    
+    return check
+
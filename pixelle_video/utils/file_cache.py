@@ -0,0 +1,289 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Content-addressed file cache
+
+Stores generated files (audio, images, videos) under data/cache/<name>/,
+keyed by a hash of the inputs that produced them. An index file tracks
+size and last access so the store can be trimmed in LRU order once it
+exceeds its size budget.
+
+Usage:
+    cache = FileCache("tts", max_size_mb=1024)
+    key = FileCache.make_key(text="Hello", voice="zh-CN-YunjianNeural", speed=1.2)
+
+    if cache.materialize(key, "output/task/frames/01_audio.mp3"):
+        ...  # Cache hit, file is in place
+    else:
+        ...  # Generate the file, then:
+        cache.put(key, "output/task/frames/01_audio.mp3")
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from pixelle_video.utils.os_util import get_data_path
+
+
+def file_fingerprint(value: Any) -> Optional[str]:
+    """
+    Fingerprint a local file path as "abspath:size:mtime"
+
+    Lets cache keys change when an input file (workflow, reference audio)
+    is edited. Returns None for anything that is not an existing file.
+    """
+    if not isinstance(value, str) or not value or not os.path.isfile(value):
+        return None
+    stat = os.stat(value)
+    return f"{os.path.abspath(value)}:{stat.st_size}:{int(stat.st_mtime)}"
+
+
+class FileCache:
+    """
+    Disk-backed, content-addressed file cache with LRU size eviction
+
+    Thread-safe within a process. Hits are copied or hard-linked to the
+    caller's destination path; cached files are never handed out directly.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, name: str, max_size_mb: float = 1024, link_mode: str = "hardlink"):
+        """
+        Initialize cache
+
+        Args:
+            name: Cache name (subdirectory of data/cache/)
+            max_size_mb: Size budget in MB; least recently used entries are evicted beyond it
+            link_mode: How hits are materialized: "hardlink" (falls back to copy) or "copy"
+        """
+        self.name = name
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.link_mode = link_mode
+        self.cache_dir = Path(get_data_path("cache", name))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / self.INDEX_FILE
+
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """
+        Build a cache key from the inputs that determine the output
+
+        Args:
+            **parts: Key components (must be JSON-serializable or str()-able)
+
+        Returns:
+            SHA-256 hex digest
+        """
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load {self.name} cache index, starting empty: {e}")
+            return {}
+
+    def _save_index(self):
+        temp_file = self.index_file.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, ensure_ascii=False)
+        os.replace(temp_file, self.index_file)
+
+    def _entry_path(self, key: str) -> Optional[Path]:
+        entry = self._index.get(key)
+        if not entry:
+            return None
+        path = self.cache_dir / entry["file"]
+        if not path.exists():
+            # Entry is stale (file removed externally)
+            del self._index[key]
+            return None
+        return path
+
+    def get(self, key: str, count: bool = True) -> Optional[str]:
+        """
+        Look up a cached file
+
+        Args:
+            key: Cache key
+            count: Whether to record the lookup in hit/miss stats
+
+        Returns:
+            Path of the cached file, or None on miss. Do not modify it.
+        """
+        with self._lock:
+            path = self._entry_path(key)
+            if path is None:
+                if count:
+                    self.misses += 1
+                return None
+            self._index[key]["last_access"] = time.time()
+            if count:
+                self.hits += 1
+            self._save_index()
+            return str(path)
+
+    def metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """Index entry of a key (including extra metadata passed to put), or None"""
+        with self._lock:
+            entry = self._index.get(key)
+            return dict(entry) if entry else None
+
+    def materialize(self, key: str, dest_path: str) -> bool:
+        """
+        Place a cached file at dest_path
+
+        Any existing file at dest_path is replaced (unlinked first, so a
+        hard-linked cache entry is never truncated through it).
+
+        Args:
+            key: Cache key
+            dest_path: Destination path
+
+        Returns:
+            True on cache hit, False on miss
+        """
+        cached_path = self.get(key)
+        if cached_path is None:
+            return False
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+            if os.path.lexists(dest_path):
+                os.unlink(dest_path)
+            if self.link_mode == "hardlink":
+                try:
+                    os.link(cached_path, dest_path)
+                    return True
+                except OSError:
+                    pass  # Cross-device or unsupported, fall back to copy
+            shutil.copyfile(cached_path, dest_path)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to materialize {self.name} cache entry: {e}")
+            with self._lock:
+                self.hits -= 1
+                self.misses += 1
+            return False
+
+    def put(self, key: str, src_path: str, meta: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Store a copy of src_path under key
+
+        Args:
+            key: Cache key
+            src_path: File to store (it is copied, the original stays untouched)
+            meta: Optional extra metadata kept in the index
+
+        Returns:
+            Path of the cached file, or None if storing failed
+        """
+        if not os.path.isfile(src_path):
+            return None
+
+        suffix = Path(src_path).suffix
+        relative = Path(key[:2]) / f"{key}{suffix}"
+        target = self.cache_dir / relative
+
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temp_target = target.with_suffix(suffix + ".tmp")
+            shutil.copyfile(src_path, temp_target)
+            os.replace(temp_target, target)
+        except Exception as e:
+            logger.warning(f"Failed to store {self.name} cache entry: {e}")
+            return None
+
+        with self._lock:
+            now = time.time()
+            self._index[key] = {
+                "file": relative.as_posix(),
+                "size": target.stat().st_size,
+                "created_at": now,
+                "last_access": now,
+                **(meta or {}),
+            }
+            self._evict()
+            self._save_index()
+
+        return str(target)
+
+    def invalidate(self, key: str):
+        """Remove an entry"""
+        with self._lock:
+            entry = self._index.pop(key, None)
+            if entry:
+                (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+                self._save_index()
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            for entry in self._index.values():
+                (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+            self._index = {}
+            self._save_index()
+
+    def _evict(self):
+        """Evict least recently used entries until within budget (lock held)"""
+        total = sum(entry["size"] for entry in self._index.values())
+        if total <= self.max_size_bytes:
+            return
+
+        evicted = 0
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]["last_access"]):
+            if total <= self.max_size_bytes:
+                break
+            (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+            total -= entry["size"]
+            del self._index[key]
+            evicted += 1
+
+        if evicted:
+            logger.debug(f"🧹 Evicted {evicted} entries from {self.name} cache")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics
+
+        Returns:
+            Dict with hits, misses, hit_rate, entries, size_bytes, max_size_bytes
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "entries": len(self._index),
+                "size_bytes": sum(entry["size"] for entry in self._index.values()),
+                "max_size_bytes": self.max_size_bytes,
+            }
@@ -0,0 +1,191 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+LLM response cache
+
+Stores LLM responses in data/cache/llm/responses.db (SQLite), keyed by a
+hash of everything that determines the response: prompt, model, base URL,
+temperature, max_tokens and extra request parameters. Entries expire after
+a TTL and the store is trimmed in LRU order once it exceeds its size budget.
+
+Usage:
+    cache = LLMResponseCache(ttl_hours=168, max_size_mb=100)
+    key = cache.make_key(prompt="...", model="gpt-4o", temperature=0.7)
+
+    content = cache.get(key)
+    if content is None:
+        content = ...  # Call the LLM
+        cache.put(key, content)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from pixelle_video.utils.file_cache import FileCache
+from pixelle_video.utils.os_util import get_data_path
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed LLM response cache with TTL and LRU size eviction
+
+    Thread-safe within a process; WAL mode lets several processes share it.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key         TEXT PRIMARY KEY,
+            content     TEXT NOT NULL,
+            size        INTEGER NOT NULL,
+            created_at  REAL NOT NULL,
+            last_access REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access);
+    """
+
+    def __init__(self, ttl_hours: float = 168, max_size_mb: float = 100):
+        """
+        Initialize cache
+
+        Args:
+            ttl_hours: Entries older than this are treated as misses and removed
+            max_size_mb: Size budget in MB; least recently used entries are evicted beyond it
+        """
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.db_path = get_data_path("cache", "llm", "responses.db")
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    # Same key derivation as the file caches (SHA-256 of the sorted JSON parts)
+    make_key = staticmethod(FileCache.make_key)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response text, or None on miss or expiry
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT content, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            content, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return content
+
+    def put(self, key: str, content: str):
+        """
+        Store a response
+
+        Args:
+            key: Cache key
+            content: Response text
+        """
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, content, size, now, now),
+            )
+            self._evict(now)
+
+    def invalidate(self, key: str):
+        """
+        Remove a single entry (e.g. a cached response the caller rejected)
+
+        Args:
+            key: Cache key
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def _evict(self, now: float):
+        """Remove expired entries, then LRU entries until within budget (lock held)"""
+        if self.ttl_seconds:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        evicted = 0
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= self.max_size_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+
+        if evicted:
+            logger.debug(f"🧹 Evicted {evicted} entries from LLM response cache")
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics
+
+        Returns:
+            Dict with hits, misses, hit_rate, entries, size_bytes, max_size_bytes
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "entries": entries,
+                "size_bytes": size,
+                "max_size_bytes": self.max_size_bytes,
+            }
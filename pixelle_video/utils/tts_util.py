@@ -235,11 +235,9 @@ def get_audio_duration(audio_path: str) -> float:
         Duration in seconds
     """
     try:
-        # Try using ffmpeg-python
-        import ffmpeg
-        probe = ffmpeg.probe(audio_path)
-        duration = float(probe['format']['duration'])
-        return duration
+        # Shared, cached probe (imported lazily to avoid a services <-> utils import cycle)
+        from pixelle_video.services.media_probe import media_probe
+        return float(media_probe.probe(audio_path).duration)
     except Exception as e:
         logger.warning(f"Failed to get audio duration: {e}, using estimate")
         # Fallback: estimate based on file size (very rough)
@@ -0,0 +1,118 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for NarrationStreamParser and the streamed narration generators
+"""
+
+import json
+from typing import List, Tuple
+
+import pytest
+
+from pixelle_video.utils.content_generators import NarrationStreamParser, _stream_narrations
+
+
+def _feed_chunks(text: str, size: int) -> Tuple[NarrationStreamParser, List[str]]:
+    """Feed text in fixed-size chunks and collect every narration returned"""
+    parser = NarrationStreamParser()
+    narrations = []
+    for i in range(0, len(text), size):
+        narrations.extend(parser.feed(text[i:i + size]))
+    return parser, narrations
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_escapes_split_across_chunks(size):
+    narrations = ['He said "hi"', "back\\slash", "tab\there", "line\nbreak"]
+    text = json.dumps({"narrations": narrations})
+
+    parser, received = _feed_chunks(text, size)
+
+    assert received == narrations
+    assert parser.done and not parser.failed
+
+
+@pytest.mark.parametrize("size", [1, 4, 1000])
+def test_unicode_escapes(size):
+    # ensure_ascii writes \uXXXX sequences (including surrogate pairs for emoji)
+    narrations = ["如何提高学习效率", "café 🎬"]
+    text = json.dumps({"narrations": narrations}, ensure_ascii=True)
+    assert "\\u" in text
+
+    parser, received = _feed_chunks(text, size)
+
+    assert received == narrations
+
+
+def test_bracket_inside_string_does_not_end_array():
+    text = '{"narrations": ["See [1]", "a ] b", "last"]}'
+
+    parser, received = _feed_chunks(text, 1)
+
+    assert received == ["See [1]", "a ] b", "last"]
+    assert parser.done
+
+
+def test_narrations_are_returned_as_soon_as_closed():
+    parser = NarrationStreamParser()
+
+    assert parser.feed('{"narrations": ["First sce') == []
+    assert parser.feed('ne", "Second') == ["First scene"]
+    assert parser.feed('"]}') == ["Second"]
+    assert parser.feed(" trailing") == []
+
+
+def test_non_string_items_stop_incremental_parsing():
+    text = '{"narrations": ["one", {"text": "two"}]}'
+
+    parser, received = _feed_chunks(text, 5)
+
+    assert received == ["one"]
+    assert parser.done and parser.failed
+
+
+class _StreamingLLM:
+    """Minimal LLMService stand-in that streams a fixed response"""
+
+    def __init__(self, response: str, chunk_size: int = 4):
+        self.response = response
+        self.chunk_size = chunk_size
+
+    async def stream(self, prompt: str, **kwargs):
+        for i in range(0, len(self.response), self.chunk_size):
+            yield self.response[i:i + self.chunk_size]
+
+
+async def _collect(llm, n_scenes: int):
+    return [narration async for narration in _stream_narrations(llm, "prompt", n_scenes)]
+
+
+async def test_stream_falls_back_to_full_response():
+    # Markdown-wrapped response with a non-string item: the parser gives up after
+    # "one" and the remaining narrations come from parsing the whole response
+    response = '```json\n{"narrations": ["one", 2, "three"]}\n```'
+
+    assert await _collect(_StreamingLLM(response), n_scenes=3) == ["one", 2, "three"]
+
+
+async def test_stream_takes_first_n_scenes():
+    response = json.dumps({"narrations": ["a", "b", "c"]})
+
+    assert await _collect(_StreamingLLM(response), n_scenes=2) == ["a", "b"]
+
+
+async def test_stream_raises_on_too_few_narrations():
+    response = json.dumps({"narrations": ["a"]})
+
+    with pytest.raises(ValueError, match="Expected 2 narrations"):
+        await _collect(_StreamingLLM(response), n_scenes=2)
@@ -0,0 +1,129 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for StepGraph (dependencies derived from step inputs/outputs, concurrent execution)
+"""
+
+import asyncio
+
+import pytest
+
+from pixelle_video.pipelines.standard import StandardPipeline
+from pixelle_video.pipelines.step_graph import PipelineStep, StepGraph
+
+
+def test_standard_pipeline_dependencies():
+    graph = StepGraph(StandardPipeline.steps)
+
+    assert graph.dependencies == {
+        "setup_environment": set(),
+        "determine_title": set(),
+        "generate_content": set(),
+        "plan_visuals": {"generate_content"},
+        "initialize_storyboard": {"setup_environment", "determine_title", "generate_content", "plan_visuals"},
+        "produce_assets": {"generate_content", "plan_visuals", "initialize_storyboard"},
+        "post_production": {"setup_environment", "initialize_storyboard", "produce_assets"},
+    }
+    assert graph.levels() == [
+        ["setup_environment", "determine_title", "generate_content"],
+        ["plan_visuals"],
+        ["initialize_storyboard"],
+        ["produce_assets"],
+        ["post_production"],
+    ]
+
+
+def test_write_after_read_is_a_dependency():
+    graph = StepGraph([
+        PipelineStep("read", inputs=("a",)),
+        PipelineStep("overwrite", outputs=("a",)),
+        PipelineStep("unrelated", inputs=("b",)),
+    ])
+
+    assert graph.dependencies["overwrite"] == {"read"}
+    assert graph.levels() == [["read", "unrelated"], ["overwrite"]]
+
+
+def test_duplicate_step_names_are_rejected():
+    with pytest.raises(ValueError):
+        StepGraph([PipelineStep("a"), PipelineStep("a")])
+
+
+class _Pipeline:
+    """Steps record when they start and finish"""
+
+    def __init__(self):
+        self.events = []
+
+    async def _step(self, name: str):
+        self.events.append(f"start:{name}")
+        await asyncio.sleep(0)
+        self.events.append(f"end:{name}")
+
+    async def first(self, ctx):
+        await self._step("first")
+
+    async def second(self, ctx):
+        await self._step("second")
+
+    async def last(self, ctx):
+        await self._step("last")
+
+
+async def test_independent_steps_overlap_and_dependents_wait():
+    pipeline = _Pipeline()
+    graph = StepGraph([
+        PipelineStep("first", outputs=("x",)),
+        PipelineStep("second", outputs=("y",)),
+        PipelineStep("last", inputs=("x", "y")),
+    ])
+
+    await graph.run(pipeline, ctx=None)
+
+    # Both independent steps start before either finishes; the dependent one starts last
+    assert pipeline.events[:2] == ["start:first", "start:second"]
+    assert pipeline.events[4:] == ["start:last", "end:last"]
+
+
+async def test_failure_cancels_running_steps():
+    cancelled = asyncio.Event()
+    started = []
+
+    class Pipeline:
+        async def slow(self, ctx):
+            started.append("slow")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def failing(self, ctx):
+            started.append("failing")
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        async def after(self, ctx):
+            started.append("after")
+
+    graph = StepGraph([
+        PipelineStep("slow", outputs=("a",)),
+        PipelineStep("failing", outputs=("b",)),
+        PipelineStep("after", inputs=("b",)),
+    ])
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await asyncio.wait_for(graph.run(Pipeline(), ctx=None), timeout=5)
+
+    assert cancelled.is_set()
+    assert "after" not in started
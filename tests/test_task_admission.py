@@ -0,0 +1,76 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for TaskManager admission control (max_concurrent_tasks / max_pending_tasks)
+"""
+
+import asyncio
+
+import pytest
+
+from api.config import api_config
+from api.tasks.manager import QueueFullError, TaskManager
+from api.tasks.models import TaskStatus, TaskType
+from api.tasks.store import MemoryTaskStore
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(api_config, "task_execution", "inline")
+    monkeypatch.setattr(api_config, "max_concurrent_tasks", 1)
+    monkeypatch.setattr(api_config, "max_pending_tasks", 3)
+    return TaskManager(store=MemoryTaskStore())
+
+
+async def test_burst_admits_only_max_pending_tasks(manager):
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "done"
+
+    async def submit():
+        # Same sequence as generate_video_async: no await between check and enqueue
+        manager.check_admission()
+        task = manager.create_task(TaskType.VIDEO_GENERATION)
+        await manager.execute_task(task.task_id, work)
+        return task
+
+    results = await asyncio.gather(*(submit() for _ in range(20)), return_exceptions=True)
+
+    admitted = [r for r in results if not isinstance(r, BaseException)]
+    rejected = [r for r in results if isinstance(r, QueueFullError)]
+    assert len(admitted) == 3
+    assert len(rejected) == 17
+    assert all(e.retry_after == api_config.task_retry_after for e in rejected)
+
+    # One task runs, the others wait in FIFO order with their queue position
+    await asyncio.sleep(0)
+    statuses = [manager.get_task_status(t.task_id) for t in admitted]
+    assert [t.status for t in statuses] == [TaskStatus.RUNNING, TaskStatus.PENDING, TaskStatus.PENDING]
+    assert [t.queue_position for t in statuses] == [None, 1, 2]
+
+    release.set()
+    await asyncio.gather(*(manager._task_futures.get(t.task_id) or asyncio.sleep(0) for t in admitted))
+    assert all(manager.get_task(t.task_id).status == TaskStatus.COMPLETED for t in admitted)
+    manager.check_admission()
+
+
+async def test_cancel_before_start_releases_queue_entry(manager):
+    task = manager.create_task(TaskType.VIDEO_GENERATION)
+    future = await manager.execute_task(task.task_id, asyncio.sleep, 10)
+    assert manager.get_task_status(task.task_id).queue_position == 1
+
+    future.cancel()
+    await asyncio.gather(future, return_exceptions=True)
+    assert manager._pending_count() == 0
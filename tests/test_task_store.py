@@ -0,0 +1,127 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for SQLiteTaskStore as a worker job queue (claiming, lease release, cancellation)
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.tasks.models import Task, TaskStatus, TaskType
+from api.tasks.store import SQLiteTaskStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "tasks.db")
+
+
+@pytest.fixture
+def store(db_path):
+    store = SQLiteTaskStore(db_path)
+    yield store
+    store.close()
+
+
+def _running_task(task_id: str, attempts: int, heartbeat_at: datetime) -> Task:
+    return Task(
+        task_id=task_id,
+        task_type=TaskType.VIDEO_GENERATION,
+        status=TaskStatus.RUNNING,
+        started_at=heartbeat_at,
+        heartbeat_at=heartbeat_at,
+        attempts=attempts,
+    )
+
+
+def test_pending_task_is_claimed_once(store, db_path):
+    store.save(Task(task_id="t1", task_type=TaskType.VIDEO_GENERATION))
+
+    # Two workers, each with its own connection to the same database
+    workers = [SQLiteTaskStore(db_path) for _ in range(2)]
+    barrier = threading.Barrier(len(workers))
+    claimed = []
+
+    def claim(worker: SQLiteTaskStore, worker_id: str):
+        barrier.wait()
+        claimed.append(worker.claim_next([TaskType.VIDEO_GENERATION], worker_id))
+
+    threads = [threading.Thread(target=claim, args=(w, f"worker-{i}")) for i, w in enumerate(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for worker in workers:
+        worker.close()
+
+    winners = [task for task in claimed if task is not None]
+    assert len(winners) == 1
+
+    stored = store.get("t1")
+    assert stored.status == TaskStatus.RUNNING
+    assert stored.context["worker_id"] == winners[0].context["worker_id"]
+    assert store.claim_next([TaskType.VIDEO_GENERATION], "worker-late") is None
+
+
+def test_claim_skips_unsupported_task_types(store):
+    store.save(Task(task_id="t1", task_type=TaskType.VIDEO_GENERATION))
+
+    assert store.claim_next([], "worker") is None
+    assert store.get("t1").status == TaskStatus.PENDING
+
+
+def test_release_abandoned_requeues_or_fails_by_attempts(store):
+    now = datetime.now()
+    stale = now - timedelta(minutes=10)
+    store.save(_running_task("retry", attempts=1, heartbeat_at=stale))
+    store.save(_running_task("exhausted", attempts=3, heartbeat_at=stale))
+    store.save(_running_task("alive", attempts=1, heartbeat_at=now))
+
+    released = store.release_abandoned(now - timedelta(minutes=1), max_attempts=3)
+
+    assert {task.task_id for task in released} == {"retry", "exhausted"}
+
+    retry = store.get("retry")
+    assert retry.status == TaskStatus.PENDING
+    assert retry.started_at is None
+
+    exhausted = store.get("exhausted")
+    assert exhausted.status == TaskStatus.FAILED
+    assert exhausted.completed_at is not None
+    assert exhausted.error
+
+    assert store.get("alive").status == TaskStatus.RUNNING
+
+
+def test_cancelled_task_is_not_overwritten_by_late_save(store):
+    task = Task(task_id="t1", task_type=TaskType.VIDEO_GENERATION)
+    store.save(task)
+    claimed = store.claim_next([TaskType.VIDEO_GENERATION], "worker")
+
+    # The API cancels the task while its worker is still running it
+    cancelled = store.get("t1")
+    cancelled.status = TaskStatus.CANCELLED
+    cancelled.completed_at = datetime.now()
+    store.save(cancelled)
+
+    # The worker finishes afterwards and writes its (stale) result
+    claimed.status = TaskStatus.COMPLETED
+    claimed.result = {"video_url": "late.mp4"}
+    claimed.completed_at = datetime.now()
+    store.save(claimed)
+
+    stored = store.get("t1")
+    assert stored.status == TaskStatus.CANCELLED
+    assert stored.result is None
@@ -22,7 +22,7 @@ import streamlit as st
 from loguru import logger
 
 from web.i18n import tr, get_language
-from web.utils.async_helpers import run_async
+from web.utils.async_helpers import in_caller_thread, run_async
 from pixelle_video.models.progress import ProgressEvent
 from pixelle_video.config import config_manager
 
@@ -136,7 +136,8 @@ def render_single_output(pixelle_video, video_params):
                     "prompt_prefix": prompt_prefix,
                     "bgm_path": bgm_path,
                     "bgm_volume": bgm_volume if bgm_path else 0.2,
-                    "progress_callback": update_progress,
+                    # Progress fires on the background event loop; UI updates run on this thread
+                    "progress_callback": in_caller_thread(update_progress),
                     "media_width": st.session_state.get('template_media_width'),
                     "media_height": st.session_state.get('template_media_height'),
                 }
@@ -27,7 +27,7 @@ from loguru import logger
 from web.i18n import tr, get_language
 from web.pipelines.base import PipelineUI, register_pipeline_ui
 from web.components.content_input import render_bgm_section, render_version_info
-from web.utils.async_helpers import run_async
+from web.utils.async_helpers import in_caller_thread, run_async
 from pixelle_video.config import config_manager
 from pixelle_video.models.progress import ProgressEvent
 
@@ -390,7 +390,7 @@ class AssetBasedPipelineUI(PipelineUI):
                         bgm_mode=video_params.get("bgm_mode", "loop"),
                         voice_id=video_params.get("voice_id", "zh-CN-YunjianNeural"),
                         tts_speed=video_params.get("tts_speed", 1.2),
-                        progress_callback=update_progress
+                        progress_callback=in_caller_thread(update_progress)
                     ))
                     
                     total_time = time.time() - start_time
@@ -12,18 +12,148 @@
 
 """
 Async helper functions for web UI
+
+Coroutines from Streamlit scripts run on one long-lived event loop per server
+process (on a dedicated thread), so loop-bound resources of PixelleVideoCore
+(ComfyKit sessions, HTTP connection pools, semaphores, caches) survive
+across reruns, pages and sessions instead of being torn down by
+asyncio.run() on every call.
 """
 
 import asyncio
+import functools
+import queue
+import threading
 import tomllib
+from concurrent.futures import Future
 from pathlib import Path
+from typing import Any, Callable, Coroutine, Optional
 
 from loguru import logger
 
 
+class BackgroundEventLoop:
+    """
+    An asyncio event loop running forever on a daemon thread
+
+    Usage:
+        loop = get_background_loop()
+        future = loop.submit(coro)   # concurrent.futures.Future, from any thread
+        result = future.result()
+    """
+
+    def __init__(self, name: str = "pixelle-event-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+        self._ready.wait()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        Schedule a coroutine on the loop (thread-safe)
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            concurrent.futures.Future with the coroutine's result; cancelling it cancels the task
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller is running on the loop thread"""
+        return threading.current_thread() is self.thread
+
+
+_background_loop: Optional[BackgroundEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+# Calls queued by in_caller_thread() wrappers, drained by run_async() on the caller's thread
+_caller_state = threading.local()
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Get the process-wide background event loop (started on first use)"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or not _background_loop.thread.is_alive():
+            _background_loop = BackgroundEventLoop()
+            logger.info("🔁 Started background event loop for web UI")
+        return _background_loop
+
+
+def _get_caller_queue() -> "queue.SimpleQueue":
+    calls = getattr(_caller_state, "calls", None)
+    if calls is None:
+        calls = queue.SimpleQueue()
+        _caller_state.calls = calls
+    return calls
+
+
+def in_caller_thread(fn: Callable[..., Any]) -> Callable[..., None]:
+    """
+    Wrap a sync callback so it runs on the thread that created the wrapper
+
+    Streamlit elements can only be updated from the script thread, while
+    progress callbacks fire on the background loop. Calls made from the loop
+    are queued and executed by run_async() while it waits (fire-and-forget).
+
+    Args:
+        fn: Callback, e.g. a progress callback updating st.progress
+
+    Returns:
+        Wrapped callback
+    """
+    owner = threading.current_thread()
+    calls = _get_caller_queue()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if threading.current_thread() is owner:
+            fn(*args, **kwargs)
+        else:
+            calls.put((fn, args, kwargs))
+
+    return wrapper
+
+
 def run_async(coro):
-    """Run async coroutine in sync context"""
-    return asyncio.run(coro)
+    """
+    Run async coroutine in sync context (on the shared background event loop)
+
+    Blocks until the coroutine finishes, running callbacks queued by
+    in_caller_thread() wrappers in the meantime. If the caller is interrupted
+    (e.g. Streamlit stops or reruns the script), the coroutine is cancelled.
+    """
+    background = get_background_loop()
+    if background.in_loop_thread():
+        coro.close()
+        raise RuntimeError("run_async() cannot be called from the background event loop; await the coroutine instead")
+
+    calls = _get_caller_queue()
+    done = object()
+    future = background.submit(coro)
+    future.add_done_callback(lambda _: calls.put(done))
+
+    try:
+        while True:
+            item = calls.get()
+            if item is done:
+                break
+            if isinstance(item, tuple):  # Skip leftovers of an interrupted earlier call
+                fn, args, kwargs = item
+                fn(*args, **kwargs)
+    except BaseException:
+        future.cancel()
+        raise
+
+    return future.result()
 
 
 def get_project_version():
@@ -105,11 +105,11 @@ class SimpleBatchManager:
                     task_params["title"] = topic
                 
                 # Add per-task progress callback
+                from web.utils.async_helpers import in_caller_thread, run_async
                 if task_progress_callback_factory:
-                    task_params["progress_callback"] = task_progress_callback_factory(idx, topic)
+                    task_params["progress_callback"] = in_caller_thread(task_progress_callback_factory(idx, topic))
                 
                 # Execute generation
-                from web.utils.async_helpers import run_async
                 result = run_async(pixelle_video.generate_video(**task_params))
                 
                 # Extract task_id from video_path (e.g., output/20251118_173821_f96a/final.mp4)